@@ -0,0 +1,172 @@
+import math
+from dataclasses import dataclass, replace
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional, Tuple
+
+from pay_kernel import gross_pay, round_worked_minutes
+
+
+EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+MINUTE_MS = 60_000
+HOUR_MS = 60 * MINUTE_MS
+DAY_MS = 24 * HOUR_MS
+SEOUL_OFFSET_MS = 9 * HOUR_MS
+REGULAR_CAP_MINUTES = 480
+NIGHT_WINDOW_HOURS = (0, 4)
+DEFAULT_MULTIPLIERS = {"regular": 1.0, "overtime": 1.5, "night": 1.5, "holiday": 1.5}
+MINUTE_BUCKETS = ("regular", "overtime", "night", "holiday")
+
+
+@dataclass(frozen=True)
+class AttendanceState:
+    check_in: Optional[str] = None
+    check_out: Optional[str] = None
+    break_minutes: int = 0
+    is_holiday: bool = False
+
+
+@dataclass(frozen=True)
+class AttendanceEvent:
+    kind: str  # recorded | corrected
+    changes: Tuple[Tuple[str, Any], ...]
+
+
+@dataclass(frozen=True)
+class ReplayResult:
+    state: AttendanceState
+    payable_minutes: Dict[str, int]
+    gross_pay_krw: int
+
+
+def fixture_events(inputs: Dict[str, Any]) -> List[AttendanceEvent]:
+    # Mirrors resolveInput in scripts/tests/golden.test.ts, but as an ordered event log:
+    # the original record first, then each approved correction on top of it.
+    original = inputs.get("original") if isinstance(inputs.get("original"), dict) else {}
+    recorded = {
+        "check_in": inputs.get("check_in", original.get("check_in")),
+        "check_out": inputs.get("check_out", original.get("check_out")),
+        "break_minutes": inputs.get("break_minutes", original.get("break_minutes", 0)),
+        "is_holiday": bool(inputs.get("is_holiday", False)),
+    }
+    events = [AttendanceEvent("recorded", tuple(sorted(recorded.items())))]
+
+    correction = inputs.get("approved_correction")
+    if isinstance(correction, dict) and isinstance(correction.get("corrected_check_in"), str):
+        events.append(AttendanceEvent("corrected", (("check_in", correction["corrected_check_in"]),)))
+    retroactive = inputs.get("retroactive_update")
+    if isinstance(retroactive, dict) and retroactive.get("approved") is not False:
+        changes = tuple(
+            (key, retroactive[key]) for key in ("check_in", "check_out", "break_minutes") if key in retroactive
+        )
+        if changes:
+            events.append(AttendanceEvent("corrected", changes))
+    return events
+
+
+def apply_event(state: AttendanceState, event: AttendanceEvent) -> AttendanceState:
+    if event.kind == "recorded":
+        return replace(AttendanceState(), **dict(event.changes))
+    return replace(state, **dict(event.changes))
+
+
+def parse_timestamp(value: Optional[str], field: str) -> datetime:
+    if not isinstance(value, str):
+        raise ValueError(f"{field} must be an ISO-8601 timestamp")
+    try:
+        parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError as exc:
+        raise ValueError(f"{field} must be an ISO-8601 timestamp ({exc})") from exc
+    if parsed.tzinfo is None:
+        raise ValueError(f"{field} must include a UTC offset")
+    return parsed
+
+
+def epoch_ms(value: datetime) -> int:
+    return (value - EPOCH) // timedelta(milliseconds=1)
+
+
+def night_minutes_ms(start_ms: int, end_ms: int) -> int:
+    # Counts the minutes starting at start_ms whose Seoul hour falls in the night
+    # window, like overlapMinutesInWindow, but per window instead of per minute. The
+    # span is rounded like worked_minutes_ms so night never counts a different minute set.
+    total = round_worked_minutes(end_ms - start_ms) if end_ms > start_ms else 0
+    if total <= 0:
+        return 0
+
+    local_start = start_ms + SEOUL_OFFSET_MS
+    day = local_start - local_start % DAY_MS - SEOUL_OFFSET_MS
+    last = start_ms + total * MINUTE_MS
+    window_start_ms = NIGHT_WINDOW_HOURS[0] * HOUR_MS
+    window_end_ms = NIGHT_WINDOW_HOURS[1] * HOUR_MS
+    count = 0
+    while day < last:
+        # Minute k starts at start_ms + k minutes; count k in [first, stop) within [0, total).
+        first = max(0, -((start_ms - day - window_start_ms) // MINUTE_MS))
+        stop = min(total, -((start_ms - day - window_end_ms) // MINUTE_MS))
+        count += max(0, stop - first)
+        day += DAY_MS
+    return count
+
+
+def worked_minutes_ms(start_ms: int, end_ms: int, break_minutes: int) -> int:
+    if end_ms <= start_ms:
+        return 0
+    # SSoT rounds the duration to the nearest minute (30s up) before subtracting the break.
+    return max(0, round_worked_minutes(end_ms - start_ms) - max(0, math.floor(break_minutes)))
+
+
+def payable_minutes_ms(start_ms: int, end_ms: int, break_minutes: int, is_holiday: bool) -> Dict[str, int]:
+    total = worked_minutes_ms(start_ms, end_ms, break_minutes)
+    if total <= 0:
+        return {bucket: 0 for bucket in MINUTE_BUCKETS}
+
+    overtime = max(0, total - REGULAR_CAP_MINUTES)
+    base = min(total, REGULAR_CAP_MINUTES)
+    if is_holiday:
+        return {"regular": 0, "overtime": overtime, "night": 0, "holiday": base}
+
+    night = min(night_minutes_ms(start_ms, end_ms), base)
+    return {"regular": max(0, base - night), "overtime": overtime, "night": night, "holiday": 0}
+
+
+def payable_minutes(state: AttendanceState) -> Dict[str, int]:
+    start_ms = epoch_ms(parse_timestamp(state.check_in, "check_in"))
+    end_ms = epoch_ms(parse_timestamp(state.check_out, "check_out"))
+    return payable_minutes_ms(start_ms, end_ms, state.break_minutes, state.is_holiday)
+
+
+class ReplayEngine:
+    def __init__(self) -> None:
+        # (prefix id, event) -> (prefix id, state): every intermediate state of every chain
+        # replayed so far, so a chain sharing a prefix with an earlier one resumes from it.
+        self.transitions: Dict[Tuple[int, AttendanceEvent], Tuple[int, AttendanceState]] = {}
+        self.minutes: Dict[AttendanceState, Dict[str, int]] = {}
+        self.applied = 0
+
+    def replay(self, events: List[AttendanceEvent]) -> AttendanceState:
+        prefix = 0
+        state = AttendanceState()
+        for event in events:
+            hit = self.transitions.get((prefix, event))
+            if hit is None:
+                state = apply_event(state, event)
+                self.applied += 1
+                hit = self.transitions[(prefix, event)] = (len(self.transitions) + 1, state)
+            prefix, state = hit
+        return state
+
+    def payable_minutes(self, state: AttendanceState) -> Dict[str, int]:
+        minutes = self.minutes.get(state)
+        if minutes is None:
+            minutes = self.minutes[state] = payable_minutes(state)
+        return minutes
+
+    def evaluate(self, inputs: Dict[str, Any]) -> ReplayResult:
+        state = self.replay(fixture_events(inputs))
+        minutes = self.payable_minutes(state)
+        rate = inputs.get("hourly_rate_krw")
+        if not isinstance(rate, int) or isinstance(rate, bool) or rate < 0:
+            raise ValueError("hourly_rate_krw must be a non-negative integer")
+        raw_multipliers = inputs.get("multipliers") if isinstance(inputs.get("multipliers"), dict) else {}
+        multipliers = {**DEFAULT_MULTIPLIERS, **raw_multipliers}
+        return ReplayResult(state, dict(minutes), gross_pay(minutes, rate, multipliers))
@@ -0,0 +1,235 @@
+import pathlib
+import re
+from array import array
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+
+DOMAIN_EVENTS_PATH = pathlib.Path("src/features/shared/domain-event-publisher.ts")
+CONTRACT_GLOB = "specs/*/contract.yaml"
+START = "^"
+DEAD = -1
+
+DOMAIN_EVENTS_RE = re.compile(r"domainEventNames\s*=\s*\[(.*?)\]", re.DOTALL)
+QUOTED_RE = re.compile(r"[\"']([^\"']+)[\"']")
+EVENT_VERSION_RE = re.compile(r"\.v\d+$")
+EVENT_TOKEN_RE = re.compile(r"^[A-Za-z0-9_.]+")
+
+# Allowed successors per audit event; START lists the events a sequence may begin with.
+# Names use the contract spelling and are compared after canonical_event().
+AUDIT_LIFECYCLE: Dict[str, Tuple[str, ...]] = {
+    START: (
+        "organization.created",
+        "employee.created",
+        "employee.profile.updated",
+        "scheduling.schedule.assigned",
+        "attendance.recorded",
+        "payroll.deduction_profile.updated",
+        "leave.requested",
+        "rbac.role.upserted",
+    ),
+    "organization.created": ("employee.created", "rbac.role.upserted"),
+    "rbac.role.upserted": ("rbac.role.upserted", "employee.created"),
+    "employee.created": (
+        "employee.created",
+        "employee.profile.updated",
+        "scheduling.schedule.assigned",
+        "attendance.recorded",
+        "payroll.deduction_profile.updated",
+        "leave.requested",
+    ),
+    "employee.profile.updated": (
+        "employee.profile.updated",
+        "scheduling.schedule.assigned",
+        "attendance.recorded",
+        "payroll.deduction_profile.updated",
+        "leave.requested",
+    ),
+    "scheduling.schedule.assigned": ("scheduling.schedule.assigned", "attendance.recorded"),
+    "attendance.recorded": (
+        "attendance.recorded",
+        "attendance.corrected",
+        "attendance.approved",
+        "attendance.rejected",
+        "payroll.calculated",
+    ),
+    "attendance.corrected": ("attendance.corrected", "attendance.approved", "attendance.rejected"),
+    "attendance.rejected": ("attendance.recorded", "attendance.corrected"),
+    "attendance.approved": (
+        "attendance.recorded",
+        "attendance.corrected",
+        "payroll.calculated",
+        "payroll.deductions_calculated",
+        "payroll.preview_with_deductions.failed",
+    ),
+    "payroll.deduction_profile.updated": (
+        "payroll.deduction_profile.updated",
+        "attendance.recorded",
+        "payroll.calculated",
+        "payroll.deductions_calculated",
+    ),
+    # A payroll preview may be followed by a retroactive correction and a recalculation.
+    "payroll.calculated": (
+        "attendance.recorded",
+        "attendance.corrected",
+        "payroll.calculated",
+        "payroll.deductions_calculated",
+        "payroll.preview_with_deductions.failed",
+        "payroll.confirmed",
+    ),
+    "payroll.deductions_calculated": (
+        "attendance.corrected",
+        "payroll.deductions_calculated",
+        "payroll.confirmed",
+    ),
+    "payroll.preview_with_deductions.failed": ("payroll.deduction_profile.updated", "payroll.calculated"),
+    "payroll.confirmed": ("attendance.recorded", "leave.accrual_settled"),
+    "leave.requested": ("leave.approved", "leave.rejected", "leave.canceled"),
+    "leave.approved": ("leave.requested", "leave.canceled", "leave.accrual_settled", "attendance.recorded"),
+    "leave.rejected": ("leave.requested",),
+    "leave.canceled": ("leave.requested",),
+    "leave.accrual_settled": ("leave.requested",),
+}
+
+
+def canonical_event(name: str) -> str:
+    # `payroll.deductions.calculated.v1` (domain event) and `payroll.deductions_calculated`
+    # (contract audit event) name the same thing.
+    return EVENT_VERSION_RE.sub("", name.strip()).replace("_", ".")
+
+
+def read_domain_event_names(path: pathlib.Path) -> List[str]:
+    try:
+        text = path.read_text(encoding="utf-8")
+    except OSError as exc:
+        raise ValueError(f"{path}: unable to read domain events ({exc})") from exc
+    match = DOMAIN_EVENTS_RE.search(text)
+    if match is None:
+        raise ValueError(f"{path}: domainEventNames array not found")
+    return QUOTED_RE.findall(match.group(1))
+
+
+def read_contract_audit_events(path: pathlib.Path) -> List[str]:
+    # Line scan of `observability.audit_events` so the golden job needs no YAML parser.
+    events: List[str] = []
+    section: Optional[str] = None
+    in_list = False
+    for raw in path.read_text(encoding="utf-8").splitlines():
+        stripped = raw.strip()
+        if not stripped or stripped.startswith("#"):
+            continue
+        indent = len(raw) - len(raw.lstrip(" "))
+        if indent == 0:
+            section = stripped.rstrip(":")
+            in_list = False
+            continue
+        if section != "observability":
+            continue
+        if indent == 2:
+            in_list = stripped == "audit_events:"
+            continue
+        if in_list and stripped.startswith("- "):
+            token = EVENT_TOKEN_RE.match(stripped[2:].strip())
+            if token:
+                events.append(token.group(0))
+    return events
+
+
+@dataclass
+class AuditAutomaton:
+    symbols: Dict[str, int]
+    names: List[str]
+    state_count: int
+    # Row-major transition table: table[state * width + symbol] -> next state or DEAD.
+    # The last column is reserved for events outside the alphabet and is always DEAD.
+    table: array
+
+    @property
+    def width(self) -> int:
+        return len(self.names) + 1
+
+    def encode(self, name: str) -> int:
+        return self.symbols.get(canonical_event(name), len(self.names))
+
+
+def compile_automaton(
+    alphabet: Iterable[str], lifecycle: Optional[Dict[str, Tuple[str, ...]]] = None
+) -> AuditAutomaton:
+    lifecycle = lifecycle if lifecycle is not None else AUDIT_LIFECYCLE
+    names = sorted({canonical_event(name) for name in alphabet})
+    symbols = {name: code for code, name in enumerate(names)}
+
+    rows: Dict[str, frozenset] = {}
+    for event, successors in lifecycle.items():
+        key = event if event == START else canonical_event(event)
+        if key != START and key not in symbols:
+            raise ValueError(f"audit lifecycle event '{event}' is not a domain or contract audit event")
+        for successor in successors:
+            if canonical_event(successor) not in symbols:
+                raise ValueError(f"audit lifecycle successor '{successor}' of '{event}' is not an audit event")
+        rows[key] = frozenset(symbols[canonical_event(successor)] for successor in successors)
+
+    # The state after an event is determined by the events allowed next, so events with
+    # the same successor set share one state. State 0 is the start state.
+    state_of_row: Dict[frozenset, int] = {rows.get(START, frozenset()): 0}
+    for name in names:
+        row = rows.get(name, frozenset())
+        state_of_row.setdefault(row, len(state_of_row))
+    target = [state_of_row[rows.get(name, frozenset())] for name in names]
+
+    width = len(names) + 1
+    table = array("i", [DEAD]) * (len(state_of_row) * width)
+    for row, state in state_of_row.items():
+        base = state * width
+        for code in row:
+            table[base + code] = target[code]
+    return AuditAutomaton(symbols=symbols, names=names, state_count=len(state_of_row), table=table)
+
+
+def load_audit_automaton(
+    domain_events_path: pathlib.Path = DOMAIN_EVENTS_PATH, contract_paths: Optional[List[pathlib.Path]] = None
+) -> AuditAutomaton:
+    if contract_paths is None:
+        contract_paths = sorted(pathlib.Path(".").glob(CONTRACT_GLOB))
+    alphabet = read_domain_event_names(domain_events_path)
+    for path in contract_paths:
+        alphabet.extend(read_contract_audit_events(path))
+    return compile_automaton(alphabet)
+
+
+def first_illegal_transitions(automaton: AuditAutomaton, sequences: Sequence[Sequence[str]]) -> List[int]:
+    # One pass over every sequence; returns the index of the first event the automaton
+    # rejects, or -1. Generated fixtures repeat a handful of sequences, so results and
+    # symbol codes are memoized across the batch.
+    table = automaton.table
+    width = automaton.width
+    codes: Dict[str, int] = {}
+    memo: Dict[Tuple[str, ...], int] = {}
+    results: List[int] = []
+
+    for sequence in sequences:
+        key = tuple(sequence)
+        result = memo.get(key)
+        if result is None:
+            result = DEAD
+            state = 0
+            for idx, name in enumerate(key):
+                code = codes.get(name)
+                if code is None:
+                    code = codes[name] = automaton.encode(name)
+                state = table[state * width + code]
+                if state == DEAD:
+                    result = idx
+                    break
+            memo[key] = result
+        results.append(result)
+    return results
+
+
+def describe_illegal_transition(automaton: AuditAutomaton, sequence: Sequence[str], index: int) -> str:
+    event = sequence[index]
+    if automaton.encode(event) == len(automaton.names):
+        return f"'{event}' is not a domain or contract audit event"
+    if index == 0:
+        return f"'{event}' cannot start an audit event sequence"
+    return f"'{event}' cannot follow '{sequence[index - 1]}'"
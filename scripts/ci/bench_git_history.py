@@ -0,0 +1,385 @@
+#!/usr/bin/env python3
+import argparse
+import json
+import os
+import pathlib
+import random
+import subprocess
+import sys
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+from git_fixture_repos import ISOLATED_GIT_ENV, Commit, commit_block, inside
+
+
+FIXTURE_ROOT = "qa/golden/fixtures"
+# Scope lists stop growing here; further minor changes become patch edits, so
+# contract blobs stay small however deep the history is.
+MAX_SCOPE_ITEMS = 12
+# Ground-truth codes, matched against checker messages by substring.
+ERROR_CODES = {
+    "without version bump": "no-bump",
+    "changes require a": "under-bump",
+    "breaking_changes=false": "undeclared-breaking",
+    "breaking_changes=true requires MAJOR bump": "breaking-without-major",
+    "without sibling contract.yaml change": "api-only",
+    "without any linked work item": "unlinked-work-item",
+    "without any contract.yaml update": "unlinked-contract",
+    "requires ADR update": "missing-adr",
+}
+
+VIOLATION_KINDS = (
+    "no-bump",
+    "under-bump",
+    "undeclared-breaking",
+    "api-only",
+    "fixture-edit-unlinked",
+    "fixture-rename-no-adr",
+)
+
+# (code, path): path is the contract/api file for versioning findings, "" for change control.
+Expected = List[Tuple[str, str]]
+
+
+@dataclass
+class HistoryRates:
+    contract: float = 0.35  # commits that edit a domain contract
+    breaking: float = 0.1  # of those, breaking (scope removal with a major bump)
+    fixture: float = 0.25  # commits that edit or rename golden fixtures
+    rename: float = 0.2  # of those, renames
+    violation: float = 0.05  # contract/fixture commits that break the policy
+
+
+@dataclass
+class DomainState:
+    name: str
+    version: List[int] = field(default_factory=lambda: [1, 0, 0])
+    breaking: bool = False
+    scope: List[str] = field(default_factory=lambda: ["item-0"])
+    revision: int = 0
+    extra_api_path: bool = False
+
+    @property
+    def contract_path(self) -> str:
+        return f"specs/{self.name}/contract.yaml"
+
+    @property
+    def api_path(self) -> str:
+        return f"specs/{self.name}/api.yaml"
+
+    def contract_text(self) -> str:
+        scope = "".join(f"    - {item}\n" for item in self.scope) or "    []\n"
+        return (
+            f"owner: {self.name}-agent\n"
+            f"version: {'.'.join(map(str, self.version))}\n"
+            f"breaking_changes: {'true' if self.breaking else 'false'}\n"
+            f"summary: revision {self.revision}\n"
+            f"scope:\n  in:\n{scope}  out:\n    - none\n"
+        )
+
+    def api_text(self) -> str:
+        paths = [f"/{self.name}/records"] + ([f"/{self.name}/exports"] if self.extra_api_path else [])
+        body = "".join(
+            f"  {path}:\n    get:\n      responses:\n        '200':\n          description: ok\n" for path in paths
+        )
+        return f"openapi: 3.1.0\ninfo:\n  title: {self.name}\n  version: 1.0.0\npaths:\n{body}"
+
+
+@dataclass
+class SyntheticCommit:
+    kind: str
+    commit: Commit
+    versioning: Expected = field(default_factory=list)
+    change_control: Expected = field(default_factory=list)
+
+
+class HistoryGenerator:
+    def __init__(self, rates: HistoryRates, domains: int, fixtures: int, work_items: int, seed: int) -> None:
+        self.rates = rates
+        self.rng = random.Random(seed)
+        self.domains = [DomainState(f"domain-{idx:02d}") for idx in range(domains)]
+        # fixture number -> current filename suffix (bumped by each rename)
+        self.fixtures = {number: 0 for number in range(1, fixtures + 1)}
+        self.fixture_revisions = {number: 0 for number in self.fixtures}
+        self.work_items = work_items
+        self.adrs = 0
+        self.counter = 0
+
+    def fixture_path(self, number: int) -> str:
+        suffix = self.fixtures[number]
+        return f"{FIXTURE_ROOT}/GC-{number:04d}-synthetic{f'-r{suffix}' if suffix else ''}.json"
+
+    def fixture_text(self, number: int) -> str:
+        return json.dumps({"id": f"GC-{number:04d}", "description": f"revision {self.fixture_revisions[number]}"})
+
+    def work_item(self) -> Tuple[str, str]:
+        number = self.rng.randrange(1, self.work_items + 1)
+        self.counter += 1
+        return f"work-items/WI-{number:04d}-synthetic.md", f"# WI-{number:04d}\nrevision {self.counter}\n"
+
+    def initial(self) -> SyntheticCommit:
+        files: Dict[str, Optional[str]] = {}
+        for domain in self.domains:
+            files[domain.contract_path] = domain.contract_text()
+            files[domain.api_path] = domain.api_text()
+        for number in self.fixtures:
+            files[self.fixture_path(number)] = self.fixture_text(number)
+        for number in range(1, self.work_items + 1):
+            files[f"work-items/WI-{number:04d}-synthetic.md"] = f"# WI-{number:04d}\n"
+        return SyntheticCommit("initial", Commit("initial", "synthetic baseline", files))
+
+    def contract_change(self, domain: DomainState, kind: str) -> Expected:
+        # Applies one versioning scenario to the domain; returns what check_versioning reports.
+        domain.revision += 1
+        major, minor, patch = domain.version
+        if kind in ("minor", "no-bump", "under-bump") and len(domain.scope) >= MAX_SCOPE_ITEMS:
+            kind = {"minor": "patch", "under-bump": "patch"}.get(kind, kind)
+        if kind in ("breaking", "undeclared-breaking") and len(domain.scope) < 2:
+            kind = "minor" if kind == "breaking" else "no-bump"
+
+        domain.breaking = kind == "breaking"
+        if kind == "patch":
+            domain.version = [major, minor, patch + 1]
+        elif kind == "minor":
+            domain.scope.append(f"item-{domain.revision}")
+            domain.version = [major, minor + 1, 0]
+        elif kind in ("breaking", "undeclared-breaking"):
+            domain.scope.pop(0)
+            domain.version = [major + 1, 0, 0]
+        elif kind == "under-bump":
+            domain.scope.append(f"item-{domain.revision}")
+            domain.version = [major, minor, patch + 1]
+        elif kind == "no-bump" and len(domain.scope) < MAX_SCOPE_ITEMS:
+            domain.scope.append(f"item-{domain.revision}")
+
+        code = {"no-bump": "no-bump", "under-bump": "under-bump", "undeclared-breaking": "undeclared-breaking"}
+        return [(code[kind], domain.contract_path)] if kind in code else []
+
+    def next_commit(self, mark: int) -> SyntheticCommit:
+        rates = self.rates
+        roll = self.rng.random()
+        violation = self.rng.random() < rates.violation
+        files: Dict[str, Optional[str]] = {}
+
+        if roll < rates.contract:
+            domain = self.rng.choice(self.domains)
+            breaking = self.rng.random() < rates.breaking
+            if violation:
+                kind = self.rng.choice(("undeclared-breaking",) if breaking else ("no-bump", "under-bump", "api-only"))
+            else:
+                kind = "breaking" if breaking else self.rng.choice(("patch", "minor"))
+
+            if kind == "api-only":
+                domain.extra_api_path = not domain.extra_api_path
+                files[domain.api_path] = domain.api_text()
+                return SyntheticCommit(
+                    kind, Commit(f"c{mark}", f"{domain.name}: api drift", files), [("api-only", domain.api_path)]
+                )
+            expected = self.contract_change(domain, kind)
+            files[domain.contract_path] = domain.contract_text()
+            return SyntheticCommit(kind, Commit(f"c{mark}", f"{domain.name}: {kind}", files), expected)
+
+        if roll < rates.contract + rates.fixture:
+            number = self.rng.choice(list(self.fixtures))
+            renames: List[Tuple[str, str]] = []
+            rename = self.rng.random() < rates.rename
+            if rename:
+                old_path = self.fixture_path(number)
+                self.fixtures[number] += 1
+                renames.append((old_path, self.fixture_path(number)))
+                kind = "fixture-rename"
+            else:
+                self.fixture_revisions[number] += 1
+                files[self.fixture_path(number)] = self.fixture_text(number)
+                kind = "fixture-edit"
+
+            change_control: Expected = []
+            if violation and not rename:
+                kind += "-unlinked"
+                change_control = [("unlinked-work-item", ""), ("unlinked-contract", "")]
+            else:
+                path, text = self.work_item()
+                files[path] = text
+                domain = self.rng.choice(self.domains)
+                self.contract_change(domain, "minor")
+                files[domain.contract_path] = domain.contract_text()
+                if rename and violation:
+                    kind += "-no-adr"
+                    change_control = [("missing-adr", "")]
+                elif rename:
+                    self.adrs += 1
+                    files[f"adr/ADR-{self.adrs:05d}-synthetic.md"] = f"# ADR-{self.adrs:05d}\n"
+            return SyntheticCommit(
+                kind, Commit(f"c{mark}", f"golden: {kind}", files, renames), change_control=change_control
+            )
+
+        path, text = self.work_item()
+        files[path] = text
+        return SyntheticCommit("work-item", Commit(f"c{mark}", "work item update", files))
+
+
+def generate_history(
+    repo: pathlib.Path, truth_path: pathlib.Path, commits: int, generator: HistoryGenerator
+) -> Dict[str, int]:
+    env = {**os.environ, **ISOLATED_GIT_ENV}
+    subprocess.run(["git", "init", "-q", "--bare", str(repo)], check=True, capture_output=True, env=env)
+    marks_path = repo / "synthetic.marks"
+
+    # Ground truth is keyed by mark until fast-import reports the commit OIDs.
+    pending: List[Tuple[int, str, Expected, Expected]] = []
+    kinds: Dict[str, int] = {}
+    with subprocess.Popen(
+        ["git", "fast-import", "--quiet", f"--export-marks={marks_path}"],
+        stdin=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        cwd=repo,
+        env=env,
+    ) as proc:
+        assert proc.stdin is not None and proc.stderr is not None
+        try:
+            for mark in range(1, commits + 1):
+                item = generator.initial() if mark == 1 else generator.next_commit(mark)
+                proc.stdin.write(commit_block(item.commit, mark, mark - 1))
+                kinds[item.kind] = kinds.get(item.kind, 0) + 1
+                if mark > 1:
+                    pending.append((mark, item.kind, item.versioning, item.change_control))
+            proc.stdin.close()
+        except BrokenPipeError:
+            # fast-import exited early; its stderr says why.
+            try:
+                proc.stdin.close()
+            except BrokenPipeError:
+                pass
+        err = proc.stderr.read()
+    if proc.returncode != 0:
+        raise RuntimeError(f"git fast-import failed: {err.decode('utf-8', 'replace').strip()}")
+
+    oids: Dict[int, str] = {}
+    for line in marks_path.read_text(encoding="utf-8").splitlines():
+        mark, _sep, oid = line.partition(" ")
+        oids[int(mark[1:])] = oid
+    with truth_path.open("w", encoding="utf-8") as out:
+        for mark, kind, versioning, change_control in pending:
+            record = {
+                "commit": oids[mark],
+                "parent": oids[mark - 1],
+                "kind": kind,
+                "versioning": sorted(map(list, versioning)),
+                "change_control": sorted(map(list, change_control)),
+            }
+            out.write(json.dumps(record) + "\n")
+    return kinds
+
+
+def error_codes(errors: List[str], with_path: bool) -> List[List[str]]:
+    codes = []
+    for error in errors:
+        code = next((code for needle, code in ERROR_CODES.items() if needle in error), f"unknown: {error}")
+        path = error.split(": ", 1)[0] if with_path else ""
+        codes.append([code, path])
+    return sorted(codes)
+
+
+def check_sample(repo: pathlib.Path, truth_path: pathlib.Path, sample: int, seed: int) -> int:
+    with truth_path.open(encoding="utf-8") as stream:
+        records: List[Dict[str, Any]] = [json.loads(line) for line in stream]
+    rng = random.Random(seed)
+    chosen = records if sample >= len(records) else rng.sample(records, sample)
+
+    # Generation alone needs neither checker (nor PyYAML/jsonschema).
+    import check_contracts
+    import check_golden_fixtures
+    from git_objects import GitObjectStore
+
+    mismatches = 0
+    timings = {"versioning": 0.0, "change_control": 0.0}
+    with inside(repo), GitObjectStore() as store:
+        for record in chosen:
+            base, head = record["parent"], record["commit"]
+            started = time.perf_counter()
+            versioning = check_contracts.run_diff_checks(base, head, store)[0]
+            checked = time.perf_counter()
+            change_control = check_golden_fixtures.enforce_change_control(base, head, store)
+            timings["versioning"] += checked - started
+            timings["change_control"] += time.perf_counter() - checked
+
+            actual = (error_codes(versioning, True), error_codes(change_control, False))
+            if actual != (record["versioning"], record["change_control"]):
+                mismatches += 1
+                if mismatches <= 5:
+                    print(
+                        f"mismatch at {head[:7]} ({record['kind']}): expected "
+                        f"{record['versioning']} {record['change_control']}, got {actual[0]} {actual[1]}"
+                    )
+
+    count = max(1, len(chosen))
+    print(
+        f"Checked {len(chosen)} commits against ground truth: {mismatches} mismatches; "
+        f"check_versioning {timings['versioning'] / count * 1000:.2f} ms/commit, "
+        f"enforce_change_control {timings['change_control'] / count * 1000:.2f} ms/commit"
+    )
+    return 1 if mismatches else 0
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Generate a synthetic contract/fixture history via git fast-import, with ground truth."
+    )
+    parser.add_argument("--output", required=True, help="Bare repository to create (must not exist).")
+    parser.add_argument("--truth", help="Ground-truth JSON Lines path (default: <output>/synthetic-truth.jsonl).")
+    parser.add_argument("--commits", type=int, default=100_000)
+    parser.add_argument("--domains", type=int, default=8)
+    parser.add_argument("--fixtures", type=int, default=40)
+    parser.add_argument("--work-items", type=int, default=40)
+    parser.add_argument("--contract-rate", type=float, default=HistoryRates.contract)
+    parser.add_argument("--breaking-rate", type=float, default=HistoryRates.breaking)
+    parser.add_argument("--fixture-rate", type=float, default=HistoryRates.fixture)
+    parser.add_argument("--rename-rate", type=float, default=HistoryRates.rename)
+    parser.add_argument("--violation-rate", type=float, default=HistoryRates.violation)
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument(
+        "--check",
+        type=int,
+        default=0,
+        help="Run check_versioning/enforce_change_control on this many sampled commits and compare with ground truth.",
+    )
+    return parser.parse_args()
+
+
+def main() -> int:
+    args = parse_args()
+    repo = pathlib.Path(args.output).resolve()
+    truth_path = pathlib.Path(args.truth).resolve() if args.truth else repo / "synthetic-truth.jsonl"
+    if repo.exists():
+        print(f"{repo} already exists")
+        return 1
+    if args.contract_rate + args.fixture_rate > 1:
+        print("--contract-rate + --fixture-rate must not exceed 1")
+        return 1
+
+    rates = HistoryRates(
+        contract=args.contract_rate,
+        breaking=args.breaking_rate,
+        fixture=args.fixture_rate,
+        rename=args.rename_rate,
+        violation=args.violation_rate,
+    )
+    generator = HistoryGenerator(rates, args.domains, args.fixtures, args.work_items, args.seed)
+    started = time.perf_counter()
+    kinds = generate_history(repo, truth_path, args.commits, generator)
+    elapsed = time.perf_counter() - started
+    violations = sum(count for kind, count in kinds.items() if kind in VIOLATION_KINDS)
+    print(
+        f"{args.commits} commits in {elapsed:.2f}s ({args.commits / elapsed:,.0f} commits/s) -> {repo}; "
+        f"{violations} policy violations recorded in {truth_path}"
+    )
+    print("  " + ", ".join(f"{kind}={count}" for kind, count in sorted(kinds.items())))
+
+    if args.check:
+        return check_sample(repo, truth_path, args.check, args.seed)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+import argparse
+import random
+import sys
+import time
+
+from pay_kernel import PayWeights, gross_pay_batch, gross_pay_reference, np
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmark the integer gross-pay kernel.")
+    parser.add_argument("--rows", type=int, default=10_000_000)
+    parser.add_argument("--verify", type=int, default=10_000, help="Rows cross-checked against the Decimal path.")
+    parser.add_argument("--seed", type=int, default=7)
+    return parser.parse_args()
+
+
+def main() -> int:
+    args = parse_args()
+    rng = random.Random(args.seed)
+    multipliers = {"regular": 1.0, "overtime": 1.5, "night": 1.5, "holiday": 1.5}
+    weights = PayWeights.from_multipliers(multipliers)
+
+    holiday = [rng.randint(1, 480) if rng.random() < 0.1 else 0 for _ in range(args.rows)]
+    regular = [0 if h else rng.randint(0, 480) for h in holiday]
+    night = [0 if h else rng.choice((0, 0, 0, rng.randint(0, 480))) for h in holiday]
+    overtime = [rng.choice((0, 0, rng.randint(0, 240))) for _ in range(args.rows)]
+    rates = [rng.randint(9_860, 60_000) for _ in range(args.rows)]
+    if np is not None:
+        regular, overtime, night, holiday, rates = (
+            np.asarray(column, dtype=np.int64) for column in (regular, overtime, night, holiday, rates)
+        )
+
+    started = time.perf_counter()
+    gross = gross_pay_batch(regular, overtime, night, holiday, rates, weights)
+    elapsed = time.perf_counter() - started
+
+    mismatches = 0
+    for idx in range(min(args.verify, args.rows)):
+        minutes = {
+            "regular": int(regular[idx]),
+            "overtime": int(overtime[idx]),
+            "night": int(night[idx]),
+            "holiday": int(holiday[idx]),
+        }
+        if gross[idx] != gross_pay_reference(minutes, int(rates[idx]), multipliers):
+            mismatches += 1
+
+    backend = "numpy int64" if np is not None else "python int"
+    print(
+        f"{args.rows} rows ({backend}): {elapsed:.2f}s, {args.rows / max(elapsed, 1e-9) / 1e6:.1f}M rows/s; "
+        f"{mismatches} mismatches in {min(args.verify, args.rows)} Decimal cross-checks"
+    )
+    return 1 if mismatches else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+import argparse
+import random
+import sys
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List
+
+from schedule_sweep import DEFAULT_MIN_REST_MINUTES, parse_assignments, sweep_schedules
+
+
+SEOUL = timezone(timedelta(hours=9))
+
+
+def generate_month(employees: int, days: int, seed: int) -> List[Dict[str, Any]]:
+    # One shift per employee per day; about a fifth are night shifts and a few are
+    # pulled early enough to overlap the previous day or cut its rest gap.
+    rng = random.Random(seed)
+    month_start = datetime(2026, 3, 1, tzinfo=SEOUL)
+    assignments: List[Dict[str, Any]] = []
+    for employee in range(employees):
+        employee_id = f"E-{employee:06d}"
+        for day in range(days):
+            start_hour = 22 if rng.random() < 0.2 else rng.choice((7, 8, 9, 10))
+            if rng.random() < 0.02:
+                start_hour -= 14
+            start = month_start + timedelta(days=day, hours=start_hour, minutes=rng.choice((0, 30)))
+            end = start + timedelta(hours=rng.choice((8, 9, 10)))
+            assignments.append(
+                {
+                    "schedule_id": f"S-{employee:06d}-{day:02d}",
+                    "employee_id": employee_id,
+                    "start_at": start.isoformat(),
+                    "end_at": end.isoformat(),
+                }
+            )
+    rng.shuffle(assignments)
+    return assignments
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmark the schedule overlap/rest/night sweep.")
+    parser.add_argument("--employees", type=int, default=20000)
+    parser.add_argument("--days", type=int, default=31)
+    parser.add_argument("--seed", type=int, default=7)
+    return parser.parse_args()
+
+
+def main() -> int:
+    args = parse_args()
+    raw = generate_month(args.employees, args.days, args.seed)
+
+    started = time.perf_counter()
+    assignments = parse_assignments(raw)
+    parsed = time.perf_counter()
+    summaries = sweep_schedules(assignments, DEFAULT_MIN_REST_MINUTES)
+    finished = time.perf_counter()
+
+    overlaps = sum(len(summary.overlaps) for summary in summaries.values())
+    rest = sum(len(summary.rest_violations) for summary in summaries.values())
+    print(
+        f"{len(assignments)} assignments for {len(summaries)} employees: "
+        f"parse {parsed - started:.2f}s, sweep {finished - parsed:.2f}s "
+        f"({overlaps} overlaps, {rest} rest violations)"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
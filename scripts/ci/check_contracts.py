@@ -1,11 +1,13 @@
 #!/usr/bin/env python3
 import argparse
 import json
+import os
 import pathlib
 import re
 import subprocess
 import sys
-from typing import Any, Dict, List, Optional, Tuple
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple
 
 try:
     import yaml  # type: ignore
@@ -17,11 +19,46 @@ except Exception:
     )
     sys.exit(2)
 
+from ci_cache import ContentCache, content_hash
+from ci_report import ErrorBudgetExhausted, Reporter, add_report_arguments
+from git_objects import DiffEntry, GitObjectStore, format_range, map_ranges, read_ranges_file, stream_diff_entries
+from repo_paths import RepoPaths, load_repo_paths
+from structural_diff import (
+    HTTP_METHODS,
+    LEVELS,
+    ClassifiedChange,
+    bump_level,
+    change_level,
+    classify_trees,
+    document_tree,
+    normalize_api_path,
+)
+from tree_state import TreeSkip, source_fingerprint
+
 
 SEMVER_RE = re.compile(r"^[0-9]+\.[0-9]+\.[0-9]+$")
 CONTRACT_FILE_RE = re.compile(r"(^|/)contract\.ya?ml$")
 API_FILE_RE = re.compile(r"(^|/)api\.ya?ml$")
 SCHEMA_PATH = pathlib.Path("contracts/contract.schema.json")
+LINT_ROOTS = ["specs", "contracts"]
+CHECKER_SOURCES = [
+    pathlib.Path(__file__).parent / name
+    for name in (
+        "check_contracts.py",
+        "structural_diff.py",
+        "ci_cache.py",
+        "tree_state.py",
+        "repo_paths.py",
+        "ci_report.py",
+    )
+]
+# Compiled payloads are only valid for the compiler that produced them, so the cache
+# key carries a hash of the checker sources instead of a hand-bumped version.
+OPENAPI_CACHE_VERSION = source_fingerprint(str(path) for path in CHECKER_SOURCES)
+MAX_LISTED_CHANGES = 5
+
+# Compiled api.yaml documents keyed by content hash; created on first use.
+OPENAPI_CACHE: Optional[ContentCache] = None
 
 
 def git_output(args: List[str]) -> Tuple[int, str, str]:
@@ -78,6 +115,208 @@ def format_schema_error(file_label: str, error: Any) -> str:
     return f"{file_label}: schema violation: {error.message}"
 
 
+@dataclass
+class OpenApiDocument:
+    label: str
+    digest: str
+    version: Optional[str]
+    operations: Dict[Tuple[str, str], str] = field(default_factory=dict)
+    refs: Dict[str, List[str]] = field(default_factory=dict)
+    errors: List[str] = field(default_factory=list)
+
+    @classmethod
+    def from_payload(cls, payload: Dict[str, Any], label: str) -> "OpenApiDocument":
+        return cls(
+            label=label,
+            digest=payload["digest"],
+            version=payload["version"],
+            operations={(method, path): display for method, path, display in payload["operations"]},
+            refs=payload["refs"],
+            errors=[f"{label}: {message}" for message in payload["errors"]],
+        )
+
+
+def ref_owner(parts: Tuple[str, ...]) -> str:
+    if parts[:1] == ("components",) and len(parts) >= 3:
+        owner = parts[:3]
+    elif parts[:1] == ("paths",) and len(parts) >= 2:
+        owner = parts[:2]
+    else:
+        return "#"
+    return "#/" + "/".join(part.replace("~", "~0").replace("/", "~1") for part in owner)
+
+
+def compile_openapi(data: Dict[str, Any]) -> Dict[str, Any]:
+    messages: List[str] = []
+    resolved: Dict[str, Any] = {}
+    failed: Dict[str, str] = {}
+    refs: Dict[str, Set[str]] = {}
+
+    def lookup(ref: str) -> Any:
+        if not ref.startswith("#/"):
+            raise ValueError(f"unsupported external $ref '{ref}'")
+        target: Any = data
+        for part in ref[2:].split("/"):
+            part = part.replace("~1", "/").replace("~0", "~")
+            if not isinstance(target, dict) or part not in target:
+                raise ValueError(f"unresolved $ref '{ref}'")
+            target = target[part]
+        return target
+
+    # Follows alias chains ($ref -> $ref -> node) once per pointer. Recursive schemas
+    # are fine because refs nested below a target are never expanded here; only a
+    # chain that returns to itself without reaching a real node is a cycle.
+    def resolve(ref: str) -> Any:
+        chain: List[str] = []
+        current = ref
+        while True:
+            if current in resolved:
+                node = resolved[current]
+                break
+            if current in failed:
+                raise ValueError(failed[current])
+            if current in chain:
+                message = f"circular $ref chain {' -> '.join(chain + [current])}"
+                for item in chain:
+                    failed[item] = message
+                raise ValueError(message)
+            chain.append(current)
+            try:
+                node = lookup(current)
+            except ValueError as exc:
+                for item in chain:
+                    failed[item] = str(exc)
+                raise
+            if isinstance(node, dict) and isinstance(node.get("$ref"), str):
+                current = node["$ref"]
+                continue
+            break
+        for item in chain:
+            resolved[item] = node
+        return node
+
+    reported: Set[str] = set()
+    stack: List[Tuple[Tuple[str, ...], Any]] = [((), data)]
+    while stack:
+        parts, node = stack.pop()
+        if isinstance(node, dict):
+            ref = node.get("$ref")
+            if isinstance(ref, str):
+                refs.setdefault(ref_owner(parts), set()).add(ref)
+                try:
+                    resolve(ref)
+                except ValueError as exc:
+                    if str(exc) not in reported:
+                        reported.add(str(exc))
+                        messages.append(str(exc))
+            for key, value in node.items():
+                if key != "$ref" and isinstance(value, (dict, list)):
+                    stack.append((parts + (str(key),), value))
+        elif isinstance(node, list):
+            for idx, value in enumerate(node):
+                if isinstance(value, (dict, list)):
+                    stack.append((parts + (str(idx),), value))
+
+    version: Optional[str] = None
+    info = data.get("info")
+    if not isinstance(info, dict):
+        messages.insert(0, "missing 'info' object")
+    elif not isinstance(info.get("version"), str) or not SEMVER_RE.match(info["version"]):
+        messages.insert(0, "info.version must match SemVer (X.Y.Z)")
+    else:
+        version = info["version"]
+
+    operations: Dict[Tuple[str, str], str] = {}
+    paths = data.get("paths")
+    if paths is not None and not isinstance(paths, dict):
+        messages.append("'paths' must be an object")
+    for raw_path, raw_item in (paths.items() if isinstance(paths, dict) else []):
+        item = raw_item
+        if isinstance(raw_item, dict) and isinstance(raw_item.get("$ref"), str):
+            try:
+                item = resolve(raw_item["$ref"])
+            except ValueError:
+                continue
+        if not isinstance(item, dict):
+            continue
+
+        path = normalize_api_path(str(raw_path))
+        for method in HTTP_METHODS:
+            if method not in item:
+                continue
+            key = (method.upper(), path)
+            if key in operations:
+                messages.append(
+                    f"duplicate operation {key[0]} {raw_path} (already declared as {operations[key]})"
+                )
+                continue
+            operations[key] = f"{key[0]} {raw_path}"
+
+    return {
+        "digest": content_hash(json.dumps(data, sort_keys=True, default=str)),
+        "version": version,
+        "operations": [[method, path, display] for (method, path), display in operations.items()],
+        "refs": {owner: sorted(targets) for owner, targets in sorted(refs.items())},
+        "errors": messages,
+    }
+
+
+def load_openapi(content: str, label: str) -> OpenApiDocument:
+    global OPENAPI_CACHE
+
+    if OPENAPI_CACHE is None:
+        OPENAPI_CACHE = ContentCache("openapi")
+    key = content_hash(OPENAPI_CACHE_VERSION, content)
+    payload = OPENAPI_CACHE.get(key)
+    if payload is None:
+        payload = compile_openapi(load_yaml(content, label))
+        OPENAPI_CACHE.put(key, payload)
+    return OpenApiDocument.from_payload(payload, label)
+
+
+def build_contract_endpoint_index(
+    data: Dict[str, Any], label: str
+) -> Tuple[Dict[Tuple[str, str], str], List[str]]:
+    index: Dict[Tuple[str, str], str] = {}
+    errors: List[str] = []
+
+    api = data.get("api")
+    endpoints = api.get("endpoints") if isinstance(api, dict) else None
+    if not isinstance(endpoints, list):
+        return index, errors
+
+    for endpoint in endpoints:
+        if not isinstance(endpoint, dict):
+            continue
+        method, path = endpoint.get("method"), endpoint.get("path")
+        if not isinstance(method, str) or not isinstance(path, str):
+            continue
+        key = (method.upper(), normalize_api_path(path))
+        if key in index:
+            errors.append(f"{label}: duplicate api.endpoints entry {method} {path}")
+            continue
+        index[key] = f"{method} {path}"
+
+    return index, errors
+
+
+def check_endpoint_coverage(
+    contract_label: str, contract_data: Dict[str, Any], api_doc: OpenApiDocument
+) -> List[str]:
+    contract_index, errors = build_contract_endpoint_index(contract_data, contract_label)
+    api_index = api_doc.operations
+
+    for key in sorted(contract_index.keys() - api_index.keys()):
+        errors.append(
+            f"{contract_label}: api.endpoints entry {contract_index[key]} has no matching operation in {api_doc.label}"
+        )
+    for key in sorted(api_index.keys() - contract_index.keys()):
+        errors.append(
+            f"{api_doc.label}: operation {api_index[key]} is not listed in {contract_label} api.endpoints"
+        )
+    return errors
+
+
 def lint_contract_file(path: pathlib.Path, validator: Draft202012Validator) -> List[str]:
     errors: List[str] = []
 
@@ -103,60 +342,74 @@ def lint_contract_file(path: pathlib.Path, validator: Draft202012Validator) -> L
         errors.append(f"{path}: missing sibling api.yaml file")
     else:
         try:
-            api_content = read_text(api_path)
-            api_data = load_yaml(api_content, str(api_path))
+            api_doc = load_openapi(read_text(api_path), str(api_path))
         except ValueError as exc:
             errors.append(str(exc))
         else:
-            info = api_data.get("info")
-            if not isinstance(info, dict):
-                errors.append(f"{api_path}: missing 'info' object")
-            else:
-                api_version = info.get("version")
-                if not isinstance(api_version, str) or not SEMVER_RE.match(api_version):
-                    errors.append(f"{api_path}: info.version must match SemVer (X.Y.Z)")
-                elif isinstance(version, str) and SEMVER_RE.match(version) and api_version != version:
-                    errors.append(
-                        f"{path}: version mismatch with {api_path} "
-                        f"(contract={version}, api={api_version})"
-                    )
+            errors.extend(api_doc.errors)
+            api_version = api_doc.version
+            if api_version and isinstance(version, str) and SEMVER_RE.match(version) and api_version != version:
+                errors.append(
+                    f"{path}: version mismatch with {api_path} "
+                    f"(contract={version}, api={api_version})"
+                )
+            errors.extend(check_endpoint_coverage(str(path), data, api_doc))
 
     return errors
 
 
-def get_changed_spec_paths(base: str, head: str) -> List[str]:
-    code, out, err = git_output(
-        ["git", "diff", "--name-status", "--diff-filter=ACMR", base, head, "--", "specs"]
-    )
-    if code != 0:
-        raise RuntimeError(f"git diff failed: {err.strip()}")
-
-    changed: List[str] = []
-    for raw in out.splitlines():
-        if not raw.strip():
+def check_contract_references(contract_paths: List[pathlib.Path], repo_paths: RepoPaths) -> List[str]:
+    # Reference targets live anywhere in the tree, so this runs even when contract lint is cached.
+    errors: List[str] = []
+    for path in contract_paths:
+        try:
+            content = read_text(path)
+            data = load_yaml(content, str(path))
+        except ValueError as exc:
+            errors.append(str(exc))
             continue
-        parts = raw.split("\t")
-        status = parts[0]
-        if status.startswith("R") and len(parts) >= 3:
-            candidate = parts[2]
-        elif len(parts) >= 2:
-            candidate = parts[1]
-        else:
+
+        references = data.get("references", [])
+        if not isinstance(references, list):
+            errors.append(f"{path}: references must be an array of repository paths")
             continue
+        lines = content.splitlines()
+        for idx, ref in enumerate(references):
+            if not isinstance(ref, str) or not ref.strip():
+                errors.append(f"{path}: references[{idx}] must be a non-empty path")
+            elif not repo_paths.exists(ref):
+                line = next((no for no, text in enumerate(lines, start=1) if ref in text), 1)
+                errors.append(f"{path}:{line}: references entry `{ref}` does not exist ({repo_paths.source})")
+    return errors
 
-        changed.append(candidate.replace("\\", "/"))
-    return changed
 
+def iter_diff_entries(
+    base: str, head: str, diff_filter: str, pathspecs: List[str], store: Optional[GitObjectStore] = None
+) -> Iterator[DiffEntry]:
+    if store is not None:
+        return iter(store.diff_entries(base, head, diff_filter, pathspecs))
+    return stream_diff_entries(base, head, diff_filter, pathspecs)
 
-def get_changed_contract_paths(base: str, head: str) -> List[str]:
-    return [path for path in get_changed_spec_paths(base, head) if CONTRACT_FILE_RE.search(path)]
 
+def get_changed_spec_paths(
+    base: str, head: str, store: Optional[GitObjectStore] = None
+) -> Tuple[List[str], List[str]]:
+    # One streamed diff over specs/ feeds both the contract and the api.yaml checks.
+    changed_contracts: List[str] = []
+    changed_apis: List[str] = []
+    for entry in iter_diff_entries(base, head, "ACMR", ["specs"], store):
+        path = entry.path.replace("\\", "/")
+        if CONTRACT_FILE_RE.search(path):
+            changed_contracts.append(path)
+        elif API_FILE_RE.search(path):
+            changed_apis.append(path)
+    return changed_contracts, changed_apis
 
-def get_changed_api_paths(base: str, head: str) -> List[str]:
-    return [path for path in get_changed_spec_paths(base, head) if API_FILE_RE.search(path)]
 
+def git_show(sha: str, path: str, store: Optional[GitObjectStore] = None) -> Optional[str]:
+    if store is not None:
+        return store.show(sha, path)
 
-def git_show(sha: str, path: str) -> Optional[str]:
     code, out, _ = git_output(["git", "show", f"{sha}:{path}"])
     if code != 0:
         return None
@@ -176,12 +429,54 @@ def parse_version_and_breaking(content: str, label: str) -> Tuple[str, bool]:
     return version, breaking
 
 
-def check_versioning(base: str, head: str, changed_paths: List[str]) -> List[str]:
+def structural_changes(
+    base: str,
+    head: str,
+    contract_path: str,
+    old_content: str,
+    new_content: str,
+    store: Optional[GitObjectStore] = None,
+) -> List[ClassifiedChange]:
+    changes = classify_trees(
+        document_tree(load_yaml(old_content, f"{base[:7]}:{contract_path}"), "contract", content_hash(old_content)),
+        document_tree(load_yaml(new_content, f"{head[:7]}:{contract_path}"), "contract", content_hash(new_content)),
+        "contract",
+    )
+
+    # The sibling api.yaml shares the contract version, so its edits count towards the same bump.
+    api_path = f"{pathlib.PurePosixPath(contract_path).parent.as_posix()}/api.yaml"
+    old_api = git_show(base, api_path, store)
+    new_api = git_show(head, api_path, store)
+    if old_api is not None and new_api is not None and old_api != new_api:
+        try:
+            old_data = load_yaml(old_api, f"{base[:7]}:{api_path}")
+            new_data = load_yaml(new_api, f"{head[:7]}:{api_path}")
+        except ValueError:
+            return changes
+        changes.extend(
+            classify_trees(
+                document_tree(old_data, "openapi", content_hash(old_api)),
+                document_tree(new_data, "openapi", content_hash(new_api)),
+                "openapi",
+            )
+        )
+    return changes
+
+
+def format_changes(changes: List[ClassifiedChange], level: str) -> str:
+    listed = [change.description for change in changes if change.level == level]
+    suffix = f" (+{len(listed) - MAX_LISTED_CHANGES} more)" if len(listed) > MAX_LISTED_CHANGES else ""
+    return "; ".join(listed[:MAX_LISTED_CHANGES]) + suffix
+
+
+def check_versioning(
+    base: str, head: str, changed_paths: List[str], store: Optional[GitObjectStore] = None
+) -> List[str]:
     errors: List[str] = []
 
     for path in changed_paths:
-        old_content = git_show(base, path)
-        new_content = git_show(head, path)
+        old_content = git_show(base, path, store)
+        new_content = git_show(head, path, store)
 
         # Added file: no previous version to compare.
         if old_content is None:
@@ -208,11 +503,31 @@ def check_versioning(base: str, head: str, changed_paths: List[str]) -> List[str
                 f"(old={old_version}, new={new_version})"
             )
 
+        changes = structural_changes(base, head, path, old_content, new_content, store)
+        required = change_level(changes)
+        bumped = bump_level(old_version, new_version)
+        if required == "major" and not new_breaking:
+            errors.append(
+                f"{path}: breaking changes detected but breaking_changes=false: "
+                f"{format_changes(changes, 'major')}"
+            )
+        # A missing bump and an already-flagged breaking change are reported above.
+        if bumped is not None and required in ("major", "minor") and not (required == "major" and new_breaking):
+            if LEVELS.index(bumped) < LEVELS.index(required):
+                errors.append(
+                    f"{path}: {required.upper()} changes require a {required.upper()} bump "
+                    f"(old={old_version}, new={new_version}): {format_changes(changes, required)}"
+                )
+
     return errors
 
 
 def check_api_contract_coupling(
-    base: str, head: str, changed_contract_paths: List[str], changed_api_paths: List[str]
+    base: str,
+    head: str,
+    changed_contract_paths: List[str],
+    changed_api_paths: List[str],
+    store: Optional[GitObjectStore] = None,
 ) -> List[str]:
     errors: List[str] = []
     changed_contract_set = set(changed_contract_paths)
@@ -222,11 +537,21 @@ def check_api_contract_coupling(
         if contract_path in changed_contract_set:
             continue
 
-        old_api = git_show(base, api_path)
-        new_api = git_show(head, api_path)
+        old_api = git_show(base, api_path, store)
+        new_api = git_show(head, api_path, store)
 
         if old_api == new_api:
             continue
+        if old_api is not None and new_api is not None:
+            # Formatting, comment and key-order edits leave the compiled document unchanged.
+            try:
+                old_doc = load_openapi(old_api, f"{base[:7]}:{api_path}")
+                new_doc = load_openapi(new_api, f"{head[:7]}:{api_path}")
+            except ValueError:
+                pass
+            else:
+                if old_doc.digest == new_doc.digest:
+                    continue
 
         errors.append(
             f"{api_path}: api.yaml changed between {base[:7]} and {head[:7]} "
@@ -236,57 +561,132 @@ def check_api_contract_coupling(
     return errors
 
 
+def run_diff_checks(
+    base: str, head: str, store: Optional[GitObjectStore] = None
+) -> Tuple[List[str], List[str]]:
+    errors: List[str] = []
+    notes: List[str] = []
+
+    try:
+        changed_paths, changed_api_paths = get_changed_spec_paths(base, head, store)
+    except RuntimeError as exc:
+        errors.append(str(exc))
+        changed_paths = []
+        changed_api_paths = []
+
+    if changed_paths:
+        errors.extend(check_versioning(base, head, changed_paths, store))
+    else:
+        notes.append("No changed contract.yaml files between provided SHAs.")
+
+    if changed_api_paths:
+        errors.extend(check_api_contract_coupling(base, head, changed_paths, changed_api_paths, store))
+    else:
+        notes.append("No changed api.yaml files between provided SHAs.")
+
+    return errors, notes
+
+
+def check_ranges(ranges: List[Tuple[str, str]], workers: int) -> List[Tuple[str, List[str]]]:
+    results = map_ranges(lambda base, head, store: run_diff_checks(base, head, store)[0], ranges, workers)
+    return [(format_range(base, head), errors) for (base, head), errors in zip(ranges, results)]
+
+
+def print_range_report(results: List[Tuple[str, List[str]]], reporter: Reporter) -> int:
+    failed = [label for label, errors in results if errors]
+    reporter.note(f"Release-train contract checks ({len(results)} ranges):")
+    for label, errors in results:
+        reporter.note(f"- [{'FAIL' if errors else 'PASS'}] {label}")
+        if reporter.streaming:
+            reporter.extend("versioning", (f"{err} (range {label})" for err in errors))
+        else:
+            for err in errors:
+                print(f"  - {err}")
+
+    if failed:
+        reporter.note(f"Contract versioning checks failed for {len(failed)} of {len(results)} ranges.")
+        return 1
+    reporter.note(f"Contract versioning checks passed for all {len(results)} ranges.")
+    return 0
+
+
 def main() -> int:
     parser = argparse.ArgumentParser(
         description="Lint FlowHR contract files (YAML+schema) and versioning rules."
     )
     parser.add_argument("--base", help="Base git SHA for versioning check")
     parser.add_argument("--head", help="Head git SHA for versioning check")
+    parser.add_argument(
+        "--ranges-file",
+        help="File with one '<base>..<head>' pair per line; checks every range in one run.",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=min(8, os.cpu_count() or 1),
+        help="Concurrent ranges evaluated in --ranges-file mode; each worker reads git through its own object store.",
+    )
+    add_report_arguments(parser)
     args = parser.parse_args()
+    reporter = Reporter("contracts", args.format, args.max_errors)
 
-    errors: List[str] = []
+    range_status = 0
+    try:
+        range_status = run_checks(args, reporter)
+    except ErrorBudgetExhausted:
+        pass
+
+    if reporter.finish("Contract governance checks failed:"):
+        return 1
+
+    if range_status:
+        return range_status
+
+    reporter.note("Contract governance checks passed.")
+    return 0
 
+
+def run_checks(args: argparse.Namespace, reporter: Reporter) -> int:
     try:
         validator = load_schema(SCHEMA_PATH)
     except ValueError as exc:
-        errors.append(str(exc))
+        reporter.add("schema", str(exc))
         validator = None  # type: ignore
 
+    lint_state = TreeSkip("check_contracts", LINT_ROOTS, [str(path) for path in CHECKER_SOURCES])
     contract_paths = sorted(pathlib.Path("specs").rglob("contract.yaml"))
     if not contract_paths:
-        print("No contract.yaml files found under specs/.")
+        reporter.note("No contract.yaml files found under specs/.")
+    elif lint_state.unchanged():
+        reporter.note(f"Contract lint: cached pass ({lint_state.root_oids()}).")
     elif validator is not None:
+        # A schema change relints everything; otherwise only domains whose tree moved.
+        lint_all = lint_state.changed("contracts")
+        lint_failed = False
         for path in contract_paths:
-            errors.extend(lint_contract_file(path, validator))
-
-    if args.base and args.head:
+            if lint_all or lint_state.changed(path.parent.as_posix()):
+                file_errors = lint_contract_file(path, validator)
+                lint_failed = lint_failed or bool(file_errors)
+                reporter.extend("lint", file_errors)
+        if not lint_failed:
+            lint_state.record_pass()
+    if contract_paths:
+        reporter.extend("references", check_contract_references(contract_paths, load_repo_paths()))
+
+    if args.ranges_file:
         try:
-            changed_paths = get_changed_contract_paths(args.base, args.head)
-            changed_api_paths = get_changed_api_paths(args.base, args.head)
-        except RuntimeError as exc:
-            errors.append(str(exc))
-            changed_paths = []
-            changed_api_paths = []
-
-        if changed_paths:
-            errors.extend(check_versioning(args.base, args.head, changed_paths))
-        else:
-            print("No changed contract.yaml files between provided SHAs.")
-
-        if changed_api_paths:
-            errors.extend(check_api_contract_coupling(args.base, args.head, changed_paths, changed_api_paths))
+            ranges = read_ranges_file(pathlib.Path(args.ranges_file))
+        except ValueError as exc:
+            reporter.add("versioning", str(exc))
         else:
-            print("No changed api.yaml files between provided SHAs.")
+            return print_range_report(check_ranges(ranges, args.workers), reporter)
+    elif args.base and args.head:
+        diff_errors, notes = run_diff_checks(args.base, args.head)
+        for note in notes:
+            reporter.note(note)
+        reporter.extend("versioning", diff_errors)
     else:
-        print("Versioning diff check skipped (base/head not provided).")
-
-    if errors:
-        print("Contract governance checks failed:")
-        for err in errors:
-            print(f"- {err}")
-        return 1
-
-    print("Contract governance checks passed.")
+        reporter.note("Versioning diff check skipped (base/head not provided).")
     return 0
 
 
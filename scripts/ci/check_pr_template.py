@@ -1,9 +1,18 @@
 #!/usr/bin/env python3
 import argparse
+import json
 import os
 import pathlib
 import re
 import sys
+from collections import Counter, deque
+from dataclasses import dataclass, field
+from functools import lru_cache
+from multiprocessing import Pool
+from typing import Any, Deque, Dict, Iterator, List, Optional, Sequence, TextIO, Tuple
+
+from ci_report import ErrorBudgetExhausted, Reporter, add_report_arguments
+from repo_paths import RepoPaths, load_repo_paths
 
 
 REQUIRED_CHECKBOXES = [
@@ -45,6 +54,42 @@ BREAK_GLASS_REQUIRED_FIELDS = [
 ]
 
 WORK_ITEM_RE = re.compile(r"Work Item:\s*`?(work-items/WI-\d{4}[^`\n]*)`?", re.IGNORECASE)
+CHECKBOX_MARK_RE = re.compile(r"-[^\S\n]*\[([ xX])\][^\S\n]*")
+# A field name counts anywhere on a line (bullets, numbering, quotes, `**Name**:`),
+# followed by an optional closing emphasis marker and a colon; the value is the rest
+# of that line only.
+FIELD_SEPARATOR = r"[^\S\n]*(?:\*\*|__|\*|_)?[^\S\n]*:"
+AUDIT_CHUNK_SIZE = 64
+
+
+@dataclass
+class BodyReport:
+    errors: List[str] = field(default_factory=list)
+    break_glass_triggers: List[str] = field(default_factory=list)
+    missing_break_glass_fields: List[str] = field(default_factory=list)
+
+
+# Built by one pass over the body; rule lists are then evaluated as dict lookups.
+@dataclass
+class PrBodyIndex:
+    checkboxes: Dict[str, Tuple[bool, int]] = field(default_factory=dict)
+    fields: Dict[str, Tuple[str, int]] = field(default_factory=dict)
+
+    def is_checked(self, label: str) -> bool:
+        entry = self.checkboxes.get(label)
+        return entry is not None and entry[0]
+
+    def has_value(self, name: str) -> bool:
+        entry = self.fields.get(name)
+        return entry is not None and entry[0] != ""
+
+    def checkbox_location(self, label: str) -> str:
+        entry = self.checkboxes.get(label)
+        return f"line {entry[1]}" if entry else "not found"
+
+    def field_location(self, name: str) -> str:
+        entry = self.fields.get(name)
+        return f"line {entry[1]}" if entry else "not found"
 
 
 def parse_args() -> argparse.Namespace:
@@ -53,6 +98,21 @@ def parse_args() -> argparse.Namespace:
         "--body-file",
         help="Optional file path containing PR body markdown. If omitted, reads PR_BODY env.",
     )
+    parser.add_argument(
+        "--jsonl",
+        help="Bulk audit mode: JSON Lines file of historical PRs ({\"number\": ..., \"body\": ...}); '-' reads stdin.",
+    )
+    parser.add_argument(
+        "--output",
+        help="Bulk audit mode: write one JSON result per PR to this file.",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Bulk audit mode: worker processes used to evaluate PR bodies.",
+    )
+    add_report_arguments(parser)
     return parser.parse_args()
 
 
@@ -63,52 +123,227 @@ def read_body(body_file: str | None) -> str:
 
 
 def checkbox_checked(body: str, label: str) -> bool:
-    pattern = re.compile(rf"-\s*\[[xX]\]\s*{re.escape(label)}\s*$", re.MULTILINE)
+    pattern = re.compile(rf"-[^\S\n]*\[[xX]\][^\S\n]*{re.escape(label)}[^\S\n]*$", re.MULTILINE)
     return bool(pattern.search(body))
 
 
+def field_value(rest: str) -> str:
+    return rest.strip().strip("*_").strip()
+
+
 def has_non_empty_field(body: str, field: str) -> bool:
-    pattern = re.compile(rf"{re.escape(field)}\s*:\s*(.+)$", re.MULTILINE)
-    match = pattern.search(body)
-    if not match:
-        return False
-    value = match.group(1).strip()
-    return value != ""
+    pattern = re.compile(rf"{re.escape(field)}{FIELD_SEPARATOR}(.*)$", re.MULTILINE)
+    return any(field_value(match.group(1)) for match in pattern.finditer(body))
+
+
+@lru_cache(maxsize=8)
+def field_names_re(names: Tuple[str, ...]) -> "re.Pattern[str]":
+    alternatives = "|".join(re.escape(name) for name in sorted(names, key=len, reverse=True))
+    return re.compile(rf"({alternatives}){FIELD_SEPARATOR}")
+
+
+def index_body(body: str, field_names: Sequence[str] = BREAK_GLASS_REQUIRED_FIELDS) -> PrBodyIndex:
+    index = PrBodyIndex()
+    field_re = field_names_re(tuple(field_names))
+    for line_number, line in enumerate(body.split("\n"), start=1):
+        for mark in CHECKBOX_MARK_RE.finditer(line):
+            label = line[mark.end() :].rstrip()
+            checked = mark.group(1) != " "
+            previous = index.checkboxes.get(label)
+            if previous is None or (checked and not previous[0]):
+                index.checkboxes[label] = (checked, line_number)
+
+        if ":" not in line:
+            continue
+        for field_match in field_re.finditer(line):
+            name = field_match.group(1)
+            value = field_value(line[field_match.end() :])
+            previous_field = index.fields.get(name)
+            if previous_field is None or (value and not previous_field[0]):
+                index.fields[name] = (value, line_number)
+
+    return index
+
+
+def evaluate_body(body: str, repo_paths: Optional[RepoPaths] = None) -> BodyReport:
+    report = BodyReport()
+    index = index_body(body)
+
+    work_items = [match.group(1).split()[0].rstrip(".,;)") for match in WORK_ITEM_RE.finditer(body)]
+    if not work_items:
+        report.errors.append("Summary must include Work Item path like `work-items/WI-0001-...`.")
+    elif repo_paths is not None:
+        for path in repo_paths.missing(work_items):
+            report.errors.append(f"Work Item path does not exist in the repository: {path}")
+
+    for label in REQUIRED_CHECKBOXES:
+        if not index.is_checked(label):
+            report.errors.append(f"Unchecked required checkbox: {label} ({index.checkbox_location(label)})")
+
+    if not any(index.is_checked(label) for label in ADR_CHECKBOXES):
+        report.errors.append(
+            "ADR requirement section must check either ADR added or Not required with reason."
+        )
+
+    report.break_glass_triggers = [
+        label for label in BREAK_GLASS_TRIGGER_CHECKBOXES if index.is_checked(label)
+    ]
+    if report.break_glass_triggers:
+        for field_name in BREAK_GLASS_REQUIRED_FIELDS:
+            if not index.has_value(field_name):
+                report.missing_break_glass_fields.append(field_name)
+                report.errors.append(
+                    f"Break-glass requires non-empty field: {field_name} ({index.field_location(field_name)})"
+                )
+
+    return report
+
+
+def audit_line(line: str) -> Dict[str, Any]:
+    try:
+        record = json.loads(line)
+    except Exception as exc:
+        return {"pr": None, "status": "invalid", "errors": [f"invalid JSON ({exc})"]}
+
+    if not isinstance(record, dict):
+        return {"pr": None, "status": "invalid", "errors": ["record must be a JSON object"]}
+
+    pr = record.get("number", record.get("id"))
+    body = record.get("body")
+    if body is not None and not isinstance(body, str):
+        return {"pr": pr, "status": "invalid", "errors": ["body must be a string or null"]}
+
+    body = (body or "").strip()
+    if not body:
+        return {"pr": pr, "status": "skipped", "errors": []}
+
+    report = evaluate_body(body)
+    return {
+        "pr": pr,
+        "status": "failed" if report.errors else "passed",
+        "errors": report.errors,
+        "break_glass_triggers": report.break_glass_triggers,
+        "missing_break_glass_fields": report.missing_break_glass_fields,
+    }
+
+
+def iter_jsonl_lines(stream: TextIO, line_numbers: Optional[Deque[int]] = None) -> Iterator[str]:
+    for lineno, line in enumerate(stream, start=1):
+        if line.strip():
+            if line_numbers is not None:
+                line_numbers.append(lineno)
+            yield line
+
+
+def run_bulk_audit(
+    stream: TextIO,
+    output: TextIO | None,
+    workers: int,
+    reporter: Optional[Reporter] = None,
+    source: str = "<stdin>",
+) -> Dict[str, Any]:
+    status_counts: Counter = Counter()
+    trigger_counts: Counter = Counter()
+    missing_field_counts: Counter = Counter()
+    break_glass_total = 0
+    break_glass_incomplete = 0
+    line_numbers: Deque[int] = deque()
+
+    # imap keeps input order and streams results, so memory stays bounded by the chunk size.
+    try:
+        with Pool(processes=max(1, workers)) as pool:
+            for result in pool.imap(audit_line, iter_jsonl_lines(stream, line_numbers), chunksize=AUDIT_CHUNK_SIZE):
+                lineno = line_numbers.popleft()
+                status_counts[result["status"]] += 1
+                triggers = result.get("break_glass_triggers") or []
+                if triggers:
+                    break_glass_total += 1
+                    trigger_counts.update(triggers)
+                    missing = result.get("missing_break_glass_fields") or []
+                    if missing:
+                        break_glass_incomplete += 1
+                        missing_field_counts.update(missing)
+                if output is not None:
+                    output.write(json.dumps(result, ensure_ascii=False) + "\n")
+                if reporter is not None and result["errors"]:
+                    prefix = f"{source}:{lineno}: " + (f"PR #{result['pr']}: " if result["pr"] is not None else "")
+                    rule = "jsonl" if result["status"] == "invalid" else "body"
+                    reporter.extend(rule, [prefix + error for error in result["errors"]])
+    except ErrorBudgetExhausted:
+        # --max-errors stops the audit; the summary covers the records read so far.
+        pass
+
+    return {
+        "total": sum(status_counts.values()),
+        "passed": status_counts["passed"],
+        "failed": status_counts["failed"],
+        "skipped": status_counts["skipped"],
+        "invalid": status_counts["invalid"],
+        "break_glass": {
+            "used": break_glass_total,
+            "incomplete": break_glass_incomplete,
+            "by_trigger": dict(trigger_counts.most_common()),
+            "missing_fields": dict(missing_field_counts.most_common()),
+        },
+    }
+
+
+def print_audit_summary(summary: Dict[str, Any], reporter: Reporter) -> None:
+    reporter.note(
+        f"PR template audit: {summary['total']} PRs "
+        f"(passed={summary['passed']}, failed={summary['failed']}, "
+        f"skipped={summary['skipped']}, invalid={summary['invalid']})"
+    )
+    break_glass = summary["break_glass"]
+    reporter.note(f"Break-glass used: {break_glass['used']} (incomplete fields: {break_glass['incomplete']})")
+    for label, count in break_glass["by_trigger"].items():
+        reporter.note(f"- trigger {label}: {count}")
+    for field_name, count in break_glass["missing_fields"].items():
+        reporter.note(f"- missing field {field_name}: {count}")
+
+
+def main_bulk(args: argparse.Namespace) -> int:
+    reporter = Reporter("pr-template", args.format, args.max_errors)
+    output = open(args.output, "w", encoding="utf-8") if args.output else None
+    try:
+        if args.jsonl == "-":
+            summary = run_bulk_audit(sys.stdin, output, args.workers, reporter)
+        else:
+            with open(args.jsonl, encoding="utf-8") as stream:
+                summary = run_bulk_audit(stream, output, args.workers, reporter, args.jsonl)
+    finally:
+        if output is not None:
+            output.close()
+
+    print_audit_summary(summary, reporter)
+    reporter.finish("PR template audit findings:")
+    return 1 if summary["failed"] or summary["invalid"] else 0
 
 
 def main() -> int:
     args = parse_args()
+    if args.jsonl:
+        return main_bulk(args)
+
     body = read_body(args.body_file)
+    reporter = Reporter("pr-template", args.format, args.max_errors)
 
     if not body:
-        print("PR template check skipped: PR body is empty (non-PR/local execution).")
+        reporter.note("PR template check skipped: PR body is empty (non-PR/local execution).")
+        reporter.finish("")
         return 0
 
-    errors: list[str] = []
-
-    if not WORK_ITEM_RE.search(body):
-        errors.append("Summary must include Work Item path like `work-items/WI-0001-...`.")
+    # Historical bodies in --jsonl mode may cite since-renamed work items, so only the
+    # current PR is resolved against the tree.
+    try:
+        reporter.extend("body", evaluate_body(body, load_repo_paths()).errors)
+    except ErrorBudgetExhausted:
+        pass
 
-    for label in REQUIRED_CHECKBOXES:
-        if not checkbox_checked(body, label):
-            errors.append(f"Unchecked required checkbox: {label}")
-
-    if not any(checkbox_checked(body, label) for label in ADR_CHECKBOXES):
-        errors.append("ADR requirement section must check either ADR added or Not required with reason.")
-
-    break_glass_used = any(checkbox_checked(body, label) for label in BREAK_GLASS_TRIGGER_CHECKBOXES)
-    if break_glass_used:
-        for field in BREAK_GLASS_REQUIRED_FIELDS:
-            if not has_non_empty_field(body, field):
-                errors.append(f"Break-glass requires non-empty field: {field}")
-
-    if errors:
-        print("PR template compliance checks failed:")
-        for error in errors:
-            print(f"- {error}")
+    if reporter.finish("PR template compliance checks failed:"):
         return 1
 
-    print("PR template compliance checks passed.")
+    reporter.note("PR template compliance checks passed.")
     return 0
 
 
@@ -0,0 +1,198 @@
+#!/usr/bin/env python3
+import argparse
+import pathlib
+import sys
+from dataclasses import asdict, dataclass, field
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from ci_cache import ContentCache
+from ci_report import ErrorBudgetExhausted, Reporter, add_report_arguments
+from data_ownership import OwnedTable, parse_owned_tables
+from migration_ddl import MigrationDdl, load_migration_ddl
+from prisma_schema import PrismaSchemaIndex, load_prisma_schema
+from tree_state import source_fingerprint
+
+
+MIGRATIONS_DIR = pathlib.Path("prisma/migrations")
+SCHEMA_PATH = pathlib.Path("prisma/schema.prisma")
+OWNERSHIP_PATH = pathlib.Path("docs/data-ownership.md")
+TENANT_ROOT_MODEL = "Organization"
+# The checkpoint is folded state, so it is keyed by the fold and scanner sources that built it.
+CHECKPOINT_KEY = "schema-state-" + source_fingerprint(
+    [__file__, str(pathlib.Path(__file__).parent / "migration_ddl.py")]
+)[:16]
+
+
+@dataclass
+class TableState:
+    created_by: str
+    rls_enabled: bool = False
+    policies: List[str] = field(default_factory=list)
+
+
+@dataclass
+class SchemaState:
+    applied: List[Tuple[str, str]] = field(default_factory=list)
+    tables: Dict[str, TableState] = field(default_factory=dict)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "applied": [list(item) for item in self.applied],
+            "tables": {name: asdict(table) for name, table in self.tables.items()},
+        }
+
+    @classmethod
+    def from_dict(cls, payload: Dict[str, Any]) -> "SchemaState":
+        return cls(
+            applied=[(str(migration_id), str(digest)) for migration_id, digest in payload["applied"]],
+            tables={name: TableState(**raw) for name, raw in payload["tables"].items()},
+        )
+
+
+def fold_migration(state: SchemaState, ddl: MigrationDdl) -> None:
+    for name, table in ddl.tables.items():
+        if table.dropped:
+            state.tables.pop(name, None)
+            continue
+
+        current = state.tables.get(name)
+        if current is None:
+            # `CREATE TABLE IF NOT EXISTS` on an existing table keeps the existing state.
+            if not (table.created or table.altered or table.policies):
+                continue
+            current = state.tables[name] = TableState(created_by=ddl.migration_id)
+
+        current.policies = [policy for policy in current.policies if policy not in table.dropped_policies]
+        current.policies.extend(policy for policy in table.policies if policy not in current.policies)
+        if table.rls_enabled:
+            current.rls_enabled = True
+        elif table.rls_disabled:
+            current.rls_enabled = False
+
+    state.applied.append((ddl.migration_id, ddl.digest))
+
+
+def replay_migrations(
+    ddl_by_id: Dict[str, MigrationDdl], checkpoint: Optional[SchemaState]
+) -> Tuple[SchemaState, int]:
+    ordered = sorted(ddl_by_id)
+    expected = [(migration_id, ddl_by_id[migration_id].digest) for migration_id in ordered]
+
+    # A checkpoint is reusable only while every migration it folded is still present,
+    # in the same order and with the same content; new migrations are replayed on top.
+    if checkpoint is not None and checkpoint.applied == expected[: len(checkpoint.applied)]:
+        state = checkpoint
+    else:
+        state = SchemaState()
+
+    start = len(state.applied)
+    for migration_id in ordered[start:]:
+        fold_migration(state, ddl_by_id[migration_id])
+    return state, len(ordered) - start
+
+
+def load_checkpoint(store: ContentCache) -> Optional[SchemaState]:
+    payload = store.get(CHECKPOINT_KEY)
+    if payload is None:
+        return None
+    try:
+        return SchemaState.from_dict(payload)
+    except (KeyError, TypeError, ValueError):
+        return None
+
+
+def tenant_owned_models(schema: PrismaSchemaIndex) -> Set[str]:
+    # Tenant-owned: the tenant root plus every model whose relation path reaches it.
+    owned: Set[str] = {TENANT_ROOT_MODEL} if TENANT_ROOT_MODEL in schema.models else set()
+    changed = True
+    while changed:
+        changed = False
+        for name in schema.models:
+            if name in owned:
+                continue
+            for relation_field in schema.relations(name):
+                relation = relation_field.relation
+                if relation is not None and relation.fields and relation.target in owned:
+                    owned.add(name)
+                    changed = True
+                    break
+    return owned
+
+
+def check_rls_coverage(
+    state: SchemaState, schema: PrismaSchemaIndex, ownership_refs: List[OwnedTable]
+) -> List[str]:
+    errors: List[str] = []
+    last_migration = state.applied[-1][0] if state.applied else "<none>"
+
+    for model_name in sorted(tenant_owned_models(schema)):
+        model = schema.models[model_name]
+        location = f"{SCHEMA_PATH}:{model.start_line}"
+        table = state.tables.get(model.table)
+        if table is None:
+            errors.append(
+                f"{location}: tenant-owned model `{model_name}` has no table `{model.table}` in {MIGRATIONS_DIR}"
+            )
+        elif not table.rls_enabled:
+            errors.append(
+                f"{location}: tenant-owned model `{model_name}` does not have row level security enabled "
+                f"after {last_migration}"
+            )
+        elif not table.policies:
+            errors.append(
+                f"{location}: tenant-owned model `{model_name}` has row level security enabled but no policies "
+                f"after {last_migration}"
+            )
+
+    owned_models: Set[str] = set()
+    for ref in ownership_refs:
+        owned_models.add(ref.token)
+        model = schema.models.get(ref.token)
+        table_name = model.table if model is not None else ref.token
+        if table_name not in state.tables:
+            errors.append(f"{ref.path}:{ref.line}: owned table `{ref.token}` is not created by any migration")
+
+    for table_name, table in sorted(state.tables.items()):
+        if table.rls_enabled and schema.tables.get(table_name, table_name) not in owned_models:
+            errors.append(
+                f"{MIGRATIONS_DIR}/{table.created_by}: RLS-enabled table `{table_name}` "
+                f"has no owner in {OWNERSHIP_PATH}"
+            )
+
+    return errors
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Check that every tenant-owned model is covered by RLS.")
+    add_report_arguments(parser)
+    args = parser.parse_args()
+    reporter = Reporter("tenant-rls", args.format, args.max_errors)
+
+    try:
+        run_checks(reporter)
+    except ErrorBudgetExhausted:
+        pass
+    return reporter.finish("Tenant RLS coverage checks failed:")
+
+
+def run_checks(reporter: Reporter) -> None:
+    try:
+        schema = load_prisma_schema(SCHEMA_PATH)
+        ddl_by_id = load_migration_ddl(MIGRATIONS_DIR)
+        ownership_refs = parse_owned_tables(OWNERSHIP_PATH)
+    except ValueError as exc:
+        reporter.add("inputs", str(exc))
+        return
+
+    store = ContentCache("tenant-rls")
+    state, replayed = replay_migrations(ddl_by_id, load_checkpoint(store))
+    store.put(CHECKPOINT_KEY, state.to_dict())
+    reporter.note(f"Replayed {replayed} of {len(ddl_by_id)} migrations into tenant RLS state.")
+
+    reporter.extend("coverage", check_rls_coverage(state, schema, ownership_refs))
+    if not reporter.errors:
+        reporter.note(f"Tenant RLS coverage checks passed ({len(tenant_owned_models(schema))} tenant-owned models).")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
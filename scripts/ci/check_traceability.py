@@ -1,9 +1,10 @@
 #!/usr/bin/env python3
+import argparse
 import pathlib
 import re
 import sys
-from dataclasses import dataclass
-from typing import Any, Dict, List, Set, Tuple
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Set, Tuple
 
 try:
     import yaml  # type: ignore
@@ -14,22 +15,104 @@ except Exception:
     )
     sys.exit(2)
 
+from ci_report import ErrorBudgetExhausted, Reporter, add_report_arguments
+from data_ownership import parse_owned_tables
+from migration_ddl import MigrationDdl, load_migration_ddl
+from prisma_schema import PrismaSchemaIndex, load_prisma_schema
+from repo_paths import RepoPaths, load_repo_paths
+from tree_state import TreeSkip
+
 
-PRISMA_MODEL_RE = re.compile(r"^\s*model\s+([A-Za-z][A-Za-z0-9_]*)\s+\{")
 BACKTICK_RE = re.compile(r"`([^`]+)`")
 RUNTIME_EVENT_ENTRY_RE = re.compile(r'^\s*"([A-Za-z0-9._-]+)"')
 DATA_CHANGES_HEADING_RE = re.compile(r"^##\s+data changes\b", re.IGNORECASE)
 LEVEL2_HEADING_RE = re.compile(r"^##\s+")
 MIGRATION_ID_RE = re.compile(r"^\d{12}_[a-z0-9_]+$")
+MODEL_FIELD_RE = re.compile(r"^([A-Z][a-z][A-Za-z0-9_]*)\.([a-z][A-Za-z0-9_]*)$")
+PATH_SUFFIX_RE = re.compile(r"(#[^/]*|:\d+(-\d+)?)$")
+CROSS_LINK_DOC_ROOTS = ("specs", "work-items", "docs", "adr", "qa")
 PROCESS_EVENT_ALLOWLIST = {"workitem.assigned", "qa.gate.passed", "qa.gate.failed"}
+TRACEABILITY_INPUTS = [
+    "specs",
+    "work-items",
+    "prisma",
+    "docs/data-ownership.md",
+    "src/features/shared/domain-event-publisher.ts",
+]
+CHECKER_SOURCES = [
+    pathlib.Path(__file__).parent / name
+    for name in (
+        "check_traceability.py",
+        "prisma_schema.py",
+        "migration_ddl.py",
+        "ci_cache.py",
+        "tree_state.py",
+        "repo_paths.py",
+        "ci_report.py",
+        "data_ownership.py",
+    )
+]
+
+
+class StringTable:
+    def __init__(self) -> None:
+        self._ids: Dict[str, int] = {}
+        self._values: List[str] = []
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def intern(self, value: str) -> int:
+        ident = self._ids.get(value)
+        if ident is None:
+            ident = len(self._values)
+            self._ids[value] = ident
+            self._values.append(value)
+        return ident
+
+    def intern_all(self, values: Iterable[str]) -> Set[int]:
+        return {self.intern(value) for value in values}
 
+    def value(self, ident: int) -> str:
+        return self._values[ident]
 
+    def values(self, idents: Iterable[int]) -> List[str]:
+        return sorted(self._values[ident] for ident in idents)
+
+
+# Refs only carry integer ids; paths, sources and tokens are stored once per validation
+# run, in the RefTables that run creates and hands to every parser and validator.
 @dataclass
+class RefTables:
+    paths: StringTable = field(default_factory=StringTable)
+    sources: StringTable = field(default_factory=StringTable)
+    tokens: StringTable = field(default_factory=StringTable)
+
+    def ref(self, path: pathlib.Path, line: int, token: str, source: str) -> "TokenRef":
+        return TokenRef(
+            self.paths.intern(str(path)), line, self.tokens.intern(token), self.sources.intern(source), self
+        )
+
+
+@dataclass(frozen=True, slots=True)
 class TokenRef:
-    path: pathlib.Path
+    path_id: int
     line: int
-    token: str
-    source: str
+    token_id: int
+    source_id: int
+    tables: RefTables = field(compare=False, repr=False)
+
+    @property
+    def path(self) -> pathlib.Path:
+        return pathlib.Path(self.tables.paths.value(self.path_id))
+
+    @property
+    def token(self) -> str:
+        return self.tables.tokens.value(self.token_id)
+
+    @property
+    def source(self) -> str:
+        return self.tables.sources.value(self.source_id)
 
 
 def read_text(path: pathlib.Path) -> str:
@@ -37,18 +120,9 @@ def read_text(path: pathlib.Path) -> str:
 
 
 def parse_prisma_models(schema_path: pathlib.Path) -> Set[str]:
-    if not schema_path.exists():
-        raise ValueError(f"{schema_path}: file not found")
-
-    models: Set[str] = set()
-    for idx, line in enumerate(read_text(schema_path).splitlines(), start=1):
-        match = PRISMA_MODEL_RE.match(line)
-        if match:
-            models.add(match.group(1))
-
+    models = set(load_prisma_schema(schema_path).models)
     if not models:
         raise ValueError(f"{schema_path}: no Prisma models found")
-
     return models
 
 
@@ -82,36 +156,14 @@ def parse_runtime_domain_events(path: pathlib.Path) -> Set[str]:
     return events
 
 
-def parse_data_ownership_tables(path: pathlib.Path) -> List[TokenRef]:
-    if not path.exists():
-        raise ValueError(f"{path}: file not found")
+def parse_data_ownership_tables(path: pathlib.Path, tables: RefTables) -> List[TokenRef]:
+    return [
+        tables.ref(path=ref.path, line=ref.line, token=ref.token, source="data-ownership table")
+        for ref in parse_owned_tables(path)
+    ]
 
-    refs: List[TokenRef] = []
-    lines = read_text(path).splitlines()
 
-    for idx, raw_line in enumerate(lines, start=1):
-        line = raw_line.strip()
-        if not line.startswith("|"):
-            continue
-        if line.startswith("| ---"):
-            continue
-
-        cells = [cell.strip() for cell in line.strip("|").split("|")]
-        if len(cells) < 4:
-            continue
-        if cells[0].lower() == "domain":
-            continue
-
-        owned_tables_cell = cells[1]
-        for token in BACKTICK_RE.findall(owned_tables_cell):
-            refs.append(
-                TokenRef(path=path, line=idx, token=token.strip(), source="data-ownership table")
-            )
-
-    return refs
-
-
-def parse_data_ownership_event_refs(path: pathlib.Path) -> List[TokenRef]:
+def parse_data_ownership_event_refs(path: pathlib.Path, tables: RefTables) -> List[TokenRef]:
     if not path.exists():
         raise ValueError(f"{path}: file not found")
 
@@ -137,20 +189,21 @@ def parse_data_ownership_event_refs(path: pathlib.Path) -> List[TokenRef]:
             if not value or value.lower() == "none":
                 continue
             refs.append(
-                TokenRef(path=path, line=idx, token=value, source="data-ownership published event")
+                tables.ref(path=path, line=idx, token=value, source="data-ownership published event")
             )
 
     return refs
 
 
 def parse_work_item_data_changes(
-    work_items_dir: pathlib.Path,
-) -> Tuple[List[TokenRef], List[TokenRef]]:
+    work_items_dir: pathlib.Path, tables: RefTables
+) -> Tuple[List[TokenRef], List[TokenRef], List[TokenRef]]:
     if not work_items_dir.exists():
         raise ValueError(f"{work_items_dir}: directory not found")
 
     table_refs: List[TokenRef] = []
     migration_refs: List[TokenRef] = []
+    field_refs: List[TokenRef] = []
 
     work_item_paths = sorted(work_items_dir.glob("WI-*.md"))
     if not work_item_paths:
@@ -171,22 +224,40 @@ def parse_work_item_data_changes(
                 value = token.strip()
                 if MIGRATION_ID_RE.match(value):
                     migration_refs.append(
-                        TokenRef(
+                        tables.ref(
                             path=path,
                             line=idx,
                             token=value,
                             source="work-item migration",
                         )
                     )
+                elif MODEL_FIELD_RE.match(value):
+                    field_refs.append(
+                        tables.ref(path=path, line=idx, token=value, source="work-item field")
+                    )
                 else:
                     table_refs.append(
-                        TokenRef(path=path, line=idx, token=value, source="work-item table")
+                        tables.ref(path=path, line=idx, token=value, source="work-item table")
                     )
 
-    return table_refs, migration_refs
+    return table_refs, migration_refs, field_refs
+
+
+def parse_db_doc_field_refs(specs_dir: pathlib.Path, tables: RefTables) -> List[TokenRef]:
+    if not specs_dir.exists():
+        raise ValueError(f"{specs_dir}: directory not found")
+
+    refs: List[TokenRef] = []
+    for path in sorted(specs_dir.glob("*/db.md")):
+        for idx, raw_line in enumerate(read_text(path).splitlines(), start=1):
+            for token in BACKTICK_RE.findall(raw_line):
+                value = token.strip()
+                if MODEL_FIELD_RE.match(value):
+                    refs.append(tables.ref(path=path, line=idx, token=value, source="db.md field"))
+    return refs
 
 
-def parse_contract_migrations(specs_dir: pathlib.Path) -> Tuple[List[TokenRef], List[str]]:
+def parse_contract_migrations(specs_dir: pathlib.Path, tables: RefTables) -> Tuple[List[TokenRef], List[str]]:
     if not specs_dir.exists():
         raise ValueError(f"{specs_dir}: directory not found")
 
@@ -234,7 +305,7 @@ def parse_contract_migrations(specs_dir: pathlib.Path) -> Tuple[List[TokenRef],
 
             line_number = find_line_number(lines, migration_id)
             refs.append(
-                TokenRef(
+                tables.ref(
                     path=path,
                     line=line_number,
                     token=migration_id.strip(),
@@ -245,7 +316,9 @@ def parse_contract_migrations(specs_dir: pathlib.Path) -> Tuple[List[TokenRef],
     return refs, errors
 
 
-def parse_contract_published_events(specs_dir: pathlib.Path) -> Tuple[List[TokenRef], List[str]]:
+def parse_contract_published_events(
+    specs_dir: pathlib.Path, tables: RefTables
+) -> Tuple[List[TokenRef], List[str]]:
     if not specs_dir.exists():
         raise ValueError(f"{specs_dir}: directory not found")
 
@@ -297,7 +370,7 @@ def parse_contract_published_events(specs_dir: pathlib.Path) -> Tuple[List[Token
                 continue
 
             refs.append(
-                TokenRef(
+                tables.ref(
                     path=path,
                     line=find_line_number(lines, name),
                     token=name.strip(),
@@ -308,6 +381,37 @@ def parse_contract_published_events(specs_dir: pathlib.Path) -> Tuple[List[Token
     return refs, errors
 
 
+def parse_doc_path_refs(repo_paths: RepoPaths, tables: RefTables) -> List[TokenRef]:
+    # A backticked token is a path when its first segment is a top-level directory of the
+    # repository; only the first word of a command is kept, and `#anchor` and `:line`
+    # suffixes are dropped.
+    top_level = {directory for directory in repo_paths.directories if "/" not in directory}
+    doc_paths = sorted(
+        path
+        for path in repo_paths.files
+        if path.endswith(".md") and path.split("/", 1)[0] in CROSS_LINK_DOC_ROOTS
+    )
+
+    refs: List[TokenRef] = []
+    for doc in doc_paths:
+        path = pathlib.Path(doc)
+        for idx, raw_line in enumerate(read_text(path).splitlines(), start=1):
+            for token in BACKTICK_RE.findall(raw_line):
+                words = token.split()
+                value = PATH_SUFFIX_RE.sub("", words[0]) if words else ""
+                if "/" in value and value.split("/", 1)[0] in top_level:
+                    refs.append(tables.ref(path=path, line=idx, token=value, source="doc path"))
+    return refs
+
+
+def validate_path_refs(refs: List[TokenRef], repo_paths: RepoPaths) -> List[str]:
+    return [
+        f"{ref.path}:{ref.line}: {ref.source} `{ref.token}` does not exist ({repo_paths.source})"
+        for ref in refs
+        if not repo_paths.exists(ref.token)
+    ]
+
+
 def find_line_number(lines: List[str], token: str) -> int:
     for idx, line in enumerate(lines, start=1):
         if token in line:
@@ -326,25 +430,82 @@ def parse_migration_directories(migrations_dir: pathlib.Path) -> Set[str]:
     return migration_ids
 
 
-def validate_table_refs(refs: List[TokenRef], prisma_models: Set[str]) -> List[str]:
+def validate_work_item_migration_tables(
+    table_refs: List[TokenRef],
+    migration_refs: List[TokenRef],
+    migration_ddl: Dict[str, MigrationDdl],
+    schema: PrismaSchemaIndex,
+) -> List[str]:
+    errors: List[str] = []
+    cited: Dict[int, Set[str]] = {}
+    for ref in migration_refs:
+        if ref.token in migration_ddl:
+            cited.setdefault(ref.path_id, set()).add(ref.token)
+
+    touched_by_path: Dict[int, Set[str]] = {}
+    for path_id, migration_ids in cited.items():
+        touched: Set[str] = set()
+        for migration_id in migration_ids:
+            touched.update(migration_ddl[migration_id].touched_tables())
+        touched_by_path[path_id] = touched
+
+    for ref in table_refs:
+        touched = touched_by_path.get(ref.path_id)
+        if touched is None:
+            continue
+        model = schema.models.get(ref.token)
+        table = model.table if model is not None else ref.token
+        if table not in touched:
+            migrations = ", ".join(sorted(cited[ref.path_id]))
+            errors.append(
+                f"{ref.path}:{ref.line}: {ref.source} `{ref.token}` is not created, altered or referenced "
+                f"by cited migrations ({migrations})"
+            )
+    return errors
+
+
+def validate_table_refs(refs: List[TokenRef], prisma_models: Set[str], tables: RefTables) -> List[str]:
     errors: List[str] = []
+    model_ids = tables.tokens.intern_all(prisma_models)
     for ref in refs:
-        if ref.token not in prisma_models:
+        if ref.token_id not in model_ids:
             errors.append(
                 f"{ref.path}:{ref.line}: {ref.source} `{ref.token}` is not a Prisma model in prisma/schema.prisma"
             )
     return errors
 
 
-def validate_migration_refs(refs: List[TokenRef], migration_ids: Set[str]) -> List[str]:
+def validate_field_refs(refs: List[TokenRef], schema: PrismaSchemaIndex) -> List[str]:
     errors: List[str] = []
     for ref in refs:
-        if not MIGRATION_ID_RE.match(ref.token):
+        model, _dot, field_name = ref.token.partition(".")
+        if model not in schema.models:
+            errors.append(
+                f"{ref.path}:{ref.line}: {ref.source} `{ref.token}` references unknown Prisma model `{model}`"
+            )
+        elif schema.field_of(model, field_name) is None:
+            errors.append(
+                f"{ref.path}:{ref.line}: {ref.source} `{ref.token}` is not a field of Prisma model `{model}` "
+                f"(prisma/schema.prisma:{schema.models[model].start_line})"
+            )
+    return errors
+
+
+def validate_migration_refs(refs: List[TokenRef], migration_ids: Set[str], tables: RefTables) -> List[str]:
+    errors: List[str] = []
+    known_ids = tables.tokens.intern_all(migration_ids)
+    well_formed_ids = {
+        token_id
+        for token_id in {ref.token_id for ref in refs}
+        if MIGRATION_ID_RE.match(tables.tokens.value(token_id))
+    }
+    for ref in refs:
+        if ref.token_id not in well_formed_ids:
             errors.append(
                 f"{ref.path}:{ref.line}: {ref.source} `{ref.token}` must match migration id format YYYYMMDDNNNN_description"
             )
             continue
-        if ref.token not in migration_ids:
+        if ref.token_id not in known_ids:
             errors.append(
                 f"{ref.path}:{ref.line}: {ref.source} `{ref.token}` not found in prisma/migrations/"
             )
@@ -352,28 +513,29 @@ def validate_migration_refs(refs: List[TokenRef], migration_ids: Set[str]) -> Li
 
 
 def validate_migration_cross_reference(
-    contract_refs: List[TokenRef], work_item_refs: List[TokenRef], migration_ids: Set[str]
+    contract_refs: List[TokenRef], work_item_refs: List[TokenRef], migration_ids: Set[str], tables: RefTables
 ) -> List[str]:
     errors: List[str] = []
 
-    contract_ids = {ref.token for ref in contract_refs}
-    work_item_ids = {ref.token for ref in work_item_refs}
+    contract_ids = {ref.token_id for ref in contract_refs}
+    work_item_ids = {ref.token_id for ref in work_item_refs}
+    directory_ids = tables.tokens.intern_all(migration_ids)
 
-    missing_in_work_items = sorted(contract_ids - work_item_ids)
+    missing_in_work_items = tables.tokens.values(contract_ids - work_item_ids)
     if missing_in_work_items:
         errors.append(
             "Migration IDs referenced in contracts but missing in work-items: "
             + ", ".join(missing_in_work_items)
         )
 
-    missing_in_contracts = sorted(work_item_ids - contract_ids)
+    missing_in_contracts = tables.tokens.values(work_item_ids - contract_ids)
     if missing_in_contracts:
         errors.append(
             "Migration IDs referenced in work-items but missing in contracts: "
             + ", ".join(missing_in_contracts)
         )
 
-    unreferenced_migrations = sorted(migration_ids - contract_ids - work_item_ids)
+    unreferenced_migrations = tables.tokens.values(directory_ids - contract_ids - work_item_ids)
     if unreferenced_migrations:
         errors.append(
             "Migration directories not referenced by contracts/work-items: "
@@ -384,12 +546,12 @@ def validate_migration_cross_reference(
 
 
 def validate_event_refs_against_runtime(
-    refs: List[TokenRef], runtime_events: Set[str], allowlist: Set[str] | None = None
+    refs: List[TokenRef], runtime_events: Set[str], tables: RefTables, allowlist: Set[str] | None = None
 ) -> List[str]:
     errors: List[str] = []
-    allowed = allowlist or set()
+    allowed_ids = tables.tokens.intern_all(runtime_events) | tables.tokens.intern_all(allowlist or set())
     for ref in refs:
-        if ref.token in runtime_events or ref.token in allowed:
+        if ref.token_id in allowed_ids:
             continue
         errors.append(
             f"{ref.path}:{ref.line}: {ref.source} `{ref.token}` is not defined in runtime domainEventNames"
@@ -398,20 +560,24 @@ def validate_event_refs_against_runtime(
 
 
 def validate_runtime_event_coverage(
-    runtime_events: Set[str], contract_event_refs: List[TokenRef], ownership_event_refs: List[TokenRef]
+    runtime_events: Set[str],
+    contract_event_refs: List[TokenRef],
+    ownership_event_refs: List[TokenRef],
+    tables: RefTables,
 ) -> List[str]:
     errors: List[str] = []
-    contract_events = {ref.token for ref in contract_event_refs}
-    ownership_events = {ref.token for ref in ownership_event_refs}
+    runtime_ids = tables.tokens.intern_all(runtime_events)
+    contract_events = {ref.token_id for ref in contract_event_refs}
+    ownership_events = {ref.token_id for ref in ownership_event_refs}
 
-    missing_in_contracts = sorted(runtime_events - contract_events)
+    missing_in_contracts = tables.tokens.values(runtime_ids - contract_events)
     if missing_in_contracts:
         errors.append(
             "Runtime domain events missing from contract published event definitions: "
             + ", ".join(missing_in_contracts)
         )
 
-    missing_in_ownership = sorted(runtime_events - ownership_events)
+    missing_in_ownership = tables.tokens.values(runtime_ids - ownership_events)
     if missing_in_ownership:
         errors.append(
             "Runtime domain events missing from docs/data-ownership published events: "
@@ -422,12 +588,49 @@ def validate_runtime_event_coverage(
 
 
 def main() -> int:
-    errors: List[str] = []
+    parser = argparse.ArgumentParser(description="Cross-check docs, work items, contracts, Prisma and migrations.")
+    add_report_arguments(parser)
+    args = parser.parse_args()
+    reporter = Reporter("traceability", args.format, args.max_errors)
 
+    cached = False
     try:
-        prisma_models = parse_prisma_models(pathlib.Path("prisma/schema.prisma"))
+        cached = run_checks(reporter)
+    except ErrorBudgetExhausted:
+        pass
+
+    # A cached pass still closes the stream, so --format sarif always writes a full log.
+    if reporter.finish("Traceability checks failed:"):
+        return 1
+
+    if not cached:
+        reporter.note("Traceability checks passed.")
+    return 0
+
+
+def run_checks(reporter: Reporter) -> bool:
+    # Doc path targets live anywhere in the tree, so they are resolved against one file
+    # listing on every run, cached or not.
+    tables = RefTables()
+    repo_paths = load_repo_paths()
+    path_errors = validate_path_refs(parse_doc_path_refs(repo_paths, tables), repo_paths)
+
+    # Every rule cross-references several inputs, so only a fully unchanged input set is skipped.
+    input_state = TreeSkip("check_traceability", TRACEABILITY_INPUTS, [str(path) for path in CHECKER_SOURCES])
+    if input_state.unchanged() and not path_errors:
+        reporter.note(f"Traceability checks passed (cached: {input_state.root_oids()}).")
+        return True
+
+    reporter.extend("doc-paths", path_errors)
+
+    try:
+        prisma_schema = load_prisma_schema(pathlib.Path("prisma/schema.prisma"))
+        prisma_models = set(prisma_schema.models)
+        if not prisma_models:
+            raise ValueError("prisma/schema.prisma: no Prisma models found")
     except ValueError as exc:
-        errors.append(str(exc))
+        reporter.add("inputs", str(exc))
+        prisma_schema = PrismaSchemaIndex()
         prisma_models = set()
 
     try:
@@ -435,84 +638,100 @@ def main() -> int:
             pathlib.Path("src/features/shared/domain-event-publisher.ts")
         )
     except ValueError as exc:
-        errors.append(str(exc))
+        reporter.add("inputs", str(exc))
         runtime_domain_events = set()
 
     try:
-        ownership_table_refs = parse_data_ownership_tables(pathlib.Path("docs/data-ownership.md"))
+        ownership_table_refs = parse_data_ownership_tables(pathlib.Path("docs/data-ownership.md"), tables)
     except ValueError as exc:
-        errors.append(str(exc))
+        reporter.add("inputs", str(exc))
         ownership_table_refs = []
 
     try:
-        ownership_event_refs = parse_data_ownership_event_refs(pathlib.Path("docs/data-ownership.md"))
+        ownership_event_refs = parse_data_ownership_event_refs(pathlib.Path("docs/data-ownership.md"), tables)
     except ValueError as exc:
-        errors.append(str(exc))
+        reporter.add("inputs", str(exc))
         ownership_event_refs = []
 
     try:
-        work_item_table_refs, work_item_migration_refs = parse_work_item_data_changes(
-            pathlib.Path("work-items")
+        work_item_table_refs, work_item_migration_refs, work_item_field_refs = parse_work_item_data_changes(
+            pathlib.Path("work-items"), tables
         )
     except ValueError as exc:
-        errors.append(str(exc))
+        reporter.add("inputs", str(exc))
         work_item_table_refs = []
         work_item_migration_refs = []
+        work_item_field_refs = []
+
+    try:
+        db_doc_field_refs = parse_db_doc_field_refs(pathlib.Path("specs"), tables)
+    except ValueError as exc:
+        reporter.add("inputs", str(exc))
+        db_doc_field_refs = []
 
     try:
-        contract_migration_refs, contract_parse_errors = parse_contract_migrations(pathlib.Path("specs"))
-        errors.extend(contract_parse_errors)
+        contract_migration_refs, contract_parse_errors = parse_contract_migrations(pathlib.Path("specs"), tables)
+        reporter.extend("migrations", contract_parse_errors)
     except ValueError as exc:
-        errors.append(str(exc))
+        reporter.add("inputs", str(exc))
         contract_migration_refs = []
 
     try:
-        contract_event_refs, contract_event_errors = parse_contract_published_events(pathlib.Path("specs"))
-        errors.extend(contract_event_errors)
+        contract_event_refs, contract_event_errors = parse_contract_published_events(pathlib.Path("specs"), tables)
+        reporter.extend("events", contract_event_errors)
     except ValueError as exc:
-        errors.append(str(exc))
+        reporter.add("inputs", str(exc))
         contract_event_refs = []
 
     try:
         migration_ids = parse_migration_directories(pathlib.Path("prisma/migrations"))
+        migration_ddl = load_migration_ddl(pathlib.Path("prisma/migrations"))
     except ValueError as exc:
-        errors.append(str(exc))
+        reporter.add("inputs", str(exc))
         migration_ids = set()
+        migration_ddl = {}
 
     if prisma_models:
-        errors.extend(validate_table_refs(ownership_table_refs, prisma_models))
-        errors.extend(validate_table_refs(work_item_table_refs, prisma_models))
+        reporter.extend("tables", validate_table_refs(ownership_table_refs, prisma_models, tables))
+        reporter.extend("tables", validate_table_refs(work_item_table_refs, prisma_models, tables))
+        reporter.extend("fields", validate_field_refs(work_item_field_refs, prisma_schema))
+        reporter.extend("fields", validate_field_refs(db_doc_field_refs, prisma_schema))
 
     if migration_ids:
-        errors.extend(validate_migration_refs(contract_migration_refs, migration_ids))
-        errors.extend(validate_migration_refs(work_item_migration_refs, migration_ids))
-        errors.extend(
+        reporter.extend("migrations", validate_migration_refs(contract_migration_refs, migration_ids, tables))
+        reporter.extend("migrations", validate_migration_refs(work_item_migration_refs, migration_ids, tables))
+        reporter.extend(
+            "migrations",
             validate_migration_cross_reference(
-                contract_migration_refs, work_item_migration_refs, migration_ids
-            )
+                contract_migration_refs, work_item_migration_refs, migration_ids, tables
+            ),
+        )
+        reporter.extend(
+            "migrations",
+            validate_work_item_migration_tables(
+                work_item_table_refs, work_item_migration_refs, migration_ddl, prisma_schema
+            ),
         )
 
     if runtime_domain_events:
-        errors.extend(validate_event_refs_against_runtime(contract_event_refs, runtime_domain_events))
-        errors.extend(
+        reporter.extend(
+            "events",
+            validate_event_refs_against_runtime(contract_event_refs, runtime_domain_events, tables),
+        )
+        reporter.extend(
+            "events",
             validate_event_refs_against_runtime(
-                ownership_event_refs, runtime_domain_events, PROCESS_EVENT_ALLOWLIST
-            )
+                ownership_event_refs, runtime_domain_events, tables, PROCESS_EVENT_ALLOWLIST
+            ),
         )
-        errors.extend(
-            validate_runtime_event_coverage(
-                runtime_domain_events, contract_event_refs, ownership_event_refs
-            )
+        reporter.extend(
+            "events",
+            validate_runtime_event_coverage(runtime_domain_events, contract_event_refs, ownership_event_refs, tables),
         )
 
-    if errors:
-        print("Traceability checks failed:")
-        for error in errors:
-            print(f"- {error}")
-        return 1
-
-    print("Traceability checks passed.")
-    return 0
+    if not reporter.errors:
+        input_state.record_pass()
+    return False
 
 
 if __name__ == "__main__":
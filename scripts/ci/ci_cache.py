@@ -0,0 +1,67 @@
+import hashlib
+import json
+import os
+import pathlib
+from typing import Any, Dict, Optional
+
+
+CACHE_DIR_ENV = "FLOWHR_CI_CACHE_DIR"
+CACHE_DISABLE_ENV = "FLOWHR_CI_CACHE"
+DEFAULT_CACHE_DIR = pathlib.Path(".ci-cache")
+
+
+def content_hash(*parts: str) -> str:
+    digest = hashlib.sha256()
+    for part in parts:
+        digest.update(part.encode("utf-8"))
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+def cache_root() -> Optional[pathlib.Path]:
+    if os.environ.get(CACHE_DISABLE_ENV, "").lower() in ("0", "off", "false"):
+        return None
+    return pathlib.Path(os.environ.get(CACHE_DIR_ENV) or DEFAULT_CACHE_DIR)
+
+
+# JSON values keyed by content hash. Entries are immutable for a given key, so
+# a corrupt or concurrently written entry is simply treated as a miss.
+class ContentCache:
+    def __init__(self, namespace: str, root: Optional[pathlib.Path] = None) -> None:
+        base = root if root is not None else cache_root()
+        self.directory = base / namespace if base is not None else None
+        self._memory: Dict[str, Any] = {}
+
+    @classmethod
+    def in_memory(cls, namespace: str) -> "ContentCache":
+        cache = cls(namespace)
+        cache.directory = None
+        return cache
+
+    def get(self, key: str) -> Optional[Any]:
+        if key in self._memory:
+            return self._memory[key]
+        if self.directory is None:
+            return None
+
+        path = self.directory / f"{key}.json"
+        try:
+            value = json.loads(path.read_text(encoding="utf-8"))
+        except Exception:
+            return None
+        self._memory[key] = value
+        return value
+
+    def put(self, key: str, value: Any) -> None:
+        self._memory[key] = value
+        if self.directory is None:
+            return
+
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            temp_path = self.directory / f"{key}.{os.getpid()}.tmp"
+            temp_path.write_text(json.dumps(value, sort_keys=True), encoding="utf-8")
+            os.replace(temp_path, self.directory / f"{key}.json")
+        except OSError:
+            # Caching is best-effort; a read-only checkout must not fail the check.
+            pass
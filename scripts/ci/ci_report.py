@@ -0,0 +1,127 @@
+import argparse
+import json
+import re
+import sys
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Optional, TextIO
+
+
+FORMATS = ("text", "jsonl", "sarif")
+SARIF_SCHEMA = "https://json.schemastore.org/sarif-2.1.0.json"
+# "path:line: message" or "path: message"; a path has no spaces and a '/' or '.'.
+LOCATION_RE = re.compile(r"^(?P<path>[^\s:]*[/.][^\s:]*)(?::(?P<line>\d+))?: (?P<message>.+)$", re.DOTALL)
+
+
+@dataclass(frozen=True)
+class Finding:
+    rule: str
+    message: str
+    path: Optional[str] = None
+    line: Optional[int] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"rule": self.rule, "path": self.path, "line": self.line, "message": self.message}
+
+    def to_sarif(self) -> Dict[str, Any]:
+        result: Dict[str, Any] = {"ruleId": self.rule, "level": "error", "message": {"text": self.message}}
+        if self.path:
+            location: Dict[str, Any] = {"artifactLocation": {"uri": self.path}}
+            if self.line:
+                location["region"] = {"startLine": self.line}
+            result["locations"] = [{"physicalLocation": location}]
+        return result
+
+
+class ErrorBudgetExhausted(Exception):
+    # Deliberately not a ValueError/RuntimeError, which checkers catch per input.
+    pass
+
+
+def parse_finding(rule: str, error: str) -> Finding:
+    match = LOCATION_RE.match(error)
+    if match is None:
+        return Finding(rule, error)
+    line = match.group("line")
+    return Finding(rule, match.group("message"), match.group("path"), int(line) if line else None)
+
+
+def add_report_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "--format",
+        choices=FORMATS,
+        default="text",
+        help="text (default), or one finding per line as JSON Lines / a streamed SARIF 2.1.0 log on stdout.",
+    )
+    parser.add_argument(
+        "--max-errors",
+        type=int,
+        default=0,
+        help="Stop the remaining checks after this many findings (0 = no limit).",
+    )
+
+
+class Reporter:
+    def __init__(self, tool: str, fmt: str = "text", max_errors: int = 0, stream: Optional[TextIO] = None) -> None:
+        self.tool = tool
+        self.format = fmt
+        self.max_errors = max(0, max_errors)
+        self.stream = stream if stream is not None else sys.stdout
+        self.errors: List[str] = []
+        self.truncated = False
+        self._started = False
+
+    @property
+    def streaming(self) -> bool:
+        return self.format != "text"
+
+    def note(self, message: str) -> None:
+        # Progress lines stay human-readable; in machine formats they move to stderr.
+        print(message, file=sys.stderr if self.streaming else self.stream)
+
+    def extend(self, rule: str, errors: Iterable[str]) -> None:
+        for error in errors:
+            self.add(rule, error)
+
+    def add(self, rule: str, error: str) -> None:
+        self.errors.append(error)
+        if self.format == "jsonl":
+            self.stream.write(json.dumps(parse_finding(f"{self.tool}/{rule}", error).to_dict()) + "\n")
+            self.stream.flush()
+        elif self.format == "sarif":
+            self._write_sarif_result(parse_finding(f"{self.tool}/{rule}", error))
+        if self.max_errors and len(self.errors) >= self.max_errors:
+            self.truncated = True
+            raise ErrorBudgetExhausted()
+
+    def _open_sarif(self) -> None:
+        # The log is streamed: header and an open results array first, each result as it
+        # arrives, and the closing brackets in finish().
+        header = json.dumps(
+            {"version": "2.1.0", "$schema": SARIF_SCHEMA, "runs": [{"tool": {"driver": {"name": self.tool}}}]}
+        )
+        self.stream.write(header[: -len("}]}")] + ', "results": [')
+        self._started = True
+
+    def _write_sarif_result(self, finding: Finding) -> None:
+        if self._started:
+            self.stream.write(",")
+        else:
+            self._open_sarif()
+        self.stream.write("\n" + json.dumps(finding.to_sarif()))
+        self.stream.flush()
+
+    def finish(self, failure_title: str) -> int:
+        if self.format == "sarif":
+            if not self._started:
+                self._open_sarif()
+            self.stream.write("\n]}]}\n")
+            self.stream.flush()
+        if self.truncated:
+            self.note(f"Stopped after {len(self.errors)} findings (--max-errors {self.max_errors}).")
+        if not self.errors:
+            return 0
+        if not self.streaming:
+            print(failure_title, file=self.stream)
+            for error in self.errors:
+                print(f"- {error}", file=self.stream)
+        return 1
@@ -0,0 +1,41 @@
+import pathlib
+import re
+from dataclasses import dataclass
+from typing import List
+
+
+BACKTICK_RE = re.compile(r"`([^`]+)`")
+
+
+@dataclass(frozen=True)
+class OwnedTable:
+    path: pathlib.Path
+    line: int
+    token: str
+
+
+# Stdlib only, so checkers that need the ownership table do not pull in PyYAML.
+def parse_owned_tables(path: pathlib.Path) -> List[OwnedTable]:
+    if not path.exists():
+        raise ValueError(f"{path}: file not found")
+
+    refs: List[OwnedTable] = []
+    lines = path.read_text(encoding="utf-8").splitlines()
+
+    for idx, raw_line in enumerate(lines, start=1):
+        line = raw_line.strip()
+        if not line.startswith("|"):
+            continue
+        if line.startswith("| ---"):
+            continue
+
+        cells = [cell.strip() for cell in line.strip("|").split("|")]
+        if len(cells) < 4:
+            continue
+        if cells[0].lower() == "domain":
+            continue
+
+        for token in BACKTICK_RE.findall(cells[1]):
+            refs.append(OwnedTable(path=path, line=idx, token=token.strip()))
+
+    return refs
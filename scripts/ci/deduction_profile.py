@@ -0,0 +1,157 @@
+from collections import OrderedDict
+from dataclasses import dataclass
+from decimal import Decimal, InvalidOperation
+from typing import Any, Callable, Dict, List, Sequence, Tuple
+
+from pay_kernel import INT64_MAX, column_peak, int64_columns, np
+
+
+# Profile rates are stored as DECIMAL(5, 4) (prisma/schema.prisma), so they are exact
+# integers at RATE_SCALE and every deduction is integer arithmetic.
+RATE_SCALE = 10_000
+DEFAULT_PROFILE_CACHE_SIZE = 64
+PHASE2_AMOUNT_KEYS = (
+    "withholdingTaxKrw",
+    "socialInsuranceKrw",
+    "otherDeductionsKrw",
+    "totalDeductionsKrw",
+    "netPayKrw",
+)
+
+Evaluator = Callable[[Sequence[int]], "DeductionColumns"]
+
+
+def scale_rate(value: Any, name: str) -> int:
+    if isinstance(value, bool):
+        raise ValueError(f"{name} must be a number")
+    try:
+        scaled = Decimal(str(value)) * RATE_SCALE
+    except InvalidOperation as exc:
+        raise ValueError(f"{name} must be a number") from exc
+    if not 0 <= scaled <= RATE_SCALE or scaled != scaled.to_integral_value():
+        raise ValueError(f"{name}={value} must be between 0 and 1 with at most 4 decimal places")
+    return int(scaled)
+
+
+@dataclass(frozen=True)
+class DeductionProfile:
+    profile_id: str
+    version: int
+    withholding_rate: int
+    social_insurance_rate: int
+    fixed_other_deduction_krw: int
+
+
+@dataclass
+class DeductionColumns:
+    withholding_tax_krw: List[int]
+    social_insurance_krw: List[int]
+    other_deductions_krw: List[int]
+    total_deductions_krw: List[int]
+    net_pay_krw: List[int]
+
+    def row(self, idx: int) -> Dict[str, int]:
+        columns = (
+            self.withholding_tax_krw,
+            self.social_insurance_krw,
+            self.other_deductions_krw,
+            self.total_deductions_krw,
+            self.net_pay_krw,
+        )
+        return {key: column[idx] for key, column in zip(PHASE2_AMOUNT_KEYS, columns)}
+
+    def negative_net_pay_rows(self) -> List[int]:
+        # deduction-profile.md: the preview is rejected when netPayKrw < 0.
+        return [idx for idx, net in enumerate(self.net_pay_krw) if net < 0]
+
+
+def parse_profile(raw: Any, field: str = "deduction_profile") -> DeductionProfile:
+    if not isinstance(raw, dict):
+        raise ValueError(f"{field} must be an object")
+    profile_id = raw.get("profile_id")
+    if not isinstance(profile_id, str) or not profile_id.strip():
+        raise ValueError(f"{field}.profile_id must be a non-empty string")
+    version = raw.get("profile_version")
+    if not isinstance(version, int) or isinstance(version, bool) or version <= 0:
+        raise ValueError(f"{field}.profile_version must be a positive integer")
+    fixed = raw.get("fixed_other_deduction_krw", 0)
+    if not isinstance(fixed, int) or isinstance(fixed, bool) or fixed < 0:
+        raise ValueError(f"{field}.fixed_other_deduction_krw must be a non-negative integer")
+    return DeductionProfile(
+        profile_id=profile_id,
+        version=version,
+        withholding_rate=scale_rate(raw.get("withholding_rate", 0), f"{field}.withholding_rate"),
+        social_insurance_rate=scale_rate(raw.get("social_insurance_rate", 0), f"{field}.social_insurance_rate"),
+        fixed_other_deduction_krw=fixed,
+    )
+
+
+def compile_profile(profile: DeductionProfile) -> Evaluator:
+    # round(gross * rate) from deduction-profile.md, half-up on non-negative integers.
+    withholding_rate = profile.withholding_rate
+    social_rate = profile.social_insurance_rate
+    fixed = profile.fixed_other_deduction_krw
+    half = RATE_SCALE // 2
+
+    def evaluate(gross_pay_krw: Sequence[int]) -> DeductionColumns:
+        arrays = int64_columns(gross_pay_krw)
+        if arrays is not None and column_peak(arrays[0]) * RATE_SCALE + half <= INT64_MAX:
+            (gross,) = arrays
+            withholding = (gross * withholding_rate + half) // RATE_SCALE
+            social = (gross * social_rate + half) // RATE_SCALE
+            total = withholding + social + fixed
+            return DeductionColumns(
+                withholding.tolist(),
+                social.tolist(),
+                [fixed] * len(gross),
+                total.tolist(),
+                (gross - total).tolist(),
+            )
+
+        withholding = [(gross * withholding_rate + half) // RATE_SCALE for gross in gross_pay_krw]
+        social = [(gross * social_rate + half) // RATE_SCALE for gross in gross_pay_krw]
+        total = [tax + insurance + fixed for tax, insurance in zip(withholding, social)]
+        return DeductionColumns(
+            withholding,
+            social,
+            [fixed] * len(total),
+            total,
+            [gross - deductions for gross, deductions in zip(gross_pay_krw, total)],
+        )
+
+    return evaluate
+
+
+class ProfileCache:
+    def __init__(self, maxsize: int = DEFAULT_PROFILE_CACHE_SIZE) -> None:
+        # (profile_id, version) -> (profile, compiled evaluator), least recently used first.
+        self.entries: "OrderedDict[Tuple[str, int], Tuple[DeductionProfile, Evaluator]]" = OrderedDict()
+        # Every profile seen, kept past eviction so a conflicting redefinition is caught
+        # however far apart the two fixtures are; profiles are a few integers each.
+        self.profiles: Dict[Tuple[str, int], DeductionProfile] = {}
+        self.maxsize = maxsize
+        self.compiled = 0
+
+    def evaluator(self, profile: DeductionProfile) -> Evaluator:
+        key = (profile.profile_id, profile.version)
+        known = self.profiles.setdefault(key, profile)
+        if known != profile:
+            # A policy change must bump the version; same version, different numbers is a data error.
+            raise ValueError(
+                f"deduction profile {profile.profile_id} v{profile.version} has conflicting rates; "
+                "bump profile_version when the policy changes"
+            )
+        entry = self.entries.get(key)
+        if entry is not None:
+            self.entries.move_to_end(key)
+            return entry[1]
+
+        evaluate = compile_profile(profile)
+        self.compiled += 1
+        self.entries[key] = (profile, evaluate)
+        if len(self.entries) > self.maxsize:
+            self.entries.popitem(last=False)
+        return evaluate
+
+    def evaluate(self, profile: DeductionProfile, gross_pay_krw: Sequence[int]) -> DeductionColumns:
+        return self.evaluator(profile)(gross_pay_krw)
@@ -0,0 +1,750 @@
+#!/usr/bin/env python3
+import argparse
+import hashlib
+import json
+import pathlib
+import pickle
+import random
+import re
+import sys
+import tempfile
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Dict, List, Optional, Sequence, Set, Tuple
+
+import check_golden_fixtures
+from attendance_replay import (
+    DEFAULT_MULTIPLIERS,
+    AttendanceState,
+    ReplayEngine,
+    apply_event,
+    fixture_events,
+    payable_minutes,
+)
+from audit_lifecycle import (
+    AUDIT_LIFECYCLE,
+    CONTRACT_GLOB,
+    DOMAIN_EVENTS_PATH,
+    START,
+    canonical_event,
+    compile_automaton,
+    first_illegal_transitions,
+    read_contract_audit_events,
+    read_domain_event_names,
+)
+from check_golden_fixtures import check_profile_previews, validate_fixture
+from check_pr_template import (
+    ADR_CHECKBOXES,
+    BREAK_GLASS_REQUIRED_FIELDS,
+    BREAK_GLASS_TRIGGER_CHECKBOXES,
+    REQUIRED_CHECKBOXES,
+    checkbox_checked,
+    has_non_empty_field,
+    index_body,
+)
+from deduction_profile import ProfileCache
+from pay_kernel import gross_pay_reference
+
+
+PR_TEMPLATE_PATH = pathlib.Path(".github/PULL_REQUEST_TEMPLATE.md")
+WORK_ITEM_GLOB = "work-items/WI-*.md"
+FIXTURE_GLOB = "qa/golden/fixtures/*.json"
+SCHEMA_PATH = pathlib.Path("contracts/contract.schema.json")
+DEFAULT_CASES = 1000
+# Share of cases that replay a recent input unchanged (warm-cache hits) or mutate it
+# again (stacked mutations) instead of starting from a seed.
+REVISIT_RATE = 0.2
+STACK_RATE = 0.4
+RECENT_CASES = 64
+LISTED_MISMATCHES = 5
+MAX_DETAIL = 400
+PARSED_DOCUMENTS = 256
+
+TEXT_TOKENS = ["`", ":", "-", "[", "]", "x", "X", "#", "##", " ", "\t", "\r", " ", "*", "+", "_", "\\"]
+CHECKBOX_MARKS = ["[x]", "[X]", "[ ]", "[]", "[ x]", "[xx]"]
+EXTRA_LINES = [
+    "",
+    "## Data Changes",
+    "## data changes (draft)",
+    "## Data Changes_v2",
+    "##\tData Changes",
+    "##Data Changes",
+    "### Data Changes",
+    "  ## Notes",
+    "- `Employee.email`",
+    "- `employee.email`",
+    "- `202601010000_add_index`",
+    "- `20260101000000_add_index`",
+    "- `` `Employee` ``",
+    "- `a`b`c`",
+    "- [x] Unit tests",
+    "- [X]  Lint/typecheck  ",
+    "-[x]Regression checks",
+    "- [ ] - [x] Migration smoke",
+    "* [x] P0 outage",
+    "Incident ID: INC-1",
+    "- Incident ID :",
+    "+ Rollback plan: revert",
+    "**Incident ID**: INC-2",
+    "**Human approver:** ",
+    "1. Change scope: api",
+    "> Customer impact: none",
+    "Incident ID: INC-3 Human approver: kim",
+    "Work Item: `work-items/WI-0001-attendance-to-payroll.md`",
+]
+INTERESTING_VALUES: List[Any] = [
+    0, -1, 1, 59, 60, 61, 179, 180, 181, 480, 481, 2**31, 2**63, 1.5, 0.0001, "", " ", None, True, False, [], {}
+]
+TIMESTAMP_RE = re.compile(r"^\d{4}-\d{2}-\d{2}T\d{2}:\d{2}(:\d{2}(\.\d+)?)?(Z|[+-]\d{2}:\d{2})$")
+# Seconds, so the 30-second rounding edge and the 04:00 night window both get hit.
+TIMESTAMP_SHIFTS = [29, 30, 31, -29, -30, -31, 60, 900, -900, 3600, -3600, 4 * 3600, 12 * 3600, 86400, -86400]
+MULTIPLIER_VALUES = [0, 0.5, 1, 1.0, 1.25, 1.5, 2, 2.5, 1.333, 0.001, 3]
+HOURLY_RATES = [0, 1, 9860, 12500, 15000, 60000, 1_000_000]
+
+
+@dataclass
+class FuzzReport:
+    target: str
+    cases: int = 0
+    seconds: float = 0.0
+    failures: int = 0
+    mismatches: List[str] = field(default_factory=list)
+
+    @property
+    def rate(self) -> float:
+        return self.cases / max(self.seconds, 1e-9)
+
+
+def outcome(fn: Callable[..., Any], *args: Any) -> Any:
+    # A crash is an output too; both paths must fail the same way.
+    try:
+        return fn(*args)
+    except Exception as exc:
+        return f"raised {type(exc).__name__}: {exc}"
+
+
+def describe(label: str, fast: Any, reference: Any) -> Optional[str]:
+    if fast == reference:
+        return None
+    return f"{label}: fast={fast!r} reference={reference!r}"[:MAX_DETAIL]
+
+
+def mutate_lines(rng: random.Random, text: str, pool: Sequence[str], rounds: int = 4) -> str:
+    lines = text.split("\n")
+    for _ in range(rng.randint(1, rounds)):
+        if not lines:
+            lines = [""]
+        idx = rng.randrange(len(lines))
+        line = lines[idx]
+        op = rng.randrange(9)
+        if op == 0 and len(lines) > 1:
+            del lines[idx]
+        elif op == 1:
+            lines.insert(idx, line)
+        elif op == 2:
+            other = rng.randrange(len(lines))
+            lines[idx], lines[other] = lines[other], line
+        elif op == 3:
+            lines.insert(idx, rng.choice(pool))
+        elif op == 4:
+            pos = rng.randint(0, len(line))
+            lines[idx] = line[:pos] + rng.choice(TEXT_TOKENS) + line[pos:]
+        elif op == 5 and line:
+            start = rng.randrange(len(line))
+            lines[idx] = line[:start] + line[start + rng.randint(1, 4) :]
+        elif op == 6:
+            mark = next((mark for mark in CHECKBOX_MARKS if mark in line), None)
+            if mark is not None:
+                lines[idx] = line.replace(mark, rng.choice(CHECKBOX_MARKS), 1)
+            else:
+                lines[idx] = line.upper() if rng.random() < 0.5 else line.lower()
+        elif op == 7 and idx + 1 < len(lines):
+            lines[idx : idx + 2] = [line + lines[idx + 1]]
+        elif op == 8:
+            lines[idx] = line + rng.choice(("", " ", "  ", "\t", "\r", " "))
+    return "\n".join(lines)
+
+
+def iter_json_slots(node: Any, slots: List[Tuple[Any, Any]]) -> List[Tuple[Any, Any]]:
+    items = node.items() if isinstance(node, dict) else enumerate(node) if isinstance(node, list) else ()
+    for key, child in items:
+        slots.append((node, key))
+        iter_json_slots(child, slots)
+    return slots
+
+
+def shift_timestamp(rng: random.Random, value: str) -> str:
+    moment = datetime.fromisoformat(value.replace("Z", "+00:00")) + timedelta(seconds=rng.choice(TIMESTAMP_SHIFTS))
+    if rng.random() < 0.2:
+        return moment.astimezone(timezone.utc).isoformat().replace("+00:00", "Z")
+    return moment.isoformat()
+
+
+def mutate_json(rng: random.Random, document: Any, leaves: Sequence[Any], rounds: int = 3) -> Any:
+    for _ in range(rng.randint(1, rounds)):
+        slots = iter_json_slots(document, [])
+        if not slots:
+            return document
+        parent, key = rng.choice(slots)
+        value = parent[key]
+        op = rng.randrange(6)
+        if op == 0:
+            parent[key] = rng.choice(INTERESTING_VALUES if rng.random() < 0.5 else leaves)
+        elif op == 1 and isinstance(value, int) and not isinstance(value, bool):
+            parent[key] = value + rng.choice((-61, -30, -1, 1, 30, 61, value))
+        elif op == 1 and isinstance(value, str) and TIMESTAMP_RE.match(value):
+            parent[key] = shift_timestamp(rng, value)
+        elif op == 2:
+            if isinstance(parent, dict):
+                del parent[key]
+            else:
+                parent.pop(key)
+        elif op == 3 and isinstance(value, list) and value:
+            value.insert(rng.randrange(len(value) + 1), json.loads(json.dumps(rng.choice(value))))
+        elif op == 4 and isinstance(value, list):
+            rng.shuffle(value)
+        elif op == 5 and isinstance(value, str):
+            parent[key] = mutate_lines(rng, value, [str(leaf) for leaf in leaves if isinstance(leaf, str)], rounds=1)
+    return document
+
+
+def json_leaves(documents: Sequence[Any]) -> List[Any]:
+    leaves: List[Any] = []
+    for document in documents:
+        for parent, key in iter_json_slots(document, []):
+            if not isinstance(parent[key], (dict, list)):
+                leaves.append(parent[key])
+    return leaves
+
+
+class PrBodyTarget:
+    name = "pr-body"
+
+    def __init__(self, root: pathlib.Path, workdir: pathlib.Path) -> None:
+        template = (root / PR_TEMPLATE_PATH).read_text(encoding="utf-8")
+        filled = template.replace("[ ]", "[x]")
+        self.seeds = [template, filled]
+        self.pool = sorted(set(template.split("\n"))) + EXTRA_LINES
+        self.labels = REQUIRED_CHECKBOXES + ADR_CHECKBOXES + BREAK_GLASS_TRIGGER_CHECKBOXES
+        self.fields = BREAK_GLASS_REQUIRED_FIELDS + ["Work Item"]
+
+    def mutate(self, rng: random.Random, case: str) -> str:
+        return mutate_lines(rng, case, self.pool)
+
+    def check(self, case: str) -> Optional[str]:
+        index = index_body(case, self.fields)
+        for label in self.labels:
+            mismatch = describe(f"checkbox '{label}'", index.is_checked(label), checkbox_checked(case, label))
+            if mismatch:
+                return mismatch
+        for name in self.fields:
+            mismatch = describe(f"field '{name}'", index.has_value(name), has_non_empty_field(case, name))
+            if mismatch:
+                return mismatch
+        return None
+
+
+def backtick_tokens(line: str) -> List[str]:
+    tokens: List[str] = []
+    pos = 0
+    while True:
+        start = line.find("`", pos)
+        end = line.find("`", start + 1) if start >= 0 else -1
+        if end < 0:
+            return tokens
+        if end == start + 1:
+            pos = end
+            continue
+        tokens.append(line[start + 1 : end])
+        pos = end + 1
+
+
+def is_level2_heading(line: str) -> bool:
+    return line.startswith("##") and len(line) > 2 and line[2].isspace()
+
+
+def is_data_changes_heading(line: str) -> bool:
+    title = line[2:].lstrip().lower()
+    if not title.startswith("data changes"):
+        return False
+    rest = title[len("data changes") :]
+    return not rest or not (rest[0].isalnum() or rest[0] == "_")
+
+
+def reference_work_item_refs(text: str, migration_re: Any, field_re: Any) -> List[Tuple[int, str, str]]:
+    refs: List[Tuple[int, str, str]] = []
+    lines = text.splitlines()
+    headings = [idx for idx, line in enumerate(lines) if is_level2_heading(line.strip())]
+    for position, start in enumerate(headings):
+        if not is_data_changes_heading(lines[start].strip()):
+            continue
+        end = headings[position + 1] if position + 1 < len(headings) else len(lines)
+        for idx in range(start + 1, end):
+            for token in backtick_tokens(lines[idx]):
+                value = token.strip()
+                if migration_re.match(value):
+                    source = "work-item migration"
+                elif field_re.match(value):
+                    source = "work-item field"
+                else:
+                    source = "work-item table"
+                refs.append((idx + 1, value, source))
+    return refs
+
+
+class WorkItemTarget:
+    name = "work-item"
+
+    def __init__(self, root: pathlib.Path, workdir: pathlib.Path) -> None:
+        # Imported here, like the contract target, because check_traceability needs PyYAML.
+        import check_traceability
+
+        self.traceability = check_traceability
+        self.seeds = [path.read_text(encoding="utf-8") for path in sorted(root.glob(WORK_ITEM_GLOB))]
+        self.pool = sorted({line for seed in self.seeds for line in seed.split("\n")}) + EXTRA_LINES
+        self.directory = workdir / "work-items"
+        self.directory.mkdir()
+        self.path = self.directory / "WI-9000-fuzz.md"
+
+    def mutate(self, rng: random.Random, case: str) -> str:
+        return mutate_lines(rng, case, self.pool)
+
+    def check(self, case: str) -> Optional[str]:
+        self.path.write_text(case, encoding="utf-8")
+
+        def fast() -> List[Tuple[int, str, str]]:
+            tables, migrations, fields = self.traceability.parse_work_item_data_changes(
+                self.directory, self.traceability.RefTables()
+            )
+            return sorted((ref.line, ref.token, ref.source) for ref in tables + migrations + fields)
+
+        # Read back like the checker does, so universal newlines apply to both sides.
+        text = self.path.read_text(encoding="utf-8")
+        patterns = (self.traceability.MIGRATION_ID_RE, self.traceability.MODEL_FIELD_RE)
+        reference = outcome(lambda: sorted(reference_work_item_refs(text, *patterns)))
+        return describe("data change refs", outcome(fast), reference)
+
+
+def reference_first_illegal(
+    alphabet: Set[str], successors: Dict[str, Set[str]], sequence: Sequence[str]
+) -> int:
+    allowed = successors.get(START, set())
+    for idx, name in enumerate(sequence):
+        event = canonical_event(name)
+        if event not in alphabet or event not in allowed:
+            return idx
+        allowed = successors.get(event, set())
+    return -1
+
+
+class AuditTarget:
+    name = "audit"
+    batch = 8
+
+    def __init__(self, root: pathlib.Path, workdir: pathlib.Path) -> None:
+        names = read_domain_event_names(root / DOMAIN_EVENTS_PATH)
+        for path in sorted(root.glob(CONTRACT_GLOB)):
+            names.extend(read_contract_audit_events(path))
+        self.automaton = compile_automaton(names)
+        self.alphabet = {canonical_event(name) for name in names}
+        self.successors = {
+            key if key == START else canonical_event(key): {canonical_event(name) for name in following}
+            for key, following in AUDIT_LIFECYCLE.items()
+        }
+        # Contract, domain-event and misspelled forms of the same names.
+        self.spellings = sorted(set(names)) + [
+            "payroll.deductions.calculated.v1",
+            " attendance.recorded ",
+            "attendance_recorded",
+            "Attendance.Recorded",
+            "payroll.calculated.v2",
+            "unknown.event",
+        ]
+        sequences = [
+            json.loads(path.read_text(encoding="utf-8")).get("expected", {}).get("audit_events", [])
+            for path in sorted(root.glob(FIXTURE_GLOB))
+        ]
+        self.seeds = [
+            json.dumps(sequences[start : start + self.batch]) for start in range(0, len(sequences), self.batch)
+        ]
+
+    def mutate(self, rng: random.Random, case: str) -> str:
+        batch = json.loads(case)
+        for _ in range(rng.randint(1, 4)):
+            if not batch or rng.random() < 0.2:
+                batch.append(list(batch[rng.randrange(len(batch))]) if batch else [])
+                continue
+            sequence = batch[rng.randrange(len(batch))]
+            op = rng.randrange(4)
+            idx = rng.randrange(len(sequence) + 1)
+            if op == 0 or not sequence:
+                sequence.insert(idx, rng.choice(self.spellings))
+            elif op == 1:
+                del sequence[min(idx, len(sequence) - 1)]
+            elif op == 2:
+                sequence[min(idx, len(sequence) - 1)] = rng.choice(self.spellings)
+            else:
+                other = rng.randrange(len(sequence))
+                idx = min(idx, len(sequence) - 1)
+                sequence[idx], sequence[other] = sequence[other], sequence[idx]
+        return json.dumps(batch)
+
+    def check(self, case: str) -> Optional[str]:
+        batch = json.loads(case)
+        fast = first_illegal_transitions(self.automaton, batch)
+        reference = [reference_first_illegal(self.alphabet, self.successors, sequence) for sequence in batch]
+        return describe("first illegal transitions", fast, reference)
+
+
+def reference_replay(inputs: Dict[str, Any]) -> Tuple[AttendanceState, Dict[str, int], int]:
+    # Every event applied from scratch, minutes recomputed, gross pay through Decimal.
+    state = AttendanceState()
+    for event in fixture_events(inputs):
+        state = apply_event(state, event)
+    minutes = payable_minutes(state)
+    rate = inputs.get("hourly_rate_krw")
+    if not isinstance(rate, int) or isinstance(rate, bool) or rate < 0:
+        raise ValueError("hourly_rate_krw must be a non-negative integer")
+    raw_multipliers = inputs.get("multipliers") if isinstance(inputs.get("multipliers"), dict) else {}
+    return state, minutes, gross_pay_reference(minutes, rate, {**DEFAULT_MULTIPLIERS, **raw_multipliers})
+
+
+class ReplayTarget:
+    name = "replay"
+
+    def __init__(self, root: pathlib.Path, workdir: pathlib.Path) -> None:
+        payloads = [json.loads(path.read_text(encoding="utf-8")) for path in sorted(root.glob(FIXTURE_GLOB))]
+        self.seeds = [
+            json.dumps(payload["inputs"])
+            for payload in payloads
+            if payload.get("kind", check_golden_fixtures.DEFAULT_FIXTURE_KIND) == "attendance_payroll"
+        ]
+        self.engine = ReplayEngine()
+
+    def mutate(self, rng: random.Random, case: str) -> str:
+        inputs = json.loads(case)
+        for _ in range(rng.randint(1, 3)):
+            op = rng.randrange(6)
+            if op == 0:
+                stamps = [
+                    (parent, key)
+                    for parent, key in iter_json_slots(inputs, [])
+                    if isinstance(parent[key], str) and TIMESTAMP_RE.match(parent[key])
+                ]
+                if stamps:
+                    parent, key = rng.choice(stamps)
+                    parent[key] = shift_timestamp(rng, parent[key])
+            elif op == 1:
+                holder = rng.choice([inputs, inputs.get("original"), inputs.get("retroactive_update")])
+                if isinstance(holder, dict):
+                    holder["break_minutes"] = rng.choice((0, 30, 60, 90, 600, rng.randint(0, 900)))
+            elif op == 2:
+                inputs["is_holiday"] = not inputs.get("is_holiday", False)
+            elif op == 3:
+                inputs["hourly_rate_krw"] = rng.choice(HOURLY_RATES + [rng.randint(0, 100_000)])
+            elif op == 4:
+                multipliers = inputs.setdefault("multipliers", dict(DEFAULT_MULTIPLIERS))
+                multipliers[rng.choice(sorted(DEFAULT_MULTIPLIERS))] = rng.choice(MULTIPLIER_VALUES)
+            else:
+                retroactive = inputs.get("retroactive_update")
+                if isinstance(retroactive, dict):
+                    retroactive["approved"] = not retroactive.get("approved", True)
+                else:
+                    inputs.pop("approved_correction", None)
+        return json.dumps(inputs)
+
+    def check(self, case: str) -> Optional[str]:
+        inputs = json.loads(case)
+
+        def fast() -> Tuple[AttendanceState, Dict[str, int], int]:
+            result = self.engine.evaluate(inputs)
+            return result.state, result.payable_minutes, result.gross_pay_krw
+
+        return describe("replayed attendance", outcome(fast), outcome(reference_replay, inputs))
+
+
+def version_profile(document: Any) -> None:
+    # The profile cache requires a version bump for every rate change, so each distinct
+    # profile gets its own version; reusing one is a data error, not a cache bug.
+    inputs = document.get("inputs") if isinstance(document, dict) else None
+    profile = inputs.get("deduction_profile") if isinstance(inputs, dict) else None
+    if not isinstance(profile, dict):
+        return
+    version = profile.get("profile_version")
+    if isinstance(version, int) and not isinstance(version, bool) and version > 0:
+        rates = json.dumps({key: value for key, value in profile.items() if key != "profile_version"}, sort_keys=True)
+        profile["profile_version"] = 1 + int(hashlib.sha256(rates.encode("utf-8")).hexdigest()[:12], 16)
+
+
+class FixtureTarget:
+    name = "fixture"
+
+    def __init__(self, root: pathlib.Path, workdir: pathlib.Path) -> None:
+        documents = [json.loads(path.read_text(encoding="utf-8")) for path in sorted(root.glob(FIXTURE_GLOB))]
+        self.seeds = [json.dumps(document, indent=2) for document in documents]
+        self.leaves = json_leaves(documents)
+        self.path = workdir / "GC-900-fuzz.json"
+        # Warm across cases, like the module-level caches over a full fixture run.
+        self.engine = ReplayEngine()
+        self.profiles = ProfileCache()
+
+    def mutate(self, rng: random.Random, case: str) -> str:
+        try:
+            document = json.loads(case)
+        except ValueError:
+            return mutate_lines(rng, case, EXTRA_LINES)
+        if rng.random() < 0.05:
+            text = mutate_lines(rng, case, EXTRA_LINES, rounds=1)
+            try:
+                document = json.loads(text)
+            except ValueError:
+                return text
+        else:
+            document = mutate_json(rng, document, self.leaves)
+        version_profile(document)
+        return json.dumps(document, indent=2)
+
+    def validate(self, engine: ReplayEngine, profiles: ProfileCache) -> List[str]:
+        saved = check_golden_fixtures.REPLAY_ENGINE
+        check_golden_fixtures.REPLAY_ENGINE = engine
+        try:
+            previews: List[Any] = []
+            errors = validate_fixture(self.path, set(), [], previews)
+            return errors + check_profile_previews(previews, profiles)
+        finally:
+            check_golden_fixtures.REPLAY_ENGINE = saved
+
+    def check(self, case: str) -> Optional[str]:
+        self.path.write_text(case, encoding="utf-8")
+        fast = outcome(self.validate, self.engine, self.profiles)
+        return describe("fixture errors", fast, outcome(self.validate, ReplayEngine(), ProfileCache()))
+
+
+class ContractTarget:
+    name = "contract"
+
+    def __init__(self, root: pathlib.Path, workdir: pathlib.Path) -> None:
+        # Imported here so the other targets run where PyYAML/jsonschema are not installed.
+        import check_contracts
+        import structural_diff
+        from ci_cache import ContentCache, content_hash
+
+        self.contracts = check_contracts
+        self.structural = structural_diff
+        self.content_cache = ContentCache
+        self.content_hash = content_hash
+        self.validator = check_contracts.load_schema(root / SCHEMA_PATH)
+        self.parse_yaml = check_contracts.load_yaml
+        self.seeds = []
+        self.originals: Dict[str, Tuple[Any, Any]] = {}
+        for contract_path in sorted(root.glob("specs/*/contract.yaml")):
+            api_path = contract_path.parent / "api.yaml"
+            case = {
+                "domain": contract_path.parent.name,
+                "contract": contract_path.read_text(encoding="utf-8"),
+                "api": api_path.read_text(encoding="utf-8") if api_path.exists() else None,
+            }
+            self.seeds.append(json.dumps(case))
+            self.originals[case["domain"]] = (
+                check_contracts.load_yaml(case["contract"], str(contract_path)),
+                check_contracts.load_yaml(case["api"], str(api_path)) if case["api"] is not None else None,
+            )
+        self.pool = sorted(
+            {line for seed in self.seeds for text in json.loads(seed).values() if text for line in text.split("\n")}
+        )
+        self.directory = workdir / "specs" / "fuzz"
+        self.directory.mkdir(parents=True)
+        self.openapi = ContentCache.in_memory("openapi")
+        self.parsed: Dict[Tuple[str, str], bytes] = {}
+        self.current_domain = ""
+
+    def load_yaml(self, content: str, label: str) -> Dict[str, Any]:
+        # PyYAML dominates a case and is not under test: each document is parsed once, and
+        # every caller still gets its own copy to mutate.
+        key = (content, label)
+        if key not in self.parsed:
+            if len(self.parsed) >= PARSED_DOCUMENTS:
+                self.parsed.clear()
+            try:
+                self.parsed[key] = pickle.dumps(self.parse_yaml(content, label))
+            except ValueError as exc:
+                self.parsed[key] = pickle.dumps(exc)
+        value = pickle.loads(self.parsed[key])
+        if isinstance(value, ValueError):
+            raise value
+        return value
+
+    def mutate(self, rng: random.Random, case: str) -> str:
+        document = json.loads(case)
+        key = "api" if document["api"] is not None and rng.random() < 0.5 else "contract"
+        document[key] = mutate_lines(rng, document[key], self.pool)
+        return json.dumps(document)
+
+    def lint(self, cache: Any) -> List[str]:
+        saved = self.contracts.OPENAPI_CACHE, self.contracts.load_yaml
+        self.contracts.OPENAPI_CACHE, self.contracts.load_yaml = cache, self.load_yaml
+        try:
+            return self.contracts.lint_contract_file(self.directory / "contract.yaml", self.validator)
+        finally:
+            self.contracts.OPENAPI_CACHE, self.contracts.load_yaml = saved
+
+    def structural_changes(self, old: Any, new_text: str, document: str, cached: bool) -> List[Any]:
+        label = str(self.directory / ("api.yaml" if document == "openapi" else "contract.yaml"))
+        new = self.load_yaml(new_text, label)
+        if not cached:
+            return self.structural.classify_diff(old, new, document)
+        # Seeds are keyed by domain, mutants by content, the way check_versioning keys blobs.
+        return self.structural.classify_trees(
+            self.structural.document_tree(old, document, f"seed:{self.current_domain}"),
+            self.structural.document_tree(new, document, self.content_hash(new_text)),
+            document,
+        )
+
+    def check(self, case: str) -> Optional[str]:
+        document = json.loads(case)
+        self.current_domain = document["domain"]
+        (self.directory / "contract.yaml").write_text(document["contract"], encoding="utf-8")
+        api_path = self.directory / "api.yaml"
+        if document["api"] is None:
+            api_path.unlink(missing_ok=True)
+        else:
+            api_path.write_text(document["api"], encoding="utf-8")
+
+        fast = outcome(self.lint, self.openapi)
+        mismatch = describe("contract lint", fast, outcome(self.lint, self.content_cache.in_memory("openapi")))
+        if mismatch:
+            return mismatch
+
+        old_contract, old_api = self.originals[document["domain"]]
+        pairs = (("contract", old_contract, document["contract"]), ("openapi", old_api, document["api"]))
+        for kind, old, text in pairs:
+            if old is None or text is None:
+                continue
+            mismatch = describe(
+                f"{kind} structural diff",
+                outcome(self.structural_changes, old, text, kind, True),
+                outcome(self.structural_changes, old, text, kind, False),
+            )
+            if mismatch:
+                return mismatch
+        return None
+
+
+TARGETS = {
+    target.name: target
+    for target in (PrBodyTarget, WorkItemTarget, AuditTarget, ReplayTarget, FixtureTarget, ContractTarget)
+}
+
+
+def run_target(
+    target: Any,
+    rng: random.Random,
+    cases: int,
+    seconds: float = 0.0,
+    artifacts: Optional[pathlib.Path] = None,
+) -> FuzzReport:
+    report = FuzzReport(target.name)
+    recent: List[str] = []
+    started = time.perf_counter()
+    deadline = started + seconds if seconds > 0 else None
+    while (cases <= 0 or report.cases < cases) and (deadline is None or time.perf_counter() < deadline):
+        roll = rng.random()
+        if recent and roll < REVISIT_RATE:
+            case = rng.choice(recent)
+        else:
+            base = rng.choice(recent) if recent and roll < REVISIT_RATE + STACK_RATE else rng.choice(target.seeds)
+            case = target.mutate(rng, base)
+
+        mismatch = target.check(case)
+        report.cases += 1
+        if mismatch:
+            report.failures += 1
+            if len(report.mismatches) < LISTED_MISMATCHES:
+                report.mismatches.append(mismatch)
+                if artifacts is not None:
+                    artifacts.mkdir(parents=True, exist_ok=True)
+                    (artifacts / f"{target.name}-{report.failures}.txt").write_text(case, encoding="utf-8")
+
+        if len(recent) < RECENT_CASES:
+            recent.append(case)
+        else:
+            recent[rng.randrange(RECENT_CASES)] = case
+    report.seconds = time.perf_counter() - started
+    return report
+
+
+def run_targets(
+    names: List[str],
+    root: pathlib.Path,
+    seed: int,
+    cases: int,
+    seconds: float = 0.0,
+    artifacts: Optional[pathlib.Path] = None,
+) -> List[FuzzReport]:
+    reports: List[FuzzReport] = []
+    with tempfile.TemporaryDirectory(prefix="flowhr-fuzz-") as scratch:
+        for name in names:
+            workdir = pathlib.Path(scratch) / name
+            workdir.mkdir()
+            target = TARGETS[name](root, workdir)
+            reports.append(run_target(target, random.Random(f"{seed}:{name}"), cases, seconds, artifacts))
+    return reports
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Differential fuzzing of checker fast paths (caches, indexes, compiled tables) "
+        "against reference paths."
+    )
+    parser.add_argument(
+        "--targets", default=",".join(TARGETS), help=f"Comma-separated subset of: {', '.join(TARGETS)}."
+    )
+    parser.add_argument(
+        "--cases", type=int, help=f"Cases per target (default {DEFAULT_CASES}, or no limit with --seconds)."
+    )
+    parser.add_argument("--seconds", type=float, default=0.0, help="Time budget per target (0 = no limit).")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--root", default=".", help="Repository root the seed inputs are read from.")
+    parser.add_argument("--artifacts", help="Directory to write inputs that produced a mismatch.")
+    return parser.parse_args()
+
+
+def main() -> int:
+    args = parse_args()
+    names = [name.strip() for name in args.targets.split(",") if name.strip()]
+    unknown = [name for name in names if name not in TARGETS]
+    if unknown:
+        print(f"Unknown fuzz target(s): {', '.join(unknown)} (expected {', '.join(TARGETS)})")
+        return 2
+    cases = args.cases if args.cases is not None else 0 if args.seconds > 0 else DEFAULT_CASES
+    if cases <= 0 and args.seconds <= 0:
+        print("--cases 0 needs a --seconds budget")
+        return 2
+
+    reports = run_targets(
+        names,
+        pathlib.Path(args.root),
+        args.seed,
+        cases,
+        args.seconds,
+        pathlib.Path(args.artifacts) if args.artifacts else None,
+    )
+    failed = False
+    for report in reports:
+        print(
+            f"{report.target}: {report.cases} cases in {report.seconds:.2f}s "
+            f"({report.rate:.0f}/s), {report.failures} mismatches"
+        )
+        for mismatch in report.mismatches:
+            print(f"- {mismatch}")
+        failed = failed or report.failures > 0
+    if failed:
+        print(f"Fast and reference paths disagree (seed {args.seed}).")
+        return 1
+    print("Fast and reference paths agree.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
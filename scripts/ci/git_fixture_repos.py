@@ -0,0 +1,167 @@
+import getpass
+import hashlib
+import os
+import pathlib
+import shutil
+import stat
+import subprocess
+import tempfile
+import uuid
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Dict, Iterator, List, Optional, Tuple
+
+
+# Scenario repos are content-addressed under one shared root, so every test process
+# (and every later session on the same machine) reuses a repo built once.
+FIXTURE_ROOT_ENV = "FLOWHR_GIT_FIXTURES"
+TMPFS_DIRS = ("/dev/shm",)
+COMMITTER = "ci <ci@example.com>"
+# Fixed timestamps keep commit OIDs stable, which keeps the repo digest stable.
+EPOCH = 1767225600
+# Checkers shell out to git with the inherited environment; user config such as
+# diff.renames=false must not change what a scenario diff looks like.
+ISOLATED_GIT_ENV = {"GIT_CONFIG_NOSYSTEM": "1", "GIT_CONFIG_GLOBAL": os.devnull}
+
+
+@dataclass
+class Commit:
+    tag: str
+    message: str
+    files: Dict[str, Optional[str]] = field(default_factory=dict)  # None deletes the path
+    renames: List[Tuple[str, str]] = field(default_factory=list)
+    parent: Optional[str] = None  # tag of an earlier commit; defaults to the previous one
+
+
+def quote_path(path: str) -> str:
+    escaped = path.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n").replace("\t", "\\t")
+    return f'"{escaped}"'
+
+
+def data_block(text: str) -> bytes:
+    payload = text.encode("utf-8")
+    return b"data %d\n" % len(payload) + payload + b"\n"
+
+
+def commit_block(commit: Commit, mark: int, parent: int, ref: str = "refs/heads/main") -> bytes:
+    out = [f"commit {ref}\nmark :{mark}\ncommitter {COMMITTER} {EPOCH + mark * 60} +0000\n".encode()]
+    out.append(data_block(commit.message))
+    if parent:
+        out.append(f"from :{parent}\n".encode())
+    # Renames first, so a scenario can rename a file and edit it in the same commit.
+    for old_path, new_path in commit.renames:
+        out.append(f"R {quote_path(old_path)} {quote_path(new_path)}\n".encode())
+    for path, content in sorted(commit.files.items()):
+        if content is None:
+            out.append(f"D {quote_path(path)}\n".encode())
+        else:
+            out.append(f"M 100644 inline {quote_path(path)}\n".encode())
+            out.append(data_block(content))
+    out.append(b"\n")
+    return b"".join(out)
+
+
+def fast_import_stream(commits: List[Commit]) -> bytes:
+    marks: Dict[str, int] = {}
+    out: List[bytes] = []
+    for mark, commit in enumerate(commits, start=1):
+        if commit.tag in marks:
+            raise ValueError(f"duplicate scenario tag '{commit.tag}'")
+        if commit.parent is not None and commit.parent not in marks:
+            raise ValueError(f"{commit.tag}: parent '{commit.parent}' must be an earlier commit")
+        parent = marks[commit.parent] if commit.parent is not None else mark - 1
+        out.append(commit_block(commit, mark, parent))
+        out.append(f"reset refs/tags/{commit.tag}\nfrom :{mark}\n\n".encode())
+        marks[commit.tag] = mark
+    return b"".join(out)
+
+
+def build_repo(stream: bytes, path: pathlib.Path) -> None:
+    env = {**os.environ, **ISOLATED_GIT_ENV}
+    subprocess.run(["git", "init", "-q", "--bare", str(path)], check=True, capture_output=True, env=env)
+    proc = subprocess.run(["git", "fast-import", "--quiet"], input=stream, cwd=path, capture_output=True, env=env)
+    if proc.returncode != 0:
+        raise RuntimeError(f"git fast-import failed: {proc.stderr.decode('utf-8', 'replace').strip()}")
+
+
+def make_read_only(root: pathlib.Path) -> None:
+    # Shared by every process; a test that writes into a scenario repo should fail loudly.
+    for current, dirs, files in os.walk(root):
+        for name in files:
+            target = os.path.join(current, name)
+            os.chmod(target, os.stat(target).st_mode & ~(stat.S_IWUSR | stat.S_IWGRP | stat.S_IWOTH))
+    for current, _dirs, _files in os.walk(root, topdown=False):
+        os.chmod(current, os.stat(current).st_mode & ~(stat.S_IWUSR | stat.S_IWGRP | stat.S_IWOTH))
+
+
+def fixture_root() -> pathlib.Path:
+    configured = os.environ.get(FIXTURE_ROOT_ENV)
+    if configured:
+        return pathlib.Path(configured)
+    base = next((path for path in TMPFS_DIRS if os.access(path, os.W_OK)), tempfile.gettempdir())
+    return pathlib.Path(base) / f"flowhr-git-fixtures-{getpass.getuser()}"
+
+
+def shared_repo(name: str, commits: List[Commit]) -> pathlib.Path:
+    stream = fast_import_stream(commits)
+    target = fixture_root() / f"{name}-{hashlib.sha256(stream).hexdigest()[:16]}.git"
+    if target.is_dir():
+        return target
+
+    target.parent.mkdir(parents=True, exist_ok=True)
+    staging = target.parent / f".{target.name}.{os.getpid()}.{uuid.uuid4().hex}"
+    try:
+        build_repo(stream, staging)
+        make_read_only(staging)
+        # Atomic publish: a process that loses the race finds the winner's repo in place.
+        os.rename(staging, target)
+    except OSError:
+        if not target.is_dir():
+            raise
+    finally:
+        if staging.exists():
+            for current, _dirs, _files in os.walk(staging):
+                os.chmod(current, 0o755)
+            shutil.rmtree(staging, ignore_errors=True)
+    return target
+
+
+@contextmanager
+def inside(repo: pathlib.Path) -> Iterator[pathlib.Path]:
+    # Checkers resolve revisions against the working directory, as they do in CI.
+    original_cwd = os.getcwd()
+    original_env = {key: os.environ.get(key) for key in ISOLATED_GIT_ENV}
+    os.environ.update(ISOLATED_GIT_ENV)
+    os.chdir(repo)
+    try:
+        yield repo
+    finally:
+        os.chdir(original_cwd)
+        for key, value in original_env.items():
+            if value is None:
+                os.environ.pop(key, None)
+            else:
+                os.environ[key] = value
+
+
+@contextmanager
+def checkout(repo: pathlib.Path, tag: str) -> Iterator[pathlib.Path]:
+    # Scenario repos are bare and read-only; checkers that read the working tree run
+    # inside a throwaway clone that borrows the shared objects.
+    env = {**os.environ, **ISOLATED_GIT_ENV}
+    with tempfile.TemporaryDirectory(prefix="flowhr-checkout-") as temp_dir:
+        target = pathlib.Path(temp_dir) / repo.stem
+        subprocess.run(
+            ["git", "clone", "-q", "--shared", "--no-checkout", str(repo), str(target)],
+            check=True,
+            capture_output=True,
+            env=env,
+        )
+        subprocess.run(["git", "checkout", "-q", "--detach", tag], cwd=target, check=True, capture_output=True, env=env)
+        with inside(target):
+            yield target
+
+
+def rev(tag: str) -> str:
+    proc = subprocess.run(["git", "rev-parse", f"{tag}^{{commit}}"], capture_output=True, text=True, check=True)
+    return proc.stdout.strip()
@@ -0,0 +1,285 @@
+import pathlib
+import subprocess
+import tempfile
+import threading
+from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
+from typing import BinaryIO, Callable, Dict, Iterator, List, Optional, Tuple, TypeVar
+
+
+RANGE_SEPARATOR = ".."
+DIFF_READ_SIZE = 64 * 1024
+
+T = TypeVar("T")
+
+
+@dataclass(frozen=True)
+class DiffEntry:
+    status: str  # A, C, D, M, R, T; renames and copies carry a score, e.g. R100
+    path: str
+    old_path: Optional[str] = None
+
+
+def iter_nul_fields(stream: BinaryIO, read_size: int = DIFF_READ_SIZE) -> Iterator[str]:
+    # read1 returns whatever the pipe has, so fields are yielded while git is still writing.
+    read = getattr(stream, "read1", stream.read)
+    pending = b""
+    while True:
+        chunk = read(read_size)
+        if not chunk:
+            break
+        *fields, pending = (pending + chunk).split(b"\0")
+        for field in fields:
+            yield field.decode("utf-8", "surrogateescape")
+    if pending:
+        yield pending.decode("utf-8", "surrogateescape")
+
+
+def parse_name_status_z(fields: Iterator[str]) -> Iterator[DiffEntry]:
+    # `--name-status -z`: STATUS NUL PATH NUL, or STATUS NUL OLD NUL NEW NUL for R/C.
+    # Paths are never quoted, so tabs and newlines in names survive.
+    fields = iter(fields)
+    for status in fields:
+        if not status:
+            continue
+        path = next(fields, None)
+        if path is None:
+            raise RuntimeError(f"git diff -z output ended after status '{status}'")
+        if status[0] in "RC":
+            new_path = next(fields, None)
+            if new_path is None:
+                raise RuntimeError(f"git diff -z output ended inside {status} {path}")
+            yield DiffEntry(status, new_path, path)
+        else:
+            yield DiffEntry(status, path)
+
+
+def stream_diff_entries(
+    base: str, head: str, diff_filter: str, pathspecs: List[str], cwd: Optional[str] = None
+) -> Iterator[DiffEntry]:
+    # stderr goes to a file: only stdout is drained while entries stream, so a pipe
+    # could fill up and block git.
+    with tempfile.TemporaryFile() as stderr:
+        proc = subprocess.Popen(
+            ["git", "diff", "--name-status", "-z", f"--diff-filter={diff_filter}", base, head, "--", *pathspecs],
+            stdout=subprocess.PIPE,
+            stderr=stderr,
+            cwd=cwd,
+        )
+        assert proc.stdout is not None
+        try:
+            yield from parse_name_status_z(iter_nul_fields(proc.stdout))
+            proc.wait()
+        finally:
+            # A consumer that stops early must not leave git blocked on a full pipe.
+            if proc.returncode is None:
+                proc.kill()
+                proc.wait()
+            proc.stdout.close()
+        if proc.returncode != 0:
+            stderr.seek(0)
+            raise RuntimeError(f"git diff failed: {stderr.read().decode('utf-8', 'replace').strip()}")
+
+
+class BlobCache:
+    # OID -> content, shared by the per-worker stores of one map_ranges call so a blob
+    # two ranges touch is read once. Blobs are immutable, so a racing second read
+    # stores the same content.
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._blobs: Dict[str, str] = {}
+
+    def get(self, oid: str) -> Optional[str]:
+        with self._lock:
+            return self._blobs.get(oid)
+
+    def put(self, oid: str, content: str) -> None:
+        with self._lock:
+            self._blobs.setdefault(oid, content)
+
+
+# Shared across the ranges one worker evaluates: `<commit>:<path>` lookups resolve to
+# blob OIDs via `git cat-file --batch-check`, and each blob is read once by OID.
+class GitObjectStore:
+    def __init__(self, cwd: Optional[str] = None, blobs: Optional[BlobCache] = None) -> None:
+        self._cwd = cwd
+        self._lock = threading.Lock()
+        self._check_proc: Optional[subprocess.Popen] = None
+        self._batch_proc: Optional[subprocess.Popen] = None
+        self._commits: Dict[str, Optional[str]] = {}
+        self._paths: Dict[Tuple[str, str], Optional[str]] = {}
+        self._blobs = blobs if blobs is not None else BlobCache()
+        self._diffs: Dict[Tuple[str, str, str, Tuple[str, ...]], List[DiffEntry]] = {}
+        self._diff_locks: Dict[Tuple[str, str, str, Tuple[str, ...]], threading.Lock] = {}
+        self.blob_reads = 0
+        self.diff_runs = 0
+
+    def __enter__(self) -> "GitObjectStore":
+        return self
+
+    def __exit__(self, *_exc: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        with self._lock:
+            for proc in (self._check_proc, self._batch_proc):
+                if proc is None:
+                    continue
+                if proc.stdin is not None:
+                    proc.stdin.close()
+                proc.wait()
+                if proc.stdout is not None:
+                    proc.stdout.close()
+            self._check_proc = None
+            self._batch_proc = None
+
+    def _spawn(self, mode: str) -> subprocess.Popen:
+        return subprocess.Popen(
+            ["git", "cat-file", mode],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            cwd=self._cwd,
+        )
+
+    def _query_header(self, spec: str) -> Optional[Tuple[str, str, int]]:
+        # Caller holds self._lock.
+        if self._check_proc is None:
+            self._check_proc = self._spawn("--batch-check")
+        assert self._check_proc.stdin is not None and self._check_proc.stdout is not None
+        self._check_proc.stdin.write(spec.encode("utf-8") + b"\n")
+        self._check_proc.stdin.flush()
+        header = self._check_proc.stdout.readline().decode("utf-8").rstrip("\n")
+        parts = header.split(" ")
+        if len(parts) != 3 or parts[1] == "missing":
+            return None
+        return parts[0], parts[1], int(parts[2])
+
+    def _read_blob(self, oid: str) -> str:
+        # Caller holds self._lock.
+        if self._batch_proc is None:
+            self._batch_proc = self._spawn("--batch")
+        assert self._batch_proc.stdin is not None and self._batch_proc.stdout is not None
+        self._batch_proc.stdin.write(oid.encode("ascii") + b"\n")
+        self._batch_proc.stdin.flush()
+        header = self._batch_proc.stdout.readline().decode("utf-8").split(" ")
+        size = int(header[2])
+        content = self._batch_proc.stdout.read(size)
+        self._batch_proc.stdout.read(1)
+        self.blob_reads += 1
+        return content.decode("utf-8")
+
+    def resolve_commit(self, rev: str) -> Optional[str]:
+        with self._lock:
+            if rev not in self._commits:
+                header = self._query_header(f"{rev}^{{commit}}")
+                self._commits[rev] = header[0] if header else None
+            return self._commits[rev]
+
+    def show(self, rev: str, path: str) -> Optional[str]:
+        commit = self.resolve_commit(rev)
+        if commit is None:
+            return None
+
+        with self._lock:
+            key = (commit, path)
+            if key not in self._paths:
+                header = self._query_header(f"{commit}:{path}")
+                self._paths[key] = header[0] if header and header[1] == "blob" else None
+            oid = self._paths[key]
+            if oid is None:
+                return None
+            content = self._blobs.get(oid)
+            if content is None:
+                content = self._read_blob(oid)
+                self._blobs.put(oid, content)
+            return content
+
+    def diff_entries(self, base: str, head: str, diff_filter: str, pathspecs: List[str]) -> List[DiffEntry]:
+        base_commit = self.resolve_commit(base) or base
+        head_commit = self.resolve_commit(head) or head
+        key = (base_commit, head_commit, diff_filter, tuple(pathspecs))
+
+        with self._lock:
+            if key in self._diffs:
+                return self._diffs[key]
+            key_lock = self._diff_locks.setdefault(key, threading.Lock())
+
+        # Per-key lock lets unrelated diffs run concurrently while identical
+        # requests from sibling ranges wait for the first one to finish.
+        with key_lock:
+            with self._lock:
+                if key in self._diffs:
+                    return self._diffs[key]
+
+            entries = list(stream_diff_entries(base_commit, head_commit, diff_filter, pathspecs, cwd=self._cwd))
+            with self._lock:
+                self.diff_runs += 1
+                self._diffs[key] = entries
+            return entries
+
+
+def map_ranges(
+    check: Callable[[str, str, GitObjectStore], T],
+    ranges: List[Tuple[str, str]],
+    workers: int,
+    cwd: Optional[str] = None,
+) -> List[T]:
+    # One store (and cat-file pair) per worker thread: a single shared store serialises
+    # every lookup behind its lock, so extra workers would only add contention. Blob
+    # contents are shared, so only commit and path lookups repeat across workers.
+    local = threading.local()
+    blobs = BlobCache()
+    stores: List[GitObjectStore] = []
+    stores_lock = threading.Lock()
+
+    def worker_store() -> GitObjectStore:
+        store = getattr(local, "store", None)
+        if store is None:
+            store = local.store = GitObjectStore(cwd, blobs)
+            with stores_lock:
+                stores.append(store)
+        return store
+
+    try:
+        with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+            return list(pool.map(lambda pair: check(pair[0], pair[1], worker_store()), ranges))
+    finally:
+        for store in stores:
+            store.close()
+
+
+def parse_ranges(content: str, label: str) -> List[Tuple[str, str]]:
+    ranges: List[Tuple[str, str]] = []
+    for idx, raw in enumerate(content.splitlines(), start=1):
+        line = raw.split("#", 1)[0].strip()
+        if not line:
+            continue
+
+        parts = line.split()
+        if len(parts) == 1:
+            base, _sep, head = line.partition(RANGE_SEPARATOR)
+        elif len(parts) == 2:
+            base, head = parts
+        else:
+            base, head = "", ""
+
+        if not base or not head or RANGE_SEPARATOR in base or head.startswith("."):
+            raise ValueError(f"{label}:{idx}: expected '<base>..<head>' or '<base> <head>'")
+        ranges.append((base, head))
+
+    if not ranges:
+        raise ValueError(f"{label}: no ranges found")
+    return ranges
+
+
+def read_ranges_file(path: pathlib.Path) -> List[Tuple[str, str]]:
+    try:
+        content = path.read_text(encoding="utf-8")
+    except Exception as exc:
+        raise ValueError(f"{path}: failed to read ranges file ({exc})") from exc
+    return parse_ranges(content, str(path))
+
+
+def format_range(base: str, head: str) -> str:
+    return f"{base[:7]}..{head[:7]}"
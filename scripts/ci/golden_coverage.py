@@ -0,0 +1,128 @@
+import pathlib
+import re
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+from tree_state import TreeSkip
+
+
+COVERAGE_SOURCE_GLOBS = ("specs/**/test-cases.md", "specs/**/contract.yaml")
+FIXTURE_FILE_RE = re.compile(r"\bGC-\d{3}[A-Za-z0-9_.-]*\.json\b")
+FIXTURE_RANGE_RE = re.compile(r"\bGC-(\d{3})\b`?\s*(?:through|to|\.\.|–)\s*`?GC-(\d{3})\b")
+FIXTURE_ID_RE = re.compile(r"\bGC-(\d{3})\b")
+
+# (line, kind, value): kind is "file" (a fixture filename), "range" ("GC-001..GC-006")
+# or "id" ("GC-004"); stored as JSON lists in the result cache.
+SpecRef = Tuple[int, str, str]
+
+
+@dataclass
+class CoverageIndex:
+    # fixture filename -> "spec:line" locations citing it, by name, id or range.
+    by_fixture: Dict[str, List[str]] = field(default_factory=dict)
+    # "spec:line" -> fixture filenames cited there.
+    by_location: Dict[str, List[str]] = field(default_factory=dict)
+    dangling: List[str] = field(default_factory=list)
+
+    def orphans(self) -> List[str]:
+        return sorted(name for name, locations in self.by_fixture.items() if not locations)
+
+
+def fixture_id(name: str) -> Optional[str]:
+    match = FIXTURE_ID_RE.match(name)
+    return match.group(0) if match else None
+
+
+def scan_spec_refs(text: str) -> List[SpecRef]:
+    # Filenames first, then ranges, then bare ids, each blanked out once matched so
+    # `GC-004-holiday-overtime.json` is not also counted as the id GC-004.
+    refs: List[SpecRef] = []
+    for line_no, line in enumerate(text.splitlines(), start=1):
+        if "GC-" not in line:
+            continue
+        for match in FIXTURE_FILE_RE.finditer(line):
+            refs.append((line_no, "file", match.group(0)))
+        line = FIXTURE_FILE_RE.sub(" ", line)
+        for match in FIXTURE_RANGE_RE.finditer(line):
+            refs.append((line_no, "range", f"GC-{match.group(1)}..GC-{match.group(2)}"))
+        line = FIXTURE_RANGE_RE.sub(" ", line)
+        for match in FIXTURE_ID_RE.finditer(line):
+            refs.append((line_no, "id", match.group(0)))
+    return refs
+
+
+def build_coverage_index(
+    fixture_root: str, fixture_names: List[str], spec_refs: Dict[str, List[SpecRef]]
+) -> CoverageIndex:
+    index = CoverageIndex(by_fixture={name: [] for name in fixture_names})
+    names_by_id: Dict[str, List[str]] = {}
+    for name in fixture_names:
+        ident = fixture_id(name)
+        if ident is not None:
+            names_by_id.setdefault(ident, []).append(name)
+
+    for spec in sorted(spec_refs):
+        for line, kind, value in spec_refs[spec]:
+            location = f"{spec}:{line}"
+            if kind == "file":
+                targets = [value] if value in index.by_fixture else []
+                if not targets:
+                    index.dangling.append(f"{location}: cites golden fixture {value}, which is not in {fixture_root}")
+            elif kind == "range":
+                first, _sep, last = value.partition("..")
+                low, high = int(first[3:]), int(last[3:])
+                if low > high:
+                    index.dangling.append(f"{location}: golden fixture range {first} through {last} is empty")
+                    continue
+                targets = []
+                for number in range(low, high + 1):
+                    ident = f"GC-{number:03d}"
+                    if ident in names_by_id:
+                        targets.extend(names_by_id[ident])
+                    else:
+                        index.dangling.append(
+                            f"{location}: golden fixture range {first} through {last} includes {ident}, "
+                            f"which is not in {fixture_root}"
+                        )
+            else:
+                targets = names_by_id.get(value, [])
+                if not targets:
+                    index.dangling.append(f"{location}: cites golden fixture {value}, which is not in {fixture_root}")
+
+            for name in targets:
+                if location not in index.by_fixture[name]:
+                    index.by_fixture[name].append(location)
+                    index.by_location.setdefault(location, []).append(name)
+    return index
+
+
+def coverage_sources(root: pathlib.Path = pathlib.Path(".")) -> List[pathlib.Path]:
+    return sorted({path for pattern in COVERAGE_SOURCE_GLOBS for path in root.glob(pattern)})
+
+
+def load_spec_refs(sources: List[pathlib.Path], state: TreeSkip) -> Dict[str, List[SpecRef]]:
+    # Specs whose blob OID matches the last passing run reuse their recorded refs.
+    recorded = state.recorded("spec_refs")
+    spec_refs: Dict[str, List[SpecRef]] = {}
+    for path in sources:
+        key = path.as_posix()
+        cached = recorded.get(key)
+        if not state.changed(key) and isinstance(cached, list):
+            spec_refs[key] = [tuple(ref) for ref in cached]  # type: ignore[misc]
+        else:
+            spec_refs[key] = scan_spec_refs(path.read_text(encoding="utf-8"))
+    return spec_refs
+
+
+def check_fixture_coverage(fixture_root: str, fixture_files: List[pathlib.Path], state: TreeSkip) -> List[str]:
+    spec_refs = load_spec_refs(coverage_sources(), state)
+    index = build_coverage_index(fixture_root, [path.name for path in fixture_files], spec_refs)
+
+    errors = list(index.dangling)
+    for name in index.orphans():
+        errors.append(
+            f"{fixture_root}/{name}: golden fixture is not cited by any specs/*/test-cases.md or contract.yaml"
+        )
+    if not errors:
+        state.record_pass(spec_refs={key: [list(ref) for ref in refs] for key, refs in spec_refs.items()})
+    return errors
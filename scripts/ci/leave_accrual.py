@@ -0,0 +1,120 @@
+import operator
+from array import array
+from dataclasses import dataclass
+from typing import Any, Dict, List, Sequence
+
+
+# Defaults from src/features/leave/service.ts.
+DEFAULT_GRANTED_DAYS = 15
+DEFAULT_CARRY_OVER_CAP_DAYS = 5
+BALANCE_FIELDS = ("carry_over_days", "granted_days", "remaining_days")
+
+
+@dataclass(frozen=True)
+class AccrualPolicy:
+    annual_grant_days: int = DEFAULT_GRANTED_DAYS
+    carry_over_cap_days: int = DEFAULT_CARRY_OVER_CAP_DAYS
+    default_granted_days: int = DEFAULT_GRANTED_DAYS
+
+
+@dataclass
+class AccrualLedger:
+    employee_ids: List[str]
+    years: List[int]
+    # One column per settled year, one row per employee, in employee_ids order.
+    carry_over_days: List[array]
+    granted_days: List[array]
+    remaining_days: List[array]
+
+    def balances(self) -> Dict[str, List[Dict[str, int]]]:
+        rows: Dict[str, List[Dict[str, int]]] = {employee_id: [] for employee_id in self.employee_ids}
+        for col, year in enumerate(self.years):
+            columns = zip(self.carry_over_days[col], self.granted_days[col], self.remaining_days[col])
+            for employee_id, (carry, granted, remaining) in zip(self.employee_ids, columns):
+                rows[employee_id].append(
+                    {"year": year, "carry_over_days": carry, "granted_days": granted, "remaining_days": remaining}
+                )
+        return rows
+
+
+def parse_policy(raw: Any) -> AccrualPolicy:
+    raw = raw if isinstance(raw, dict) else {}
+    policy = AccrualPolicy(
+        annual_grant_days=raw.get("annual_grant_days", DEFAULT_GRANTED_DAYS),
+        carry_over_cap_days=raw.get("carry_over_cap_days", DEFAULT_CARRY_OVER_CAP_DAYS),
+        default_granted_days=raw.get("default_granted_days", DEFAULT_GRANTED_DAYS),
+    )
+    for name in ("annual_grant_days", "default_granted_days"):
+        value = getattr(policy, name)
+        if not isinstance(value, int) or isinstance(value, bool) or value <= 0:
+            raise ValueError(f"policy.{name} must be a positive integer")
+    cap = policy.carry_over_cap_days
+    if not isinstance(cap, int) or isinstance(cap, bool) or cap < 0:
+        raise ValueError("policy.carry_over_cap_days must be a non-negative integer")
+    return policy
+
+
+def settle_accruals(
+    employee_ids: List[str],
+    years: List[int],
+    used_days_by_year: Sequence[Sequence[int]],
+    policy: AccrualPolicy,
+) -> AccrualLedger:
+    # Same rules as settleAccrual in the data-access layer, applied to every employee
+    # of a year as one column:
+    #   carry = min(cap, max(0, granted - used)); granted' = grant + carry; used' = 0
+    if any(later <= earlier for earlier, later in zip(years, years[1:])):
+        raise ValueError("settlement years must be strictly increasing (duplicate-year settlement)")
+    if len(used_days_by_year) != len(years):
+        raise ValueError("used days must be provided for every settlement year")
+
+    count = len(employee_ids)
+    cap = policy.carry_over_cap_days
+    grant = policy.annual_grant_days
+    granted = array("q", [policy.default_granted_days]) * count
+    ledger = AccrualLedger(list(employee_ids), list(years), [], [], [])
+
+    for used in used_days_by_year:
+        if len(used) != count:
+            raise ValueError("used days column does not cover every employee")
+        remaining = map(operator.sub, granted, used)
+        carry = array("q", [min(cap, value) if value > 0 else 0 for value in remaining])
+        granted = array("q", [grant + value for value in carry])
+        ledger.carry_over_days.append(carry)
+        ledger.granted_days.append(granted)
+        ledger.remaining_days.append(granted)
+    return ledger
+
+
+def ledger_from_inputs(inputs: Dict[str, Any]) -> AccrualLedger:
+    policy = parse_policy(inputs.get("policy"))
+    years = inputs.get("settlement_years")
+    if not isinstance(years, list) or not years or not all(isinstance(year, int) for year in years):
+        raise ValueError("inputs.settlement_years must be a non-empty array of integers")
+    employees = inputs.get("employees")
+    if not isinstance(employees, list) or not employees:
+        raise ValueError("inputs.employees must be a non-empty array")
+
+    employee_ids: List[str] = []
+    seen = set()
+    columns: List[List[int]] = [[] for _ in years]
+    for idx, employee in enumerate(employees):
+        if not isinstance(employee, dict) or not isinstance(employee.get("employee_id"), str):
+            raise ValueError(f"inputs.employees[{idx}].employee_id must be a string")
+        used = employee.get("used_days")
+        if (
+            not isinstance(used, list)
+            or len(used) != len(years)
+            or not all(isinstance(days, int) and not isinstance(days, bool) and days >= 0 for days in used)
+        ):
+            raise ValueError(
+                f"inputs.employees[{idx}].used_days must list non-negative integers for every settlement year"
+            )
+        if employee["employee_id"] in seen:
+            raise ValueError(f"inputs.employees[{idx}]: duplicate employee_id '{employee['employee_id']}'")
+        seen.add(employee["employee_id"])
+        employee_ids.append(employee["employee_id"])
+        for column, days in zip(columns, used):
+            column.append(days)
+
+    return settle_accruals(employee_ids, years, columns, policy)
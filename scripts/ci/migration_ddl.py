@@ -0,0 +1,304 @@
+import hashlib
+import pathlib
+import re
+from dataclasses import asdict, dataclass, field
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+from ci_cache import ContentCache
+from tree_state import source_fingerprint
+
+
+# Cached scans are only valid for the scanner that produced them.
+SCANNER_VERSION = source_fingerprint([__file__])
+IDENT = r'(?:"?[A-Za-z_][A-Za-z0-9_]*"?\s*\.\s*)?"?([A-Za-z_][A-Za-z0-9_]*)"?'
+CREATE_TABLE_RE = re.compile(rf"\bCREATE\s+TABLE\s+(?:IF\s+NOT\s+EXISTS\s+)?{IDENT}\s*\(", re.IGNORECASE)
+ALTER_TABLE_RE = re.compile(rf"\bALTER\s+TABLE\s+(?:IF\s+EXISTS\s+)?(?:ONLY\s+)?{IDENT}", re.IGNORECASE)
+ADD_COLUMN_RE = re.compile(
+    rf"\bADD\s+(?!(?:CONSTRAINT|PRIMARY|FOREIGN|UNIQUE|CHECK|EXCLUDE)\b)(?:COLUMN\s+)?(?:IF\s+NOT\s+EXISTS\s+)?{IDENT}",
+    re.IGNORECASE,
+)
+DROP_COLUMN_RE = re.compile(rf"\bDROP\s+COLUMN\s+(?:IF\s+EXISTS\s+)?{IDENT}", re.IGNORECASE)
+FOREIGN_KEY_RE = re.compile(
+    rf"\bFOREIGN\s+KEY\s*\(([^)]*)\)\s*REFERENCES\s+{IDENT}", re.IGNORECASE
+)
+RLS_RE = re.compile(r"\b(ENABLE|DISABLE|NO\s+FORCE|FORCE)\s+ROW\s+LEVEL\s+SECURITY\b", re.IGNORECASE)
+DROP_TABLE_RE = re.compile(rf"\bDROP\s+TABLE\s+(?:IF\s+EXISTS\s+)?{IDENT}", re.IGNORECASE)
+DROP_POLICY_RE = re.compile(rf"\bDROP\s+POLICY\s+(?:IF\s+EXISTS\s+)?{IDENT}\s+ON\s+{IDENT}", re.IGNORECASE)
+CREATE_INDEX_RE = re.compile(
+    rf"\bCREATE\s+(?:UNIQUE\s+)?INDEX\s+(?:CONCURRENTLY\s+)?(?:IF\s+NOT\s+EXISTS\s+)?{IDENT}\s+ON\s+(?:ONLY\s+)?{IDENT}",
+    re.IGNORECASE,
+)
+CREATE_POLICY_RE = re.compile(rf"\bCREATE\s+POLICY\s+{IDENT}\s+ON\s+{IDENT}", re.IGNORECASE)
+# `UPDATE` must be followed by SET so `ON UPDATE CASCADE` and `FOR UPDATE` policies do not match.
+DML_RE = re.compile(
+    rf"\b(?:INSERT\s+INTO\s+{IDENT}|DELETE\s+FROM\s+(?:ONLY\s+)?{IDENT}"
+    rf"|UPDATE\s+(?:ONLY\s+)?{IDENT}(?:\s+(?:AS\s+)?[A-Za-z_][A-Za-z0-9_]*)?\s+SET\b)",
+    re.IGNORECASE,
+)
+COLUMN_DEF_RE = re.compile(r'^\s*"?([A-Za-z_][A-Za-z0-9_]*)"?\s+')
+TABLE_CONSTRAINT_WORDS = {"constraint", "primary", "foreign", "unique", "check", "exclude"}
+DOLLAR_TAG_RE = re.compile(r"\$[A-Za-z_]*\$")
+
+
+@dataclass
+class ForeignKeyDdl:
+    columns: List[str]
+    references: str
+
+
+@dataclass
+class TableDdl:
+    created: bool = False
+    altered: bool = False
+    dropped: bool = False
+    referenced: bool = False
+    columns: List[str] = field(default_factory=list)
+    dropped_columns: List[str] = field(default_factory=list)
+    foreign_keys: List[ForeignKeyDdl] = field(default_factory=list)
+    indexes: List[str] = field(default_factory=list)
+    policies: List[str] = field(default_factory=list)
+    dropped_policies: List[str] = field(default_factory=list)
+    # Net effect of this migration only; both false means RLS was left untouched.
+    rls_enabled: bool = False
+    rls_disabled: bool = False
+    rls_forced: bool = False
+
+    def touched(self) -> bool:
+        return (
+            self.created
+            or self.altered
+            or self.dropped
+            or bool(self.indexes or self.policies or self.dropped_policies)
+            or self.referenced
+        )
+
+
+@dataclass
+class MigrationDdl:
+    migration_id: str
+    digest: str = ""
+    tables: Dict[str, TableDdl] = field(default_factory=dict)
+
+    def table(self, name: str) -> TableDdl:
+        return self.tables.setdefault(name, TableDdl())
+
+    def touched_tables(self) -> List[str]:
+        return sorted(name for name, table in self.tables.items() if table.touched())
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, payload: Dict[str, Any]) -> "MigrationDdl":
+        tables: Dict[str, TableDdl] = {}
+        for name, raw in payload["tables"].items():
+            foreign_keys = [ForeignKeyDdl(**item) for item in raw["foreign_keys"]]
+            tables[name] = TableDdl(**{**raw, "foreign_keys": foreign_keys})
+        return cls(migration_id=payload["migration_id"], digest=payload.get("digest", ""), tables=tables)
+
+
+def iter_statements(lines: Iterable[str]) -> Iterator[str]:
+    # Strips comments and string literals and splits on top-level `;` while streaming
+    # lines. Dollar-quoted bodies stay inside their statement but are otherwise scanned
+    # like top-level SQL: DDL inside `DO $$ ... $$` runs for real, and function bodies
+    # rarely contain anything the patterns match.
+    buffer: List[str] = []
+    in_block_comment = False
+    in_string = False
+    dollar_tag: Optional[str] = None
+
+    for line in lines:
+        idx = 0
+        length = len(line)
+        while idx < length:
+            char = line[idx]
+            if in_block_comment:
+                end = line.find("*/", idx)
+                if end < 0:
+                    idx = length
+                    continue
+                in_block_comment = False
+                idx = end + 2
+                continue
+            if in_string:
+                end = line.find("'", idx)
+                if end < 0:
+                    idx = length
+                    continue
+                if line.startswith("''", end):
+                    idx = end + 2
+                    continue
+                in_string = False
+                buffer.append("''")
+                idx = end + 1
+                continue
+
+            if line.startswith("--", idx):
+                break
+            if line.startswith("/*", idx):
+                in_block_comment = True
+                idx += 2
+                continue
+            if char == "'":
+                in_string = True
+                idx += 1
+                continue
+            if char == "$":
+                tag = DOLLAR_TAG_RE.match(line, idx)
+                if tag:
+                    # Only the opening tag closes a body; other tags inside it are text.
+                    if dollar_tag is None:
+                        dollar_tag = tag.group(0)
+                    elif tag.group(0) == dollar_tag:
+                        dollar_tag = None
+                    buffer.append(" ")
+                    idx = tag.end()
+                    continue
+            if char == ";" and dollar_tag is None:
+                statement = "".join(buffer).strip()
+                buffer = []
+                if statement:
+                    yield statement
+                idx += 1
+                continue
+            buffer.append(char)
+            idx += 1
+        buffer.append("\n")
+
+    statement = "".join(buffer).strip()
+    if statement:
+        yield statement
+
+
+def split_top_level(body: str) -> List[str]:
+    parts: List[str] = []
+    depth = 0
+    current: List[str] = []
+    for char in body:
+        if char == "(":
+            depth += 1
+        elif char == ")":
+            if depth == 0:
+                break
+            depth -= 1
+        elif char == "," and depth == 0:
+            parts.append("".join(current))
+            current = []
+            continue
+        current.append(char)
+    parts.append("".join(current))
+    return parts
+
+
+def split_columns(raw: str) -> List[str]:
+    return [item.strip().strip('"') for item in raw.split(",") if item.strip()]
+
+
+def scan_statement(index: MigrationDdl, statement: str) -> None:
+    # Statements arrive in file order, so a later statement overrides an earlier one
+    # and each TableDdl holds the net effect of the migration.
+    for match in DROP_TABLE_RE.finditer(statement):
+        index.tables[match.group(1)] = TableDdl(dropped=True)
+    for match in DROP_POLICY_RE.finditer(statement):
+        table = index.table(match.group(2))
+        if match.group(1) in table.policies:
+            table.policies.remove(match.group(1))
+        # Folding applies drops before creates, so a drop-then-recreate stays present.
+        if match.group(1) not in table.dropped_policies:
+            table.dropped_policies.append(match.group(1))
+
+    for match in CREATE_TABLE_RE.finditer(statement):
+        table = index.table(match.group(1))
+        table.created = True
+        table.dropped = False
+        for element in split_top_level(statement[match.end():]):
+            column = COLUMN_DEF_RE.match(element)
+            if column and column.group(1).lower() not in TABLE_CONSTRAINT_WORDS:
+                table.columns.append(column.group(1))
+
+    alters = list(ALTER_TABLE_RE.finditer(statement))
+    for position, match in enumerate(alters):
+        end = alters[position + 1].start() if position + 1 < len(alters) else len(statement)
+        # A dollar-quoted body keeps its inner statements, so a clause also stops at `;`.
+        semicolon = statement.find(";", match.end(), end)
+        end = semicolon if semicolon >= 0 else end
+        clause = statement[match.end():end]
+        table = index.table(match.group(1))
+        table.altered = True
+        for column in ADD_COLUMN_RE.finditer(clause):
+            table.columns.append(column.group(1))
+        for column in DROP_COLUMN_RE.finditer(clause):
+            table.dropped_columns.append(column.group(1))
+        for rls in RLS_RE.finditer(clause):
+            action = rls.group(1).upper()
+            if action == "ENABLE":
+                table.rls_enabled, table.rls_disabled = True, False
+            elif action == "DISABLE":
+                table.rls_enabled, table.rls_disabled = False, True
+            else:
+                table.rls_forced = action == "FORCE"
+
+    # Foreign keys are attributed to the nearest preceding CREATE/ALTER TABLE.
+    owners = sorted(
+        [(match.start(), match.group(1)) for match in CREATE_TABLE_RE.finditer(statement)]
+        + [(match.start(), match.group(1)) for match in alters]
+    )
+    for match in FOREIGN_KEY_RE.finditer(statement):
+        owner = next((name for start, name in reversed(owners) if start < match.start()), None)
+        target = match.group(2)
+        index.table(target).referenced = True
+        if owner is not None:
+            index.table(owner).foreign_keys.append(ForeignKeyDdl(split_columns(match.group(1)), target))
+
+    for match in CREATE_INDEX_RE.finditer(statement):
+        index.table(match.group(2)).indexes.append(match.group(1))
+    for match in CREATE_POLICY_RE.finditer(statement):
+        table = index.table(match.group(2))
+        if match.group(1) not in table.policies:
+            table.policies.append(match.group(1))
+    for match in DML_RE.finditer(statement):
+        name = next(group for group in match.groups() if group)
+        index.table(name).referenced = True
+
+
+def scan_migration(migration_id: str, lines: Iterable[str]) -> MigrationDdl:
+    index = MigrationDdl(migration_id=migration_id)
+    for statement in iter_statements(lines):
+        scan_statement(index, statement)
+    return index
+
+
+def file_digest(path: pathlib.Path) -> str:
+    digest = hashlib.sha256(SCANNER_VERSION.encode("ascii") + b"\0")
+    with path.open("rb") as handle:
+        for chunk in iter(lambda: handle.read(65536), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def load_migration_ddl(migrations_dir: pathlib.Path, cache: Optional[ContentCache] = None) -> Dict[str, MigrationDdl]:
+    if not migrations_dir.exists():
+        raise ValueError(f"{migrations_dir}: directory not found")
+
+    # Applied migrations are immutable, so each file is scanned once per content hash.
+    cache = cache if cache is not None else ContentCache("migration-ddl")
+    indexes: Dict[str, MigrationDdl] = {}
+    for sql_path in sorted(migrations_dir.glob("*/migration.sql")):
+        migration_id = sql_path.parent.name
+        key = file_digest(sql_path)
+        cached = cache.get(key)
+        if cached is not None:
+            try:
+                indexes[migration_id] = MigrationDdl.from_dict(
+                    {**cached, "migration_id": migration_id, "digest": key}
+                )
+                continue
+            except (KeyError, TypeError):
+                pass
+
+        with sql_path.open(encoding="utf-8") as handle:
+            index = scan_migration(migration_id, handle)
+        index.digest = key
+        cache.put(key, index.to_dict())
+        indexes[migration_id] = index
+    return indexes
@@ -0,0 +1,156 @@
+from dataclasses import dataclass
+from decimal import ROUND_HALF_UP, Decimal, InvalidOperation
+from typing import Any, Dict, List, Mapping, Optional, Sequence
+
+try:
+    import numpy as np  # type: ignore
+except ImportError:  # pragma: no cover - the golden job runs without numpy
+    np = None
+
+
+# Multipliers are fixed-point integers at MULTIPLIER_SCALE; combined premiums
+# (night + overtime - 1, holiday * overtime) are weights at MULTIPLIER_SCALE ** 2.
+MULTIPLIER_SCALE = 1000
+WEIGHT_SCALE = MULTIPLIER_SCALE * MULTIPLIER_SCALE
+DENOMINATOR = 60 * WEIGHT_SCALE
+NIGHT_BASE_CAP_MINUTES = 180
+MINUTE_MS = 60_000
+INT64_MAX = 2**63 - 1
+
+
+def scale_multiplier(value: Any, name: str) -> int:
+    # str() first so a JSON 1.5 becomes Decimal("1.5"), not the binary expansion.
+    if isinstance(value, bool):
+        raise ValueError(f"multipliers.{name} must be a number")
+    try:
+        scaled = Decimal(str(value)) * MULTIPLIER_SCALE
+    except InvalidOperation as exc:
+        raise ValueError(f"multipliers.{name} must be a number") from exc
+    if not scaled.is_finite():
+        raise ValueError(f"multipliers.{name} must be a finite number")
+    if scaled < 0 or scaled != scaled.to_integral_value():
+        raise ValueError(
+            f"multipliers.{name}={value} is not a non-negative multiple of 1/{MULTIPLIER_SCALE}"
+        )
+    return int(scaled)
+
+
+@dataclass(frozen=True)
+class PayWeights:
+    regular: int
+    overtime: int
+    night: int
+    night_overtime: int
+    holiday: int
+    holiday_overtime: int
+
+    @classmethod
+    def from_multipliers(cls, multipliers: Mapping[str, Any]) -> "PayWeights":
+        regular, overtime, night, holiday = (
+            scale_multiplier(multipliers[name], name) for name in ("regular", "overtime", "night", "holiday")
+        )
+        return cls(
+            regular=regular * MULTIPLIER_SCALE,
+            overtime=overtime * MULTIPLIER_SCALE,
+            night=night * MULTIPLIER_SCALE,
+            night_overtime=max(0, night + overtime - MULTIPLIER_SCALE) * MULTIPLIER_SCALE,
+            holiday=holiday * MULTIPLIER_SCALE,
+            holiday_overtime=holiday * overtime,
+        )
+
+    def max_weight(self) -> int:
+        return max(self.regular, self.overtime, self.night, self.night_overtime, self.holiday, self.holiday_overtime)
+
+
+def round_worked_minutes(duration_ms: int) -> int:
+    # SSoT duration rounding: nearest minute, 30 seconds rounds up.
+    return max(0, (duration_ms + MINUTE_MS // 2) // MINUTE_MS)
+
+
+def gross_pay_row(regular: int, overtime: int, night: int, holiday: int, rate: int, weights: PayWeights) -> int:
+    night_base = min(night, NIGHT_BASE_CAP_MINUTES)
+    numerator = regular * weights.regular + night_base * weights.night + (night - night_base) * weights.night_overtime
+    if holiday > 0:
+        numerator += holiday * weights.holiday + overtime * weights.holiday_overtime
+    else:
+        numerator += overtime * weights.overtime
+    # Components stay exact until the single half-up rounding of the gross amount.
+    return (numerator * rate + DENOMINATOR // 2) // DENOMINATOR
+
+
+def int64_columns(*columns: Sequence[int]) -> Optional[List[Any]]:
+    # One C-level conversion per column; None without numpy or when a value overflows int64.
+    if np is None:
+        return None
+    try:
+        return [np.asarray(column, dtype=np.int64) for column in columns]
+    except OverflowError:
+        return None
+
+
+def column_peak(column: Sequence[int]) -> int:
+    if np is not None and isinstance(column, np.ndarray):
+        return int(column.max()) if column.size else 0
+    return max(column, default=0)
+
+
+def fits_int64(columns: Sequence[Sequence[int]], rates: Sequence[int], weights: PayWeights) -> bool:
+    minutes = max((column_peak(column) for column in columns), default=0)
+    return 4 * minutes * weights.max_weight() * column_peak(rates) + DENOMINATOR <= INT64_MAX
+
+
+def gross_pay_batch(
+    regular: Sequence[int],
+    overtime: Sequence[int],
+    night: Sequence[int],
+    holiday: Sequence[int],
+    rates: Sequence[int],
+    weights: PayWeights,
+) -> List[int]:
+    # Column-wise over int64 when numpy is available and the bound fits; Python ints
+    # (arbitrary precision) otherwise. Both are integer-only and return the same values.
+    arrays = int64_columns(regular, overtime, night, holiday, rates)
+    if arrays is not None and fits_int64(arrays[:4], arrays[4], weights):
+        r, o, n, h, rate = arrays
+        night_base = np.minimum(n, NIGHT_BASE_CAP_MINUTES)
+        numerator = r * weights.regular + night_base * weights.night + (n - night_base) * weights.night_overtime
+        numerator += np.where(h > 0, h * weights.holiday + o * weights.holiday_overtime, o * weights.overtime)
+        return ((numerator * rate + DENOMINATOR // 2) // DENOMINATOR).tolist()
+
+    return [gross_pay_row(*row, weights) for row in zip(regular, overtime, night, holiday, rates)]
+
+
+def gross_pay(minutes: Mapping[str, int], hourly_rate_krw: int, multipliers: Mapping[str, Any]) -> int:
+    return gross_pay_row(
+        minutes["regular"],
+        minutes["overtime"],
+        minutes["night"],
+        minutes["holiday"],
+        hourly_rate_krw,
+        PayWeights.from_multipliers(multipliers),
+    )
+
+
+def gross_pay_reference(minutes: Mapping[str, int], hourly_rate_krw: int, multipliers: Mapping[str, Any]) -> int:
+    # Decimal slow path straight from the SSoT wording: each component in KRW, then the
+    # gross rounded half-up to whole KRW. Components are summed as KRW x 60 and divided
+    # once, so an exact half (60k + 30) is never perturbed by a repeating decimal.
+    rate = Decimal(hourly_rate_krw)
+    mult: Dict[str, Decimal] = {
+        name: Decimal(str(multipliers[name])) for name in ("regular", "overtime", "night", "holiday")
+    }
+    night_base = min(minutes["night"], NIGHT_BASE_CAP_MINUTES)
+    night_overtime = minutes["night"] - night_base
+
+    components = [
+        minutes["regular"] * rate * mult["regular"],
+        night_base * rate * mult["night"],
+        night_overtime * rate * max(Decimal(0), mult["night"] + mult["overtime"] - 1),
+    ]
+    if minutes["holiday"] > 0:
+        components.append(minutes["holiday"] * rate * mult["holiday"])
+        components.append(minutes["overtime"] * rate * mult["holiday"] * mult["overtime"])
+    else:
+        components.append(minutes["overtime"] * rate * mult["overtime"])
+    gross = sum(components, Decimal(0)) / Decimal(60)
+    return int(gross.quantize(Decimal(1), rounding=ROUND_HALF_UP))
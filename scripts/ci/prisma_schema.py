@@ -0,0 +1,221 @@
+import pathlib
+import re
+from dataclasses import asdict, dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+from ci_cache import ContentCache, content_hash
+from tree_state import source_fingerprint
+
+
+# Cached indexes are only valid for the parser that built them.
+PARSER_VERSION = source_fingerprint([__file__])
+BLOCK_START_RE = re.compile(r"^\s*(model|enum|view|type|generator|datasource)\s+([A-Za-z][A-Za-z0-9_]*)\s*\{\s*$")
+BLOCK_END_RE = re.compile(r"^\s*\}\s*$")
+FIELD_RE = re.compile(
+    r"^\s*([A-Za-z][A-Za-z0-9_]*)\s+([A-Za-z][A-Za-z0-9_]*(?:\([^)]*\))?)(\[\])?(\?)?(?:\s+(.*))?$"
+)
+ENUM_VALUE_RE = re.compile(r"^\s*([A-Za-z][A-Za-z0-9_]*)\b")
+MAP_RE = re.compile(r'@map\(\s*(?:name\s*:\s*)?"([^"]+)"')
+BLOCK_MAP_RE = re.compile(r'^\s*@@map\(\s*(?:name\s*:\s*)?"([^"]+)"')
+RELATION_RE = re.compile(r"@relation\(([^)]*)\)")
+RELATION_LIST_RE = re.compile(r"\b(fields|references)\s*:\s*\[([^\]]*)\]")
+RELATION_NAME_RE = re.compile(r'^\s*(?:name\s*:\s*)?"([^"]+)"')
+
+
+@dataclass
+class PrismaRelation:
+    target: str
+    name: Optional[str] = None
+    fields: List[str] = field(default_factory=list)
+    references: List[str] = field(default_factory=list)
+
+
+@dataclass
+class PrismaField:
+    name: str
+    type: str
+    line: int
+    optional: bool = False
+    is_list: bool = False
+    column: Optional[str] = None
+    relation: Optional[PrismaRelation] = None
+
+
+@dataclass
+class PrismaModel:
+    name: str
+    table: str
+    start_line: int
+    end_line: int
+    fields: Dict[str, PrismaField] = field(default_factory=dict)
+
+
+@dataclass
+class PrismaEnum:
+    name: str
+    start_line: int
+    end_line: int
+    values: List[str] = field(default_factory=list)
+
+
+@dataclass
+class PrismaSchemaIndex:
+    models: Dict[str, PrismaModel] = field(default_factory=dict)
+    enums: Dict[str, PrismaEnum] = field(default_factory=dict)
+    tables: Dict[str, str] = field(default_factory=dict)
+
+    def field_of(self, model: str, name: str) -> Optional[PrismaField]:
+        entry = self.models.get(model)
+        return entry.fields.get(name) if entry is not None else None
+
+    def relations(self, model: str) -> List[PrismaField]:
+        entry = self.models.get(model)
+        if entry is None:
+            return []
+        return [item for item in entry.fields.values() if item.relation is not None]
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "models": {name: asdict(model) for name, model in self.models.items()},
+            "enums": {name: asdict(enum) for name, enum in self.enums.items()},
+        }
+
+    @classmethod
+    def from_dict(cls, payload: Dict[str, Any]) -> "PrismaSchemaIndex":
+        index = cls()
+        for name, raw_model in payload["models"].items():
+            fields: Dict[str, PrismaField] = {}
+            for field_name, raw_field in raw_model["fields"].items():
+                relation = raw_field.get("relation")
+                fields[field_name] = PrismaField(
+                    **{**raw_field, "relation": PrismaRelation(**relation) if relation else None}
+                )
+            index.models[name] = PrismaModel(**{**raw_model, "fields": fields})
+            index.tables[raw_model["table"]] = name
+        for name, raw_enum in payload["enums"].items():
+            index.enums[name] = PrismaEnum(**raw_enum)
+        return index
+
+
+def strip_comment(line: str) -> str:
+    in_string = False
+    for idx, char in enumerate(line):
+        if char == '"' and (idx == 0 or line[idx - 1] != "\\"):
+            in_string = not in_string
+        elif not in_string and line.startswith("//", idx):
+            return line[:idx]
+    return line
+
+
+def parse_relation(attributes: str, target: str) -> PrismaRelation:
+    match = RELATION_RE.search(attributes)
+    relation = PrismaRelation(target=target)
+    if match is None:
+        return relation
+
+    args = match.group(1)
+    name_match = RELATION_NAME_RE.match(args)
+    if name_match:
+        relation.name = name_match.group(1)
+    for key, values in RELATION_LIST_RE.findall(args):
+        items = [item.strip() for item in values.split(",") if item.strip()]
+        if key == "fields":
+            relation.fields = items
+        else:
+            relation.references = items
+    return relation
+
+
+def parse_prisma_schema(text: str) -> PrismaSchemaIndex:
+    index = PrismaSchemaIndex()
+    block_kind: Optional[str] = None
+    block_name = ""
+    block_start = 0
+    block_lines: List[Tuple[int, str]] = []
+
+    # Blocks are collected line by line and parsed when their closing brace is seen,
+    # so a single pass builds the index without holding a token stream.
+    for line_number, raw_line in enumerate(text.splitlines(), start=1):
+        line = strip_comment(raw_line).rstrip()
+        if block_kind is None:
+            match = BLOCK_START_RE.match(line)
+            if match:
+                block_kind, block_name, block_start = match.group(1), match.group(2), line_number
+                block_lines = []
+            continue
+
+        if BLOCK_END_RE.match(line):
+            if block_kind == "model":
+                index.models[block_name] = parse_model_block(block_name, block_start, line_number, block_lines)
+            elif block_kind == "enum":
+                index.enums[block_name] = parse_enum_block(block_name, block_start, line_number, block_lines)
+            block_kind = None
+            continue
+
+        if line.strip():
+            block_lines.append((line_number, line))
+
+    for model in index.models.values():
+        index.tables[model.table] = model.name
+        for model_field in model.fields.values():
+            if model_field.relation is not None and model_field.relation.target not in index.models:
+                model_field.relation = None
+
+    return index
+
+
+def parse_model_block(name: str, start_line: int, end_line: int, lines: List[Tuple[int, str]]) -> PrismaModel:
+    model = PrismaModel(name=name, table=name, start_line=start_line, end_line=end_line)
+    for line_number, line in lines:
+        if line.strip().startswith("@@"):
+            map_match = BLOCK_MAP_RE.match(line)
+            if map_match:
+                model.table = map_match.group(1)
+            continue
+
+        match = FIELD_RE.match(line)
+        if not match:
+            continue
+
+        field_name, field_type, list_marker, optional_marker, attributes = match.groups()
+        attributes = attributes or ""
+        column_match = MAP_RE.search(attributes)
+        model.fields[field_name] = PrismaField(
+            name=field_name,
+            type=field_type,
+            line=line_number,
+            optional=bool(optional_marker),
+            is_list=bool(list_marker),
+            column=column_match.group(1) if column_match else None,
+            # Candidate relation; dropped after parsing if the type is not a model.
+            relation=parse_relation(attributes, field_type),
+        )
+    return model
+
+
+def parse_enum_block(name: str, start_line: int, end_line: int, lines: List[Tuple[int, str]]) -> PrismaEnum:
+    enum = PrismaEnum(name=name, start_line=start_line, end_line=end_line)
+    for _line_number, line in lines:
+        match = ENUM_VALUE_RE.match(line)
+        if match and not line.strip().startswith("@@"):
+            enum.values.append(match.group(1))
+    return enum
+
+
+def load_prisma_schema(schema_path: pathlib.Path, cache: Optional[ContentCache] = None) -> PrismaSchemaIndex:
+    if not schema_path.exists():
+        raise ValueError(f"{schema_path}: file not found")
+
+    cache = cache if cache is not None else ContentCache("prisma-schema")
+    text = schema_path.read_text(encoding="utf-8")
+    key = content_hash(PARSER_VERSION, text)
+    cached = cache.get(key)
+    if cached is not None:
+        try:
+            return PrismaSchemaIndex.from_dict(cached)
+        except (KeyError, TypeError):
+            pass
+
+    index = parse_prisma_schema(text)
+    cache.put(key, index.to_dict())
+    return index
@@ -0,0 +1,80 @@
+import fnmatch
+import os
+from dataclasses import dataclass, field
+from typing import Dict, FrozenSet, Iterable, List, Optional, Set
+
+from tree_state import git_lines
+
+
+GLOB_CHARS = set("*?[")
+# Never part of a reference target when the listing falls back to a directory walk.
+WALK_SKIP_DIRS = {".git", "node_modules", ".next", ".ci-cache", "__pycache__"}
+
+
+def normalize_ref(path: str) -> str:
+    path = path.strip().replace("\\", "/")
+    while path.startswith("./"):
+        path = path[2:]
+    return path.rstrip("/")
+
+
+@dataclass
+class RepoPaths:
+    files: FrozenSet[str]
+    source: str
+    directories: Set[str] = field(default_factory=set)
+    patterns: Dict[str, bool] = field(default_factory=dict)
+
+    def __post_init__(self) -> None:
+        for path in self.files:
+            parent, _sep, _name = path.rpartition("/")
+            while parent and parent not in self.directories:
+                self.directories.add(parent)
+                parent = parent.rpartition("/")[0]
+
+    def exists(self, ref: str) -> bool:
+        path = normalize_ref(ref)
+        if GLOB_CHARS.intersection(path):
+            # Docs cite globs like `work-items/WI-*.md`; one is valid when something matches.
+            matched = self.patterns.get(path)
+            if matched is None:
+                matched = self.patterns[path] = any(fnmatch.fnmatchcase(item, path) for item in self.files)
+            return matched
+        return path in self.files or path in self.directories
+
+    def missing(self, refs: Iterable[str]) -> List[str]:
+        return [ref for ref in refs if not self.exists(ref)]
+
+
+def list_git_paths(cwd: Optional[str] = None) -> Optional[FrozenSet[str]]:
+    # Tracked files plus untracked, non-ignored ones, minus files deleted on disk, so a
+    # reference to a file the change adds or removes resolves the way the checkout will.
+    out = git_lines(["git", "ls-files", "-z", "-t", "--cached", "--others", "--deleted", "--exclude-standard"], cwd=cwd)
+    if out is None:
+        return None
+
+    present: Set[str] = set()
+    deleted: Set[str] = set()
+    for entry in out.split("\0"):
+        if not entry:
+            continue
+        tag, _space, path = entry.partition(" ")
+        (deleted if tag == "R" else present).add(path)
+    return frozenset(present - deleted)
+
+
+def walk_paths(root: str) -> FrozenSet[str]:
+    paths: Set[str] = set()
+    for current, dirs, files in os.walk(root):
+        dirs[:] = [name for name in dirs if name not in WALK_SKIP_DIRS]
+        rel = os.path.relpath(current, root)
+        prefix = "" if rel == "." else rel.replace(os.sep, "/") + "/"
+        paths.update(prefix + name for name in files)
+    return frozenset(paths)
+
+
+def load_repo_paths(cwd: Optional[str] = None) -> RepoPaths:
+    files = list_git_paths(cwd=cwd)
+    if files is not None:
+        return RepoPaths(files, "git ls-files")
+    return RepoPaths(walk_paths(cwd or "."), "directory walk")
@@ -0,0 +1,129 @@
+import heapq
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Tuple
+
+from attendance_replay import MINUTE_MS, epoch_ms, night_minutes_ms, parse_timestamp
+
+
+# Minimum rest between two separate shifts of the same employee (11 hours).
+DEFAULT_MIN_REST_MINUTES = 660
+
+
+@dataclass(frozen=True)
+class Assignment:
+    schedule_id: str
+    employee_id: str
+    start_ms: int
+    end_ms: int
+
+
+@dataclass
+class EmployeeSchedule:
+    overlaps: List[Tuple[str, str]] = field(default_factory=list)
+    rest_violations: List[Tuple[str, str]] = field(default_factory=list)
+    night_minutes: int = 0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "overlaps": [list(pair) for pair in self.overlaps],
+            "rest_violations": [list(pair) for pair in self.rest_violations],
+            "night_minutes": self.night_minutes,
+        }
+
+
+def sweep_schedules(assignments: List[Assignment], min_rest_minutes: int) -> Dict[str, EmployeeSchedule]:
+    # One sort by (employee, start, end), then a linear sweep per employee with a heap of
+    # the assignments still open, ordered by end: O(n log n + overlaps) overall. An
+    # assignment starting before an open one ends overlaps it (the create guard's
+    # `existing.startAt < endAt && existing.endAt > startAt`), so nested shifts pair with
+    # every shift they intersect. Back-to-back shifts (gap 0) are one contiguous block,
+    # and any other gap shorter than min_rest_minutes is a rest violation.
+    min_rest_ms = min_rest_minutes * MINUTE_MS
+    ordered = sorted(assignments, key=lambda item: (item.employee_id, item.start_ms, item.end_ms, item.schedule_id))
+    summaries: Dict[str, EmployeeSchedule] = {}
+
+    night_by_span: Dict[Tuple[int, int], int] = {}
+
+    def night_minutes(span: Tuple[int, int]) -> int:
+        night = night_by_span.get(span)
+        if night is None:
+            night = night_by_span[span] = night_minutes_ms(*span)
+        return night
+
+    # Night coverage is counted over the union of overlapping assignments, so a minute
+    # covered by two shifts counts once.
+    current_employee = None
+    summary = EmployeeSchedule()
+    active: List[Tuple[int, int, str]] = []
+    latest = None
+    block = None
+    for idx, item in enumerate(ordered):
+        if item.employee_id != current_employee:
+            if block is not None:
+                summary.night_minutes += night_minutes(block)
+            current_employee = item.employee_id
+            summary = summaries[item.employee_id] = EmployeeSchedule()
+            active, latest, block = [], None, None
+
+        while active and active[0][0] <= item.start_ms:
+            heapq.heappop(active)
+        for _end, _idx, schedule_id in sorted(active, key=lambda entry: entry[1]):
+            summary.overlaps.append((schedule_id, item.schedule_id))
+        if latest is not None and not active and 0 < item.start_ms - latest.end_ms < min_rest_ms:
+            summary.rest_violations.append((latest.schedule_id, item.schedule_id))
+        heapq.heappush(active, (item.end_ms, idx, item.schedule_id))
+        if latest is None or item.end_ms > latest.end_ms:
+            latest = item
+
+        if block is not None and item.start_ms < block[1]:
+            block = (block[0], max(block[1], item.end_ms))
+        else:
+            if block is not None:
+                summary.night_minutes += night_minutes(block)
+            block = (item.start_ms, item.end_ms)
+    if block is not None:
+        summary.night_minutes += night_minutes(block)
+    return summaries
+
+
+def parse_assignments(raw: Any) -> List[Assignment]:
+    if not isinstance(raw, list) or not raw:
+        raise ValueError("inputs.assignments must be a non-empty array")
+
+    # Shift boundaries repeat across a workforce, so each timestamp string is parsed once.
+    timestamps: Dict[str, int] = {}
+
+    def to_ms(value: Any, idx: int, key: str) -> int:
+        parsed = timestamps.get(value) if isinstance(value, str) else None
+        if parsed is None:
+            parsed = timestamps[value] = epoch_ms(parse_timestamp(value, f"inputs.assignments[{idx}].{key}"))
+        return parsed
+
+    assignments: List[Assignment] = []
+    seen = set()
+    for idx, item in enumerate(raw):
+        if not isinstance(item, dict):
+            raise ValueError(f"inputs.assignments[{idx}] must be an object")
+        schedule_id = item.get("schedule_id")
+        employee_id = item.get("employee_id")
+        for key, value in (("schedule_id", schedule_id), ("employee_id", employee_id)):
+            if not isinstance(value, str) or not value.strip():
+                raise ValueError(f"inputs.assignments[{idx}].{key} must be a non-empty string")
+        if schedule_id in seen:
+            raise ValueError(f"inputs.assignments[{idx}]: duplicate schedule_id '{schedule_id}'")
+        seen.add(schedule_id)
+
+        start_ms = to_ms(item.get("start_at"), idx, "start_at")
+        end_ms = to_ms(item.get("end_at"), idx, "end_at")
+        if end_ms <= start_ms:
+            raise ValueError(f"inputs.assignments[{idx}]: end_at must be after start_at")
+        assignments.append(Assignment(schedule_id, employee_id, start_ms, end_ms))
+    return assignments
+
+
+def summarize_inputs(inputs: Dict[str, Any]) -> Dict[str, EmployeeSchedule]:
+    policy = inputs.get("policy") if isinstance(inputs.get("policy"), dict) else {}
+    min_rest = policy.get("min_rest_minutes", DEFAULT_MIN_REST_MINUTES)
+    if not isinstance(min_rest, int) or isinstance(min_rest, bool) or min_rest < 0:
+        raise ValueError("policy.min_rest_minutes must be a non-negative integer")
+    return sweep_schedules(parse_assignments(inputs.get("assignments")), min_rest)
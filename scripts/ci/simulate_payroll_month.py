@@ -0,0 +1,369 @@
+#!/usr/bin/env python3
+import argparse
+import csv
+import json
+import pathlib
+import random
+import resource
+import sys
+import time
+from dataclasses import dataclass
+from datetime import date
+from decimal import Decimal, InvalidOperation
+from functools import reduce
+from typing import Any, Dict, Iterator, List, Optional, TextIO, Tuple
+
+from attendance_replay import (
+    DAY_MS,
+    DEFAULT_MULTIPLIERS,
+    HOUR_MS,
+    MINUTE_BUCKETS,
+    SEOUL_OFFSET_MS,
+    AttendanceState,
+    apply_event,
+    epoch_ms,
+    fixture_events,
+    parse_timestamp,
+    payable_minutes_ms,
+)
+from pay_kernel import PayWeights, gross_pay_batch
+
+
+# Records between 00:00 and 03:59:59 belong to the previous business day (SSoT).
+WORKDAY_BOUNDARY_MS = 4 * HOUR_MS
+MAX_REPORTED_ERRORS = 20
+CSV_INT_FIELDS = ("break_minutes", "hourly_rate_krw")
+
+
+@dataclass
+class MonthTotals:
+    records: int = 0
+    regular: int = 0
+    overtime: int = 0
+    night: int = 0
+    holiday: int = 0
+    gross_pay_krw: int = 0
+
+    def to_dict(self, employee_id: str, month: str) -> Dict[str, Any]:
+        return {
+            "employee_id": employee_id,
+            "month": month,
+            "records": self.records,
+            "payable_minutes": {bucket: getattr(self, bucket) for bucket in MINUTE_BUCKETS},
+            "gross_pay_krw": self.gross_pay_krw,
+        }
+
+
+@dataclass
+class SimulationStats:
+    records: int = 0
+    outside_period: int = 0
+    employees: int = 0
+    errors: int = 0
+
+
+def month_bounds(month: str) -> Tuple[int, int]:
+    # [first day 00:00, next month 00:00) in Asia/Seoul, as epoch milliseconds.
+    try:
+        year, month_no = (int(part) for part in month.split("-"))
+        start = date(year, month_no, 1)
+    except ValueError as exc:
+        raise ValueError(f"--month must be YYYY-MM ({exc})") from exc
+    end = date(year + month_no // 12, month_no % 12 + 1, 1)
+    epoch = date(1970, 1, 1)
+    return (
+        (start - epoch).days * DAY_MS - SEOUL_OFFSET_MS,
+        (end - epoch).days * DAY_MS - SEOUL_OFFSET_MS,
+    )
+
+
+def business_day_start(check_in_ms: int) -> int:
+    local = check_in_ms + SEOUL_OFFSET_MS - WORKDAY_BOUNDARY_MS
+    return local - local % DAY_MS - SEOUL_OFFSET_MS
+
+
+def iter_jsonl(handle: TextIO) -> Iterator[Tuple[int, Any]]:
+    for line_no, line in enumerate(handle, start=1):
+        if not line.strip():
+            continue
+        try:
+            yield line_no, json.loads(line)
+        except ValueError as exc:
+            yield line_no, ValueError(f"invalid JSON ({exc})")
+
+
+def parse_csv_multiplier(text: str, bucket: str) -> Decimal:
+    # Decimal, like the JSONL path, so "1.0000001" is rejected by scale_multiplier
+    # instead of being rounded to 1.0 by float().
+    try:
+        value = Decimal(text.strip())
+    except InvalidOperation as exc:
+        raise ValueError(f"multiplier_{bucket}={text!r} is not a decimal number") from exc
+    if not value.is_finite():
+        raise ValueError(f"multiplier_{bucket}={text!r} is not a decimal number")
+    return value
+
+
+def iter_csv(handle: TextIO) -> Iterator[Tuple[int, Any]]:
+    # Flat columns: employee_id, check_in, check_out, break_minutes, hourly_rate_krw,
+    # optional is_holiday and multiplier_<bucket>.
+    for line_no, row in enumerate(csv.DictReader(handle), start=2):
+        try:
+            record: Dict[str, Any] = {key: value for key, value in row.items() if value not in (None, "")}
+            for key in CSV_INT_FIELDS:
+                if key in record:
+                    record[key] = int(record[key])
+            record["is_holiday"] = str(record.get("is_holiday", "")).lower() in ("1", "true", "yes")
+            multipliers = {
+                bucket: parse_csv_multiplier(record.pop(f"multiplier_{bucket}"), bucket)
+                for bucket in MINUTE_BUCKETS
+                if f"multiplier_{bucket}" in record
+            }
+            if multipliers:
+                record["multipliers"] = multipliers
+        except ValueError as exc:
+            yield line_no, ValueError(f"invalid CSV value ({exc})")
+            continue
+        yield line_no, record
+
+
+def iter_chunks(records: Iterator[Tuple[int, Any]], size: int) -> Iterator[List[Tuple[int, Any]]]:
+    chunk: List[Tuple[int, Any]] = []
+    for item in records:
+        chunk.append(item)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+class MonthSimulator:
+    def __init__(self, month: str) -> None:
+        self.month = month
+        self.period = month_bounds(month)
+        self.totals: Dict[str, MonthTotals] = {}
+        self.stats = SimulationStats()
+        self.errors: List[str] = []
+        self.weights: Dict[Tuple[Tuple[str, Any], ...], PayWeights] = {}
+
+    def error(self, message: str) -> None:
+        self.stats.errors += 1
+        if len(self.errors) < MAX_REPORTED_ERRORS:
+            self.errors.append(message)
+
+    def pay_weights(self, raw: Any) -> PayWeights:
+        multipliers = {**DEFAULT_MULTIPLIERS, **(raw if isinstance(raw, dict) else {})}
+        key = tuple(sorted(multipliers.items()))
+        weights = self.weights.get(key)
+        if weights is None:
+            weights = self.weights[key] = PayWeights.from_multipliers(multipliers)
+        return weights
+
+    def process_chunk(self, chunk: List[Tuple[int, Any]], label: str) -> List[str]:
+        # Minutes per record, then gross pay per multiplier group through the batch kernel.
+        # Returns the employees first seen in this chunk.
+        columns: Dict[PayWeights, Tuple[List[str], List[List[int]]]] = {}
+        timestamps: Dict[str, int] = {}
+        new_employees: List[str] = []
+
+        def to_ms(value: Any, field: str) -> int:
+            parsed = timestamps.get(value) if isinstance(value, str) else None
+            if parsed is None:
+                parsed = timestamps[value] = epoch_ms(parse_timestamp(value, field))
+            return parsed
+
+        for line_no, raw in chunk:
+            if isinstance(raw, ValueError):
+                self.error(f"{label}:{line_no}: {raw}")
+                continue
+            try:
+                if not isinstance(raw, dict) or not isinstance(raw.get("employee_id"), str):
+                    raise ValueError("employee_id must be a string")
+                state = reduce(apply_event, fixture_events(raw), AttendanceState())
+                start_ms = to_ms(state.check_in, "check_in")
+                end_ms = to_ms(state.check_out, "check_out")
+                rate = raw.get("hourly_rate_krw")
+                if not isinstance(rate, int) or isinstance(rate, bool) or rate < 0:
+                    raise ValueError("hourly_rate_krw must be a non-negative integer")
+                weights = self.pay_weights(raw.get("multipliers"))
+            except ValueError as exc:
+                self.error(f"{label}:{line_no}: {exc}")
+                continue
+
+            self.stats.records += 1
+            if not self.period[0] <= business_day_start(start_ms) < self.period[1]:
+                self.stats.outside_period += 1
+                continue
+
+            minutes = payable_minutes_ms(start_ms, end_ms, state.break_minutes, state.is_holiday)
+            employee_id = raw["employee_id"]
+            totals = self.totals.get(employee_id)
+            if totals is None:
+                totals = self.totals[employee_id] = MonthTotals()
+                new_employees.append(employee_id)
+            totals.records += 1
+            totals.regular += minutes["regular"]
+            totals.overtime += minutes["overtime"]
+            totals.night += minutes["night"]
+            totals.holiday += minutes["holiday"]
+
+            group = columns.get(weights)
+            if group is None:
+                group = columns[weights] = ([], [[], [], [], [], []])
+            group[0].append(employee_id)
+            for column, value in zip(group[1], (*(minutes[bucket] for bucket in MINUTE_BUCKETS), rate)):
+                column.append(value)
+
+        for weights, (employee_ids, (regular, overtime, night, holiday, rates)) in columns.items():
+            # The night/overtime caps apply per record, so gross is summed per record.
+            for employee_id, gross in zip(
+                employee_ids, gross_pay_batch(regular, overtime, night, holiday, rates, weights)
+            ):
+                self.totals[employee_id].gross_pay_krw += gross
+        return new_employees
+
+    def flush(self, output: TextIO, employee_ids: List[str]) -> None:
+        for employee_id in employee_ids:
+            totals = self.totals.pop(employee_id)
+            output.write(json.dumps(totals.to_dict(employee_id, self.month)) + "\n")
+            self.stats.employees += 1
+
+
+def simulate(
+    source: TextIO, fmt: str, month: str, output: TextIO, chunk_size: int, grouped: bool, label: str
+) -> MonthSimulator:
+    simulator = MonthSimulator(month)
+    records = iter_csv(source) if fmt == "csv" else iter_jsonl(source)
+    open_employees: List[str] = []
+    for chunk in iter_chunks(records, chunk_size):
+        open_employees.extend(simulator.process_chunk(chunk, label))
+        if grouped and len(open_employees) > 1:
+            # Input grouped by employee: everyone but the last employee seen is complete,
+            # so memory stays bounded by the chunk rather than the workforce.
+            last = chunk_last_employee(chunk)
+            done = [employee_id for employee_id in open_employees if employee_id != last]
+            simulator.flush(output, done)
+            open_employees = [last] if last in simulator.totals else []
+    simulator.flush(output, list(simulator.totals))
+    return simulator
+
+
+def chunk_last_employee(chunk: List[Tuple[int, Any]]) -> Optional[str]:
+    for _line_no, raw in reversed(chunk):
+        if isinstance(raw, dict) and isinstance(raw.get("employee_id"), str):
+            return raw["employee_id"]
+    return None
+
+
+def generate_month(path: pathlib.Path, month: str, employees: int, seed: int) -> int:
+    # Synthetic grouped JSONL in the golden-fixture `inputs` shape, written line by line.
+    rng = random.Random(seed)
+    period_start, period_end = month_bounds(month)
+    days = (period_end - period_start) // DAY_MS
+    first = date.fromisoformat(f"{month}-01")
+    written = 0
+    with path.open("w", encoding="utf-8") as handle:
+        for employee in range(employees):
+            rate = rng.randrange(9_860, 40_000, 10)
+            for day in range(days):
+                current = date.fromordinal(first.toordinal() + day)
+                night_shift = rng.random() < 0.15
+                start_hour = 22 if night_shift else rng.choice((8, 9, 10))
+                hours = rng.choice((8, 9, 10, 11))
+                check_in = f"{current.isoformat()}T{start_hour:02d}:00:00+09:00"
+                end = date.fromordinal(current.toordinal() + (start_hour + hours + 1) // 24)
+                check_out = f"{end.isoformat()}T{(start_hour + hours + 1) % 24:02d}:00:00+09:00"
+                record = {
+                    "employee_id": f"E-{employee:06d}",
+                    "date": current.isoformat(),
+                    "check_in": check_in,
+                    "check_out": check_out,
+                    "break_minutes": 60,
+                    "is_holiday": current.weekday() == 6,
+                    "hourly_rate_krw": rate,
+                }
+                handle.write(json.dumps(record) + "\n")
+                written += 1
+    return written
+
+
+def peak_rss_mib() -> float:
+    # ru_maxrss is KiB on Linux and bytes on macOS.
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Dry-run a monthly payroll period over bulk attendance input.")
+    parser.add_argument("--month", required=True, help="Payroll month as YYYY-MM (Asia/Seoul).")
+    parser.add_argument("--input", required=True, help="Attendance records as JSON Lines or CSV.")
+    parser.add_argument("--format", choices=["jsonl", "csv"], help="Input format (default: from extension).")
+    parser.add_argument("--output", help="Per-employee results as JSON Lines (default: stdout).")
+    parser.add_argument("--chunk-size", type=int, default=10_000)
+    parser.add_argument(
+        "--grouped",
+        action="store_true",
+        help="Input is grouped by employee; results are written as each employee completes.",
+    )
+    parser.add_argument(
+        "--generate",
+        type=int,
+        metavar="EMPLOYEES",
+        help="Write a synthetic month for this many employees to --input first.",
+    )
+    parser.add_argument("--seed", type=int, default=7)
+    return parser.parse_args()
+
+
+def main() -> int:
+    args = parse_args()
+    input_path = pathlib.Path(args.input)
+    fmt = args.format or ("csv" if input_path.suffix.lower() == ".csv" else "jsonl")
+    try:
+        month_bounds(args.month)
+    except ValueError as exc:
+        print(f"Payroll month simulation failed:\n- {exc}")
+        return 1
+
+    if args.generate:
+        if fmt != "jsonl":
+            print("Payroll month simulation failed:\n- --generate writes JSON Lines only")
+            return 1
+        written = generate_month(input_path, args.month, args.generate, args.seed)
+        print(f"Generated {written} attendance records for {args.generate} employees in {input_path}.", file=sys.stderr)
+
+    started = time.perf_counter()
+    output = open(args.output, "w", encoding="utf-8") if args.output else sys.stdout
+    try:
+        with input_path.open(encoding="utf-8", newline="") as source:
+            simulator = simulate(
+                source, fmt, args.month, output, max(1, args.chunk_size), args.grouped, str(input_path)
+            )
+    except OSError as exc:
+        print(f"Payroll month simulation failed:\n- {exc}")
+        return 1
+    finally:
+        if output is not sys.stdout:
+            output.close()
+    elapsed = time.perf_counter() - started
+
+    stats = simulator.stats
+    print(
+        f"Simulated {args.month}: {stats.records} records ({stats.outside_period} outside the period) for "
+        f"{stats.employees} employees in {elapsed:.2f}s ({stats.records / max(elapsed, 1e-9):,.0f} records/s), "
+        f"peak RSS {peak_rss_mib():.1f} MiB.",
+        file=sys.stderr,
+    )
+    if simulator.errors:
+        print("Payroll month simulation failed:", file=sys.stderr)
+        for err in simulator.errors:
+            print(f"- {err}", file=sys.stderr)
+        if stats.errors > len(simulator.errors):
+            print(f"- ... and {stats.errors - len(simulator.errors)} more", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
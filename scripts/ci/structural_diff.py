@@ -0,0 +1,279 @@
+import hashlib
+import json
+import re
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+
+PATH_PARAM_RE = re.compile(r"\{[^/{}]+\}")
+HTTP_METHODS = ("get", "put", "post", "delete", "options", "head", "patch", "trace")
+LEVELS = ("patch", "minor", "major")
+# Bookkeeping keys that change with every release and carry no contract semantics.
+CONTRACT_META_KEYS = {"version", "breaking_changes", "consumer_impact", "approval", "references"}
+
+Path = Tuple[str, ...]
+
+
+def normalize_api_path(path: str) -> str:
+    # Parameter names are not part of the operation identity: `/runs/{id}` and
+    # `/runs/{runId}` route the same request.
+    normalized = PATH_PARAM_RE.sub("{}", path.strip())
+    normalized = re.sub(r"/{2,}", "/", normalized)
+    if len(normalized) > 1:
+        normalized = normalized.rstrip("/")
+    return normalized
+
+
+@dataclass(frozen=True)
+class HashedNode:
+    digest: str
+    value: Any
+    children: Optional[Dict[str, "HashedNode"]] = None
+
+
+@dataclass(frozen=True)
+class StructuralChange:
+    kind: str  # added | removed | changed
+    path: Path
+    old: Any = None
+    new: Any = None
+
+
+@dataclass(frozen=True)
+class ClassifiedChange:
+    level: str
+    description: str
+
+
+def list_identity(item: Any) -> Optional[str]:
+    if isinstance(item, dict):
+        if isinstance(item.get("method"), str) and isinstance(item.get("path"), str):
+            return f"{item['method'].upper()} {normalize_api_path(item['path'])}"
+        if isinstance(item.get("name"), str):
+            location = item.get("in")
+            return f"{location}:{item['name']}" if isinstance(location, str) else item["name"]
+        if isinstance(item.get("id"), str):
+            return item["id"]
+        return None
+    if isinstance(item, (str, int, float, bool)) or item is None:
+        return json.dumps(item)
+    return None
+
+
+def hash_tree(node: Any, key_fn: Callable[[Path, str], str], path: Path = ()) -> HashedNode:
+    # Lists become keyed children when every element has a stable identity, so an
+    # insertion in the middle of `api.endpoints` is one added entry, not a shifted tail.
+    if isinstance(node, dict):
+        keyed = {key_fn(path, str(key)): value for key, value in node.items()}
+    elif isinstance(node, list):
+        identities = [list_identity(item) for item in node]
+        if None in identities or len(set(identities)) != len(identities):
+            identities = [f"[{idx}]" for idx in range(len(node))]
+        keyed = dict(zip(identities, node))  # type: ignore[arg-type]
+    else:
+        encoded = json.dumps(node, sort_keys=True, default=str)
+        return HashedNode(hashlib.sha1(encoded.encode("utf-8")).hexdigest(), node)
+
+    children = {key: hash_tree(value, key_fn, path + (key,)) for key, value in keyed.items()}
+    digest = hashlib.sha1()
+    digest.update(b"{" if isinstance(node, dict) else b"[")
+    for key in sorted(children):
+        digest.update(key.encode("utf-8"))
+        digest.update(b"\0")
+        digest.update(children[key].digest.encode("ascii"))
+    return HashedNode(digest.hexdigest(), node, children)
+
+
+def diff_trees(old: HashedNode, new: HashedNode, path: Path = ()) -> List[StructuralChange]:
+    changes: List[StructuralChange] = []
+    stack: List[Tuple[Path, HashedNode, HashedNode]] = [(path, old, new)]
+    while stack:
+        current, left, right = stack.pop()
+        if left.digest == right.digest:
+            continue
+        if left.children is None or right.children is None or type(left.value) is not type(right.value):
+            changes.append(StructuralChange("changed", current, left.value, right.value))
+            continue
+
+        for key in sorted(left.children.keys() | right.children.keys()):
+            if key not in right.children:
+                changes.append(StructuralChange("removed", current + (key,), old=left.children[key].value))
+            elif key not in left.children:
+                changes.append(StructuralChange("added", current + (key,), new=right.children[key].value))
+            else:
+                stack.append((current + (key,), left.children[key], right.children[key]))
+
+    return sorted(changes, key=lambda change: change.path)
+
+
+def format_path(path: Path) -> str:
+    return ".".join(path) if path else "<root>"
+
+
+def item_label(key: str) -> str:
+    # Scalar list items are keyed by their JSON encoding; show them unquoted.
+    try:
+        value = json.loads(key)
+    except ValueError:
+        return key
+    return str(value) if isinstance(value, (str, int, float, bool)) else key
+
+
+def openapi_side(path: Path) -> str:
+    # Requests and responses break in opposite directions: a client must send what a
+    # request requires, but may only rely on what a response promises. Shared component
+    # schemas keep the stricter request rules.
+    if path[:1] == ("paths",):
+        section = path[3] if len(path) > 3 and path[2] in HTTP_METHODS else "".join(path[2:3])
+    elif path[:1] == ("components",):
+        section = "".join(path[1:2])
+    else:
+        section = ""
+    return "response" if section in ("responses", "headers") else "request"
+
+
+def classify_openapi_change(change: StructuralChange) -> ClassifiedChange:
+    path, kind = change.path, change.kind
+    where = format_path(path)
+    leaf = path[-1] if path else ""
+    parent = path[-2] if len(path) >= 2 else ""
+    response = openapi_side(path) == "response"
+
+    if path[:1] == ("paths",) and len(path) == 2 and kind != "changed":
+        level = "major" if kind == "removed" else "minor"
+        return ClassifiedChange(level, f"{kind} path {path[1]}")
+    if path[:1] == ("paths",) and len(path) == 3 and leaf in HTTP_METHODS and kind != "changed":
+        level = "major" if kind == "removed" else "minor"
+        return ClassifiedChange(level, f"{kind} endpoint {leaf.upper()} {path[1]}")
+    if parent == "parameters":
+        if kind == "removed":
+            return ClassifiedChange("major", f"removed parameter {leaf} at {where}")
+        if kind == "added":
+            if isinstance(change.new, dict) and change.new.get("required") is True:
+                return ClassifiedChange("major", f"new required parameter {leaf} at {where}")
+            return ClassifiedChange("minor", f"new optional parameter {leaf} at {where}")
+    if response:
+        if leaf == "required" and change.old is True and change.new is not True:
+            return ClassifiedChange("major", f"{where} no longer required in response")
+        if leaf == "required" and change.old is not True and change.new is True:
+            return ClassifiedChange("minor", f"{where} became required in response")
+        if leaf == "required" and kind == "removed" and isinstance(change.old, list) and change.old:
+            fields = ", ".join(str(item) for item in change.old)
+            return ClassifiedChange("major", f"response field {fields} no longer required at {where}")
+        if leaf == "required" and kind == "added" and isinstance(change.new, list):
+            fields = ", ".join(str(item) for item in change.new)
+            return ClassifiedChange("minor", f"new required response field {fields} at {where}")
+        if parent == "required" and kind != "changed":
+            if kind == "removed":
+                return ClassifiedChange("major", f"response field {item_label(leaf)} no longer required at {where}")
+            return ClassifiedChange("minor", f"new required response field {item_label(leaf)} at {where}")
+        if parent == "enum" and kind != "changed":
+            if kind == "added":
+                return ClassifiedChange("major", f"widened response enum: added {item_label(leaf)} at {where}")
+            return ClassifiedChange("minor", f"narrowed response enum: removed {item_label(leaf)} at {where}")
+        if leaf == "enum" and kind == "added":
+            return ClassifiedChange("minor", f"narrowed response enum: new enum constraint at {where}")
+        if leaf == "enum" and kind == "removed":
+            return ClassifiedChange("major", f"widened response enum: dropped enum constraint at {where}")
+        if parent == "properties" and kind != "changed":
+            level = "major" if kind == "removed" else "minor"
+            return ClassifiedChange(level, f"{kind} response field {leaf} at {where}")
+    if leaf == "required" and change.old is not True and change.new is True:
+        return ClassifiedChange("major", f"{where} became required")
+    if leaf == "required" and kind == "added" and isinstance(change.new, list) and change.new:
+        fields = ", ".join(str(item) for item in change.new)
+        return ClassifiedChange("major", f"new required field {fields} at {where}")
+    if parent == "required" and kind != "changed":
+        if kind == "added":
+            return ClassifiedChange("major", f"new required field {item_label(leaf)} at {where}")
+        return ClassifiedChange("minor", f"field {item_label(leaf)} no longer required at {where}")
+    if parent == "enum" and kind != "changed":
+        if kind == "removed":
+            return ClassifiedChange("major", f"narrowed enum: removed {item_label(leaf)} at {where}")
+        return ClassifiedChange("minor", f"widened enum: added {item_label(leaf)} at {where}")
+    if leaf == "enum" and kind == "added":
+        return ClassifiedChange("major", f"narrowed enum: new enum constraint at {where}")
+    if parent == "properties" and kind != "changed":
+        level = "major" if kind == "removed" else "minor"
+        return ClassifiedChange(level, f"{kind} field {leaf} at {where}")
+    if parent == "responses" and kind != "changed":
+        level = "major" if kind == "removed" else "minor"
+        return ClassifiedChange(level, f"{kind} response {leaf} at {where}")
+    if leaf in ("type", "format", "$ref") and kind == "changed":
+        return ClassifiedChange("major", f"changed {leaf} at {where} ({change.old} -> {change.new})")
+    return ClassifiedChange("patch", f"{kind} {where}")
+
+
+def classify_contract_change(change: StructuralChange) -> ClassifiedChange:
+    path, kind = change.path, change.kind
+    where = format_path(path)
+
+    if path[:2] == ("api", "endpoints") and len(path) == 3 and kind != "changed":
+        level = "major" if kind == "removed" else "minor"
+        return ClassifiedChange(level, f"{kind} endpoint {path[2]}")
+    if path[:3] == ("api", "events", "published") and len(path) == 4 and kind != "changed":
+        level = "major" if kind == "removed" else "minor"
+        return ClassifiedChange(level, f"{kind} published event {path[3]}")
+    if path[:3] == ("api", "events", "consumed") and len(path) == 4 and kind == "added":
+        return ClassifiedChange("minor", f"added consumed event {path[3]}")
+    if path == ("db_changes", "backward_compatible") and change.new is False:
+        return ClassifiedChange("major", "db_changes.backward_compatible became false")
+    if path[:2] == ("db_changes", "migrations") and len(path) == 3 and kind == "added":
+        return ClassifiedChange("minor", f"added migration {path[2]}")
+    if path[:2] == ("scope", "in") and len(path) == 3 and kind != "changed":
+        level = "major" if kind == "removed" else "minor"
+        return ClassifiedChange(level, f"{kind} scope item {item_label(path[2])}")
+    return ClassifiedChange("patch", f"{kind} {where}")
+
+
+def openapi_key(path: Path, key: str) -> str:
+    return normalize_api_path(key) if path == ("paths",) else key
+
+
+def contract_key(_path: Path, key: str) -> str:
+    return key
+
+
+# Hashed trees by (document kind, content hash); a release train revisits the same
+# blobs many times, so each one is hashed once per process.
+TREE_CACHE: Dict[Tuple[str, str], HashedNode] = {}
+
+
+def document_tree(data: Dict[str, Any], document: str, cache_key: Optional[str] = None) -> HashedNode:
+    if cache_key is not None and (document, cache_key) in TREE_CACHE:
+        return TREE_CACHE[(document, cache_key)]
+
+    if document == "openapi":
+        tree = hash_tree({k: v for k, v in data.items() if k != "info"}, openapi_key)
+    else:
+        tree = hash_tree({k: v for k, v in data.items() if k not in CONTRACT_META_KEYS}, contract_key)
+
+    if cache_key is not None:
+        TREE_CACHE[(document, cache_key)] = tree
+    return tree
+
+
+def classify_trees(old_tree: HashedNode, new_tree: HashedNode, document: str) -> List[ClassifiedChange]:
+    classify = classify_openapi_change if document == "openapi" else classify_contract_change
+    return [classify(change) for change in diff_trees(old_tree, new_tree)]
+
+
+def classify_diff(
+    old_data: Dict[str, Any], new_data: Dict[str, Any], document: str
+) -> List[ClassifiedChange]:
+    return classify_trees(document_tree(old_data, document), document_tree(new_data, document), document)
+
+
+def change_level(changes: List[ClassifiedChange]) -> Optional[str]:
+    if not changes:
+        return None
+    return max((change.level for change in changes), key=LEVELS.index)
+
+
+def bump_level(old_version: str, new_version: str) -> Optional[str]:
+    old_parts = [int(part) for part in old_version.split(".")]
+    new_parts = [int(part) for part in new_version.split(".")]
+    for level, old_part, new_part in zip(("major", "minor", "patch"), old_parts, new_parts):
+        if new_part != old_part:
+            return level if new_part > old_part else None
+    return None
@@ -1,11 +1,14 @@
 #!/usr/bin/env python3
+import importlib
 import importlib.util
+import io
+import json
 import pathlib
 import re
+import tempfile
+import threading
 import unittest
-import uuid
-import shutil
-from contextlib import contextmanager
+from contextlib import contextmanager, redirect_stdout
 
 
 ROOT = pathlib.Path(__file__).resolve().parents[2]
@@ -26,10 +29,20 @@ def bump_patch(version: str) -> str:
     return f"{major}.{minor}.{int(patch) + 1}"
 
 
+def bump_minor(version: str) -> str:
+    major, minor, _patch = version.split(".")
+    return f"{major}.{int(minor) + 1}.0"
+
+
+def with_version(contract_text: str, version: str) -> str:
+    return re.sub(r"(?m)^version:\s*\S+$", f"version: {version}", contract_text, count=1)
+
+
 class CheckContractsRegressionTest(unittest.TestCase):
     @classmethod
     def setUpClass(cls):
         cls.module = load_check_contracts_module()
+        cls.module.OPENAPI_CACHE = cls.module.ContentCache.in_memory("openapi")
         cls.validator = cls.module.load_schema(ROOT / "contracts" / "contract.schema.json")
         cls.contract_text = (ROOT / "specs" / "attendance" / "contract.yaml").read_text(encoding="utf-8")
         cls.api_text = (ROOT / "specs" / "attendance" / "api.yaml").read_text(encoding="utf-8")
@@ -55,12 +68,52 @@ class CheckContractsRegressionTest(unittest.TestCase):
 
     @contextmanager
     def project_temp_dir(self):
-        temp_root = ROOT / ".tmp-contract-governance-tests" / uuid.uuid4().hex
-        temp_root.mkdir(parents=True, exist_ok=True)
-        try:
-            yield str(temp_root)
-        finally:
-            shutil.rmtree(temp_root, ignore_errors=True)
+        # Outside the repo root, so parallel runs never see each other's files in a repo listing.
+        with tempfile.TemporaryDirectory(prefix="contract-governance-") as temp_dir:
+            yield temp_dir
+
+    def scenario_repo(self) -> pathlib.Path:
+        git_fixture_repos = importlib.import_module("git_fixture_repos")
+        Commit = git_fixture_repos.Commit
+        contract = self.contract_text
+        scoped = contract.replace("  out:\n", "    - attendance export\n  out:\n", 1)
+        drifted_api = self.api_text.replace(
+            "  /attendance/records/{recordId}/reject:", "  /attendance/records/{recordId}/archive:"
+        )
+        return git_fixture_repos.shared_repo(
+            "contracts",
+            [
+                Commit(
+                    "base",
+                    "attendance contract",
+                    {"specs/attendance/contract.yaml": contract, "specs/attendance/api.yaml": self.api_text},
+                ),
+                Commit("scope-no-bump", "scope edit", {"specs/attendance/contract.yaml": scoped}, parent="base"),
+                Commit(
+                    "scope-patch-bump",
+                    "scope edit with patch bump",
+                    {"specs/attendance/contract.yaml": with_version(scoped, bump_patch(self.contract_version))},
+                    parent="base",
+                ),
+                Commit(
+                    "scope-minor-bump",
+                    "scope edit with minor bump",
+                    {"specs/attendance/contract.yaml": with_version(scoped, bump_minor(self.contract_version))},
+                    parent="base",
+                ),
+                Commit("api-only", "api drift", {"specs/attendance/api.yaml": drifted_api}, parent="base"),
+                Commit(
+                    "domain-rename",
+                    "rename domain",
+                    renames=[
+                        ("specs/attendance/contract.yaml", "specs/time-attendance/contract.yaml"),
+                        ("specs/attendance/api.yaml", "specs/time-attendance/api.yaml"),
+                    ],
+                    parent="base",
+                ),
+                Commit("api-deleted", "drop api", {"specs/attendance/api.yaml": None}, parent="base"),
+            ],
+        )
 
     def test_lint_contract_file_requires_sibling_api(self):
         with self.project_temp_dir() as temp_dir:
@@ -85,10 +138,161 @@ class CheckContractsRegressionTest(unittest.TestCase):
             errors = self.module.lint_contract_file(contract_path, self.validator)
             self.assertTrue(any("version mismatch with" in err for err in errors))
 
+    def test_lint_contract_file_reports_endpoint_drift_in_both_directions(self):
+        drifted_api_text = self.api_text.replace(
+            "  /attendance/records/{recordId}/reject:", "  /attendance/records/{recordId}/archive:"
+        )
+        self.assertNotEqual(drifted_api_text, self.api_text)
+        with self.project_temp_dir() as temp_dir:
+            contract_path = self.write_contract_and_api(
+                pathlib.Path(temp_dir), self.contract_text, api_text=drifted_api_text
+            )
+            errors = self.module.lint_contract_file(contract_path, self.validator)
+        self.assertEqual(len(errors), 2)
+        self.assertIn("api.endpoints entry POST /attendance/records/{recordId}/reject has no matching", errors[0])
+        self.assertIn("operation POST /attendance/records/{recordId}/archive is not listed", errors[1])
+
+    def test_contract_references_resolve_against_one_repo_listing(self):
+        repo_paths = importlib.import_module("repo_paths")
+        listing = repo_paths.load_repo_paths(cwd=str(ROOT))
+        contract_paths = sorted((ROOT / "specs").rglob("contract.yaml"))
+        self.assertEqual(self.module.check_contract_references(contract_paths, listing), [])
+
+        broken_text = self.contract_text.replace(
+            "  - specs/common/time-and-payroll-rules.md",
+            "  - specs/common/time-and-payroll-rules.md\n  - ./adr/ADR-9999-missing.md\n  - work-items/WI-00*.md",
+            1,
+        )
+        with self.project_temp_dir() as temp_dir:
+            contract_path = self.write_contract_and_api(pathlib.Path(temp_dir), broken_text, api_text=None)
+            errors = self.module.check_contract_references([contract_path], listing)
+        self.assertEqual(len(errors), 1)
+        self.assertRegex(errors[0], r"contract\.yaml:\d+: references entry `\./adr/ADR-9999-missing\.md` does not exist")
+
+    def test_endpoint_index_normalizes_params_and_resolves_path_item_refs(self):
+        contract_data = {
+            "api": {
+                "endpoints": [
+                    {"method": "post", "path": "/payroll/runs/{runId}/confirm/"},
+                    {"method": "GET", "path": "/payroll/runs"},
+                ]
+            }
+        }
+        api_data = {
+            "info": {"version": "1.0.0"},
+            "paths": {
+                "/payroll/runs/{id}/confirm": {"$ref": "#/components/pathItems/Confirm"},
+                "/payroll/runs": {"get": {}, "parameters": []},
+            },
+            "components": {
+                "pathItems": {
+                    "Confirm": {"$ref": "#/components/pathItems/ConfirmV1"},
+                    "ConfirmV1": {"post": {}},
+                }
+            },
+        }
+        api_doc = self.module.OpenApiDocument.from_payload(self.module.compile_openapi(api_data), "api.yaml")
+        self.assertEqual(api_doc.errors, [])
+        self.assertEqual(self.module.check_endpoint_coverage("contract.yaml", contract_data, api_doc), [])
+
+        api_data["components"]["pathItems"]["ConfirmV1"] = {"$ref": "#/components/pathItems/Confirm"}
+        api_doc = self.module.OpenApiDocument.from_payload(self.module.compile_openapi(api_data), "api.yaml")
+        self.assertEqual(len(api_doc.errors), 1)
+        self.assertIn("api.yaml: circular $ref chain", api_doc.errors[0])
+        errors = self.module.check_endpoint_coverage("contract.yaml", contract_data, api_doc)
+        self.assertIn("has no matching operation", errors[0])
+
+    def test_compile_openapi_builds_ref_graph_and_allows_recursive_schemas(self):
+        api_data = {
+            "info": {"version": "1.0.0"},
+            "paths": {
+                "/nodes": {
+                    "get": {
+                        "responses": {
+                            "200": {"content": {"application/json": {"schema": {"$ref": "#/components/schemas/Node"}}}}
+                        }
+                    }
+                }
+            },
+            "components": {
+                "schemas": {
+                    "Node": {
+                        "type": "object",
+                        "properties": {
+                            "children": {"type": "array", "items": {"$ref": "#/components/schemas/Node"}},
+                            "owner": {"$ref": "#/components/schemas/Missing"},
+                        },
+                    }
+                }
+            },
+        }
+        payload = self.module.compile_openapi(api_data)
+        self.assertEqual(payload["version"], "1.0.0")
+        self.assertEqual(payload["operations"], [["GET", "/nodes", "GET /nodes"]])
+        self.assertEqual(
+            payload["refs"],
+            {
+                "#/components/schemas/Node": ["#/components/schemas/Missing", "#/components/schemas/Node"],
+                "#/paths/~1nodes": ["#/components/schemas/Node"],
+            },
+        )
+        self.assertEqual(payload["errors"], ["unresolved $ref '#/components/schemas/Missing'"])
+
+    def test_load_openapi_reuses_compiled_document_by_content_hash(self):
+        original_compile = self.module.compile_openapi
+        calls = []
+
+        def counting_compile(data):
+            calls.append(data)
+            return original_compile(data)
+
+        try:
+            self.module.compile_openapi = counting_compile
+            first = self.module.load_openapi(self.api_text, "base:specs/attendance/api.yaml")
+            second = self.module.load_openapi(self.api_text, "head:specs/attendance/api.yaml")
+        finally:
+            self.module.compile_openapi = original_compile
+
+        self.assertLessEqual(len(calls), 1)
+        self.assertEqual(first.digest, second.digest)
+        self.assertEqual(second.label, "head:specs/attendance/api.yaml")
+        self.assertEqual(first.version, self.contract_version)
+
+    def test_openapi_cache_is_keyed_by_the_compiler_sources(self):
+        tree_state = importlib.import_module("tree_state")
+        sources = [str(path) for path in self.module.CHECKER_SOURCES]
+        self.assertIn(str(MODULE_PATH), sources)
+        self.assertEqual(self.module.OPENAPI_CACHE_VERSION, tree_state.source_fingerprint(sources))
+
+        # A payload written by an older compiler is never served for the same content.
+        original_cache = self.module.OPENAPI_CACHE
+        try:
+            cache = self.module.OPENAPI_CACHE = self.module.ContentCache.in_memory("openapi")
+            stale = dict(self.module.compile_openapi({"info": {"version": "9.9.9"}}), digest="stale")
+            cache.put(self.module.content_hash("1", self.api_text), stale)
+            document = self.module.load_openapi(self.api_text, "head:specs/attendance/api.yaml")
+        finally:
+            self.module.OPENAPI_CACHE = original_cache
+        self.assertEqual(document.version, self.contract_version)
+
+    def test_check_api_contract_coupling_ignores_formatting_only_change(self):
+        original_git_show = self.module.git_show
+        reformatted = "# reformatted\n" + self.api_text
+
+        def fake_git_show(sha: str, _path: str, _store=None):
+            return self.api_text if sha == "base" else reformatted
+
+        try:
+            self.module.git_show = fake_git_show
+            errors = self.module.check_api_contract_coupling("base", "head", [], ["specs/attendance/api.yaml"])
+        finally:
+            self.module.git_show = original_git_show
+        self.assertEqual(errors, [])
+
     def test_check_api_contract_coupling_blocks_api_only_change(self):
         original_git_show = self.module.git_show
 
-        def fake_git_show(sha: str, path: str):
+        def fake_git_show(sha: str, path: str, _store=None):
             if path != "specs/attendance/api.yaml":
                 return None
             if sha == "base":
@@ -110,7 +314,7 @@ class CheckContractsRegressionTest(unittest.TestCase):
     def test_check_api_contract_coupling_allows_api_change_with_contract_change(self):
         original_git_show = self.module.git_show
 
-        def fake_git_show(_sha: str, _path: str):
+        def fake_git_show(_sha: str, _path: str, _store=None):
             return "changed"
 
         try:
@@ -130,7 +334,7 @@ class CheckContractsRegressionTest(unittest.TestCase):
         old_contract = "version: 1.2.1\nbreaking_changes: false\n"
         new_contract = "version: 1.2.1\nbreaking_changes: false\n"
 
-        def fake_git_show(sha: str, _path: str):
+        def fake_git_show(sha: str, _path: str, _store=None):
             if sha == "base":
                 return old_contract
             if sha == "head":
@@ -149,7 +353,7 @@ class CheckContractsRegressionTest(unittest.TestCase):
         old_contract = "version: 1.2.1\nbreaking_changes: false\n"
         new_contract = "version: 1.2.2\nbreaking_changes: true\n"
 
-        def fake_git_show(sha: str, _path: str):
+        def fake_git_show(sha: str, _path: str, _store=None):
             if sha == "base":
                 return old_contract
             if sha == "head":
@@ -163,6 +367,290 @@ class CheckContractsRegressionTest(unittest.TestCase):
         finally:
             self.module.git_show = original_git_show
 
+    def run_versioning_with_specs(self, old_files, new_files):
+        original_git_show = self.module.git_show
+
+        def fake_git_show(sha: str, path: str, _store=None):
+            files = old_files if sha == "base" else new_files
+            return files.get(path)
+
+        try:
+            self.module.git_show = fake_git_show
+            return self.module.check_versioning("base", "head", ["specs/attendance/contract.yaml"])
+        finally:
+            self.module.git_show = original_git_show
+
+    def test_check_versioning_detects_unflagged_breaking_api_changes(self):
+        new_version = bump_patch(self.contract_version)
+        new_contract = self.contract_text.replace(
+            f"version: {self.contract_version}", f"version: {new_version}", 1
+        )
+        new_api = self.api_text.replace(f"version: {self.contract_version}", f"version: {new_version}", 1)
+        new_api = new_api.replace("  /attendance/records/{recordId}/reject:", "  /attendance/records/{recordId}/deny:")
+        errors = self.run_versioning_with_specs(
+            {"specs/attendance/contract.yaml": self.contract_text, "specs/attendance/api.yaml": self.api_text},
+            {"specs/attendance/contract.yaml": new_contract, "specs/attendance/api.yaml": new_api},
+        )
+        self.assertEqual(len(errors), 2)
+        self.assertIn("breaking changes detected but breaking_changes=false", errors[0])
+        self.assertTrue(errors[0].endswith(": removed path /attendance/records/{}/reject"))
+        self.assertIn("MAJOR changes require a MAJOR bump", errors[1])
+
+    def test_check_versioning_requires_minor_bump_for_additive_changes(self):
+        old_contract = "version: 1.2.1\nbreaking_changes: false\napi:\n  endpoints:\n    - method: GET\n      path: /a\n"
+        added = old_contract + "    - method: GET\n      path: /b\n"
+        errors = self.run_versioning_with_specs(
+            {"specs/attendance/contract.yaml": old_contract},
+            {"specs/attendance/contract.yaml": added.replace("1.2.1", "1.2.2")},
+        )
+        self.assertEqual(len(errors), 1)
+        self.assertIn("MINOR changes require a MINOR bump (old=1.2.1, new=1.2.2): added endpoint GET /b", errors[0])
+
+        errors = self.run_versioning_with_specs(
+            {"specs/attendance/contract.yaml": old_contract},
+            {"specs/attendance/contract.yaml": added.replace("1.2.1", "1.3.0")},
+        )
+        self.assertEqual(errors, [])
+
+    def test_structural_diff_classifies_only_edited_subtrees(self):
+        structural_diff = importlib.import_module("structural_diff")
+        old_api = {
+            "info": {"version": "1.0.0"},
+            "paths": {
+                "/runs/{runId}": {
+                    "get": {
+                        "parameters": [
+                            {"in": "query", "name": "state", "schema": {"type": "string", "enum": ["A", "B"]}},
+                            {"in": "query", "name": "from", "required": False},
+                        ],
+                        "responses": {"200": {"description": "ok"}},
+                    }
+                }
+            },
+        }
+        new_api = {
+            "info": {"version": "2.0.0"},
+            "paths": {
+                "/runs/{id}": {
+                    "get": {
+                        "parameters": [
+                            {"in": "query", "name": "from", "required": True},
+                            {"in": "query", "name": "state", "schema": {"type": "string", "enum": ["A"]}},
+                        ],
+                        "responses": {"200": {"description": "listed"}},
+                    }
+                }
+            },
+        }
+        changes = structural_diff.classify_diff(old_api, new_api, "openapi")
+        self.assertEqual(
+            [(change.level, change.description) for change in changes],
+            [
+                ("major", "paths./runs/{}.get.parameters.query:from.required became required"),
+                ("major", "narrowed enum: removed B at paths./runs/{}.get.parameters.query:state.schema.enum.\"B\""),
+                ("patch", "changed paths./runs/{}.get.responses.200.description"),
+            ],
+        )
+        self.assertEqual(structural_diff.change_level(changes), "major")
+        self.assertEqual(structural_diff.classify_diff(old_api, dict(old_api), "openapi"), [])
+
+    def test_structural_diff_classifies_requests_and_responses_in_opposite_directions(self):
+        structural_diff = importlib.import_module("structural_diff")
+
+        def api(schema):
+            body = {"content": {"application/json": {"schema": schema}}}
+            return {
+                "paths": {
+                    "/runs": {
+                        "post": {"requestBody": body, "responses": {"201": {"description": "ok", **body}}}
+                    }
+                }
+            }
+
+        old_schema = {"type": "object", "properties": {"state": {"enum": ["A", "B"]}}}
+        new_schema = {"type": "object", "required": ["state"], "properties": {"state": {"enum": ["A"]}}}
+        old_api, new_api = api(old_schema), api(new_schema)
+        new_api["paths"]["/runs"]["post"]["requestBody"] = old_api["paths"]["/runs"]["post"]["requestBody"]
+        changes = structural_diff.classify_diff(old_api, new_api, "openapi")
+        self.assertEqual([change.level for change in changes], ["minor", "minor"])
+        self.assertEqual(structural_diff.change_level(changes), "minor")
+        self.assertTrue(all("response" in change.description for change in changes), changes)
+
+        # The same edit to the request body is breaking, and the reverse edit breaks the response.
+        changes = structural_diff.classify_diff(api(old_schema), api(new_schema), "openapi")
+        self.assertEqual(sorted(change.level for change in changes), ["major", "major", "minor", "minor"])
+        changes = structural_diff.classify_diff(new_api, old_api, "openapi")
+        self.assertEqual([change.level for change in changes], ["major", "major"])
+
+    def test_fuzzed_contracts_lint_the_same_with_warm_and_cold_caches(self):
+        fuzz_checkers = importlib.import_module("fuzz_checkers")
+        [report] = fuzz_checkers.run_targets(["contract"], ROOT, seed=0, cases=60)
+        self.assertEqual(report.cases, 60)
+        self.assertEqual(report.failures, 0, report.mismatches)
+
+    def test_nul_delimited_diff_parser_handles_chunk_boundaries_and_renames(self):
+        git_objects = importlib.import_module("git_objects")
+        raw = b"M\0specs/a\tb/contract.yaml\0R087\0specs/old\nname/api.yaml\0specs/new/api.yaml\0D\0specs/x.md\0"
+        for read_size in (1, 5, 64):
+            entries = list(git_objects.parse_name_status_z(git_objects.iter_nul_fields(io.BytesIO(raw), read_size)))
+            self.assertEqual(
+                entries,
+                [
+                    git_objects.DiffEntry("M", "specs/a\tb/contract.yaml"),
+                    git_objects.DiffEntry("R087", "specs/new/api.yaml", "specs/old\nname/api.yaml"),
+                    git_objects.DiffEntry("D", "specs/x.md"),
+                ],
+            )
+        with self.assertRaises(RuntimeError):
+            list(git_objects.parse_name_status_z(iter(["R100", "specs/only-old.yaml"])))
+
+    def test_changed_spec_paths_stream_one_diff_with_unusual_names(self):
+        git_fixture_repos = importlib.import_module("git_fixture_repos")
+        git_objects = importlib.import_module("git_objects")
+        Commit = git_fixture_repos.Commit
+        repo = git_fixture_repos.shared_repo(
+            "unusual-names",
+            [
+                Commit(
+                    "base",
+                    "base",
+                    {
+                        name: "version: 1.0.0\n"
+                        for name in ("specs/tab\tdomain/contract.yaml", "specs/tab\tdomain/api.yaml", "specs/plain/rfc.md")
+                    },
+                ),
+                Commit(
+                    "head",
+                    "head",
+                    {"specs/tab\tdomain/contract.yaml": "version: 1.0.1\n", "specs/new\nline/api.yaml": "openapi: 3.1.0\n"},
+                ),
+            ],
+        )
+        with git_fixture_repos.inside(repo):
+            self.assertEqual(
+                self.module.get_changed_spec_paths("base", "head"),
+                (["specs/tab\tdomain/contract.yaml"], ["specs/new\nline/api.yaml"]),
+            )
+
+        stream = git_objects.stream_diff_entries("base", "head", "ACMRD", ["specs"], cwd=str(repo))
+        self.assertEqual(next(stream).status, "A")
+        stream.close()
+        with self.assertRaisesRegex(RuntimeError, "git diff failed"):
+            list(git_objects.stream_diff_entries("base", "no-such-rev", "ACMRD", ["specs"], cwd=str(repo)))
+
+    def test_map_ranges_workers_share_blob_contents(self):
+        git_fixture_repos = importlib.import_module("git_fixture_repos")
+        git_objects = importlib.import_module("git_objects")
+        barrier = threading.Barrier(2, timeout=10)
+        first_read = threading.Event()
+        stores = []
+
+        def check(base, head, store):
+            # Both workers hold their own store; the second reads only after the first.
+            stores.append(store)
+            barrier.wait()
+            if store is not stores[0]:
+                first_read.wait(timeout=10)
+            content = store.show(base, "specs/attendance/contract.yaml")
+            first_read.set()
+            return content
+
+        repo = str(self.scenario_repo())
+        results = git_objects.map_ranges(check, [("base", "scope-no-bump"), ("base", "api-only")], 2, cwd=repo)
+        self.assertEqual(results, [self.contract_text, self.contract_text])
+        self.assertEqual(len({id(store) for store in stores}), 2)
+        self.assertEqual(sum(store.blob_reads for store in stores), 1)
+
+    def test_read_ranges_file_accepts_both_range_forms(self):
+        with self.project_temp_dir() as temp_dir:
+            ranges_path = pathlib.Path(temp_dir) / "ranges.txt"
+            ranges_path.write_text(
+                "# release train\nbase1..head1\nbase2 head2  # second PR\n\n", encoding="utf-8"
+            )
+            ranges = self.module.read_ranges_file(ranges_path)
+            self.assertEqual(ranges, [("base1", "head1"), ("base2", "head2")])
+
+            ranges_path.write_text("base1..head1 extra\n", encoding="utf-8")
+            with self.assertRaises(ValueError):
+                self.module.read_ranges_file(ranges_path)
+
+    def test_check_ranges_reports_each_range(self):
+        original_run_diff_checks = self.module.run_diff_checks
+        # Both ranges must be in flight at once, so each worker thread gets its own store.
+        barrier = threading.Barrier(2, timeout=10)
+        stores = []
+
+        def fake_run_diff_checks(base: str, head: str, store=None):
+            self.assertIsInstance(store, self.module.GitObjectStore)
+            stores.append(store)
+            barrier.wait()
+            if head == "head-bad":
+                return [f"{base}..{head} failed"], []
+            return [], ["No changed contract.yaml files between provided SHAs."]
+
+        try:
+            self.module.run_diff_checks = fake_run_diff_checks
+            results = self.module.check_ranges([("base", "head-ok"), ("base", "head-bad")], workers=2)
+        finally:
+            self.module.run_diff_checks = original_run_diff_checks
+
+        self.assertEqual(len({id(store) for store in stores}), 2)
+        self.assertEqual(results[0], ("base..head-ok", []))
+        self.assertEqual(results[1], ("base..head-ba", ["base..head-bad failed"]))
+
+    def test_diff_checks_run_end_to_end_against_a_scenario_repo(self):
+        git_fixture_repos = importlib.import_module("git_fixture_repos")
+        expected = {
+            "scope-no-bump": (
+                ["specs/attendance/contract.yaml"],
+                [],
+                ["specs/attendance/contract.yaml: contract changed between"],
+            ),
+            "scope-patch-bump": (
+                ["specs/attendance/contract.yaml"],
+                [],
+                ["specs/attendance/contract.yaml: MINOR changes require a MINOR bump"],
+            ),
+            "scope-minor-bump": (["specs/attendance/contract.yaml"], [], []),
+            "api-only": (
+                [],
+                ["specs/attendance/api.yaml"],
+                ["specs/attendance/api.yaml: api.yaml changed between"],
+            ),
+            # A rename reads as an added contract: nothing at the new path to compare against.
+            "domain-rename": (["specs/time-attendance/contract.yaml"], ["specs/time-attendance/api.yaml"], []),
+            "api-deleted": ([], [], []),
+        }
+        with git_fixture_repos.inside(self.scenario_repo()):
+            for tag, (contracts, apis, error_prefixes) in expected.items():
+                with self.subTest(tag=tag):
+                    self.assertEqual(self.module.get_changed_spec_paths("base", tag), (contracts, apis))
+                    errors, _notes = self.module.run_diff_checks("base", tag)
+                    self.assertEqual(len(errors), len(error_prefixes), errors)
+                    for error, prefix in zip(errors, error_prefixes):
+                        self.assertTrue(error.startswith(prefix), error)
+
+            base, failing, passing = (git_fixture_repos.rev(tag) for tag in ("base", "scope-no-bump", "domain-rename"))
+            results = self.module.check_ranges([(base, failing), (base, passing)], workers=2)
+        self.assertEqual([label for label, _errors in results], [f"{base[:7]}..{failing[:7]}", f"{base[:7]}..{passing[:7]}"])
+        self.assertEqual([len(errors) for _label, errors in results], [1, 0])
+
+    def test_synthetic_history_ground_truth_matches_the_checkers(self):
+        bench_git_history = importlib.import_module("bench_git_history")
+        rates = bench_git_history.HistoryRates(contract=0.4, breaking=0.2, fixture=0.4, rename=0.3, violation=0.3)
+        generator = bench_git_history.HistoryGenerator(rates, domains=3, fixtures=6, work_items=5, seed=11)
+        with tempfile.TemporaryDirectory() as temp_dir:
+            repo = pathlib.Path(temp_dir) / "history.git"
+            truth = pathlib.Path(temp_dir) / "truth.jsonl"
+            kinds = bench_git_history.generate_history(repo, truth, 120, generator)
+            records = [json.loads(line) for line in truth.read_text(encoding="utf-8").splitlines()]
+            self.assertEqual(len(records), 119)
+            self.assertTrue(set(bench_git_history.VIOLATION_KINDS) & set(kinds))
+            self.assertTrue(any(record["change_control"] for record in records))
+            self.assertTrue(any(record["versioning"] for record in records))
+            with redirect_stdout(io.StringIO()) as report:
+                self.assertEqual(bench_git_history.check_sample(repo, truth, len(records), seed=0), 0, report.getvalue())
+
 
 if __name__ == "__main__":
     unittest.main(verbosity=2)
@@ -1,7 +1,17 @@
 #!/usr/bin/env python3
+import contextlib
+import importlib
 import importlib.util
+import io
+import json
+import os
 import pathlib
+import random
+import subprocess
+import sys
+import tempfile
 import unittest
+from decimal import ROUND_HALF_UP, Decimal
 
 
 ROOT = pathlib.Path(__file__).resolve().parents[2]
@@ -76,7 +86,7 @@ class CheckGoldenFixturesRegressionTest(unittest.TestCase):
     def test_detect_breaking_fixture_change_for_id_change(self):
         original_git_show = self.module.git_show
 
-        def fake_git_show(sha: str, _path: str):
+        def fake_git_show(sha: str, _path: str, _store=None):
             if sha == "base":
                 return '{"id":"GC-001","description":"old","inputs":{},"expected":{"payable_minutes":{"regular":1,"overtime":0,"night":0,"holiday":0},"gross_pay_krw":1000,"audit_events":["a"]}}'
             if sha == "head":
@@ -96,7 +106,7 @@ class CheckGoldenFixturesRegressionTest(unittest.TestCase):
     def test_detect_breaking_fixture_change_for_non_breaking_modify(self):
         original_git_show = self.module.git_show
 
-        def fake_git_show(_sha: str, _path: str):
+        def fake_git_show(_sha: str, _path: str, _store=None):
             return '{"id":"GC-001","description":"same","inputs":{},"expected":{"payable_minutes":{"regular":1,"overtime":0,"night":0,"holiday":0},"gross_pay_krw":1000,"audit_events":["a"]}}'
 
         try:
@@ -109,6 +119,826 @@ class CheckGoldenFixturesRegressionTest(unittest.TestCase):
         finally:
             self.module.git_show = original_git_show
 
+    def test_enforce_change_control_routes_one_streamed_diff(self):
+        git_objects = importlib.import_module("git_objects")
+        original_iter = self.module.iter_changed_entries
+        requested = []
+
+        def fake_iter(base, head, pathspecs, _store=None):
+            requested.append(pathspecs)
+            yield git_objects.DiffEntry("R100", "qa/archive/GC-001.json", "qa/golden/fixtures/GC-001-standard-day.json")
+            yield git_objects.DiffEntry("M", "work-items/WI-0024-golden-change-control-gate.md")
+            yield git_objects.DiffEntry("M", "specs/payroll/contract.yaml")
+
+        try:
+            self.module.iter_changed_entries = fake_iter
+            errors = self.module.enforce_change_control("base", "head")
+        finally:
+            self.module.iter_changed_entries = original_iter
+
+        self.assertEqual(requested, [["qa/golden/fixtures", "work-items", "specs", "adr"]])
+        self.assertEqual(errors, ["Breaking golden fixture change requires ADR update under adr/ADR-*.md."])
+
+    def test_audit_automaton_accepts_repo_fixture_sequences(self):
+        audit_lifecycle = importlib.import_module("audit_lifecycle")
+        original_cwd = os.getcwd()
+        try:
+            os.chdir(ROOT)
+            automaton = audit_lifecycle.load_audit_automaton()
+        finally:
+            os.chdir(original_cwd)
+
+        self.assertIn("payroll.deductions.calculated", automaton.symbols)
+        self.assertLess(automaton.state_count, len(automaton.names) + 1)
+        sequences = [
+            (path, json.loads(path.read_text(encoding="utf-8"))["expected"]["audit_events"])
+            for path in sorted((ROOT / "qa" / "golden" / "fixtures").glob("*.json"))
+        ]
+        self.assertEqual(self.module.check_audit_sequences(sequences, automaton), [])
+
+    def test_audit_automaton_reports_first_illegal_transition(self):
+        audit_lifecycle = importlib.import_module("audit_lifecycle")
+        automaton = audit_lifecycle.compile_automaton(
+            ["attendance.recorded.v1", "attendance.approved", "payroll.calculated", "payroll.confirmed"],
+            {
+                "^": ("attendance.recorded",),
+                "attendance.recorded": ("attendance.approved",),
+                "attendance.approved": ("payroll.calculated",),
+                "payroll.calculated": ("payroll.confirmed",),
+            },
+        )
+        sequences = [
+            ["attendance.recorded", "attendance.approved", "payroll.calculated", "payroll.confirmed"],
+            ["attendance.recorded", "payroll.calculated"],
+            ["payroll.calculated"],
+            ["attendance.recorded", "attendance.approved", "payroll.recalculated"],
+            ["attendance.recorded", "payroll.calculated"],
+        ]
+        self.assertEqual(audit_lifecycle.first_illegal_transitions(automaton, sequences), [-1, 1, 0, 2, 1])
+
+        errors = self.module.check_audit_sequences(
+            [(pathlib.Path(f"GC-{idx}.json"), sequence) for idx, sequence in enumerate(sequences[1:4])], automaton
+        )
+        self.assertEqual(
+            errors,
+            [
+                "GC-0.json: expected.audit_events[1] 'payroll.calculated' cannot follow 'attendance.recorded'",
+                "GC-1.json: expected.audit_events[0] 'payroll.calculated' cannot start an audit event sequence",
+                "GC-2.json: expected.audit_events[2] 'payroll.recalculated' is not a domain or contract audit event",
+            ],
+        )
+
+        with self.assertRaises(ValueError):
+            audit_lifecycle.compile_automaton(["attendance.recorded"], {"^": ("attendance.approved",)})
+
+    def test_replayed_totals_detect_hand_edited_correction_fixture(self):
+        path = ROOT / "qa" / "golden" / "fixtures" / "GC-005-retroactive-recalc.json"
+        payload = json.loads(path.read_text(encoding="utf-8"))
+        self.assertEqual(self.module.check_replayed_totals(path, payload["inputs"], payload["expected"]), [])
+
+        expected = {**payload["expected"], "gross_pay_krw": 125000}
+        expected["payable_minutes"] = {**expected["payable_minutes"], "overtime": 75}
+        errors = self.module.check_replayed_totals(path, payload["inputs"], expected)
+        self.assertEqual(len(errors), 2)
+        self.assertIn("payable_minutes.overtime=75 but replaying corrections gives 90", errors[0])
+        self.assertIn("gross_pay_krw=125000 but replaying corrections gives 128125", errors[1])
+
+    def test_replay_engine_reuses_shared_correction_prefixes(self):
+        attendance_replay = importlib.import_module("attendance_replay")
+        engine = attendance_replay.ReplayEngine()
+        inputs = {
+            "check_in": "2026-02-10T22:00:00+09:00",
+            "check_out": "2026-02-11T06:00:00+09:00",
+            "break_minutes": 0,
+            "hourly_rate_krw": 10000,
+        }
+        base = attendance_replay.fixture_events(inputs)
+        chain = [
+            attendance_replay.AttendanceEvent("corrected", (("check_out", f"2026-02-11T0{hour}:00:00+09:00"),))
+            for hour in range(7, 10)
+        ]
+
+        final = engine.replay(base + chain)
+        self.assertEqual(engine.applied, 4)
+        self.assertEqual(final.check_out, "2026-02-11T09:00:00+09:00")
+        engine.replay(base + chain[:2] + [chain[0]])
+        self.assertEqual(engine.applied, 5)
+
+        result = engine.evaluate({**inputs, "retroactive_update": {"check_out": "2026-02-11T07:00:00+09:00"}})
+        self.assertEqual(engine.applied, 5)
+        self.assertEqual(result.payable_minutes, {"regular": 240, "overtime": 60, "night": 240, "holiday": 0})
+        self.assertEqual(result.gross_pay_krw, 40000 + 15000 + 45000 + 20000)
+        self.assertEqual(
+            engine.evaluate({**inputs, "retroactive_update": {"check_out": "x", "approved": False}}).state.check_out,
+            inputs["check_out"],
+        )
+
+    def test_deduction_profile_evaluators_are_compiled_once_per_version(self):
+        deduction_profile = importlib.import_module("deduction_profile")
+        raw = {
+            "profile_id": "DP-KR-STD",
+            "profile_version": 3,
+            "withholding_rate": 0.03,
+            "social_insurance_rate": 0.0455,
+            "fixed_other_deduction_krw": 2000,
+        }
+        profile = deduction_profile.parse_profile(raw)
+        cache = deduction_profile.ProfileCache(maxsize=2)
+        gross = [0, 1, 16, 120000, 3_333_350, 10**15 + 5]
+        columns = cache.evaluate(profile, gross)
+        for idx, amount in enumerate(gross):
+            withholding = int((Decimal(amount) * Decimal("0.03")).quantize(Decimal(1), rounding=ROUND_HALF_UP))
+            social = int((Decimal(amount) * Decimal("0.0455")).quantize(Decimal(1), rounding=ROUND_HALF_UP))
+            row = columns.row(idx)
+            self.assertEqual((row["withholdingTaxKrw"], row["socialInsuranceKrw"]), (withholding, social))
+            self.assertEqual(row["totalDeductionsKrw"], withholding + social + 2000)
+            self.assertEqual(row["netPayKrw"], amount - row["totalDeductionsKrw"])
+
+        cache.evaluate(deduction_profile.parse_profile(dict(raw)), [1])
+        cache.evaluate(deduction_profile.parse_profile({**raw, "profile_version": 4, "withholding_rate": 0.04}), [1])
+        self.assertEqual(cache.compiled, 2)
+        cache.evaluate(deduction_profile.parse_profile({**raw, "profile_version": 5}), [1])
+        cache.evaluate(profile, [1])
+        self.assertEqual(cache.compiled, 4)
+
+        with self.assertRaisesRegex(ValueError, "bump profile_version"):
+            cache.evaluate(deduction_profile.parse_profile({**raw, "fixed_other_deduction_krw": 2500}), [1])
+        # Version 4 was evicted from the LRU, but its rates are still remembered.
+        self.assertNotIn(("DP-KR-STD", 4), cache.entries)
+        with self.assertRaisesRegex(ValueError, "bump profile_version"):
+            cache.evaluate(deduction_profile.parse_profile({**raw, "profile_version": 4}), [1])
+        for bad in ({"withholding_rate": 1.5}, {"social_insurance_rate": 0.00001}, {"profile_version": 0}):
+            with self.assertRaises(ValueError):
+                deduction_profile.parse_profile({**raw, **bad})
+
+    def test_profile_mode_previews_are_priced_by_the_profile(self):
+        path = ROOT / "qa" / "golden" / "fixtures" / "GC-006-phase2-deduction-profile.json"
+        payload = json.loads(path.read_text(encoding="utf-8"))
+        preview = self.module.profile_preview(path, payload["inputs"], payload["expected"])
+        cache = importlib.import_module("deduction_profile").ProfileCache()
+        self.assertEqual(self.module.check_profile_previews([preview], cache), [])
+
+        edited = (path, preview[1], preview[2], {**preview[3], "socialInsuranceKrw": 5000, "netPayKrw": 109400})
+        errors = self.module.check_profile_previews([preview, edited], cache)
+        self.assertEqual(cache.compiled, 1)
+        self.assertEqual(len(errors), 2)
+        self.assertIn("expected.phase2.socialInsuranceKrw=5000 but deduction profile DP-KR-STD v3 gives 5400", errors[0])
+        self.assertIn("expected.phase2.netPayKrw=109400", errors[1])
+
+        inputs = {key: value for key, value in payload["inputs"].items() if key != "deduction_profile"}
+        with self.assertRaisesRegex(ValueError, "inputs.deduction_profile must be an object"):
+            self.module.profile_preview(path, inputs, payload["expected"])
+
+    def test_profile_previews_with_negative_net_pay_are_rejected(self):
+        deduction_profile = importlib.import_module("deduction_profile")
+        profile = deduction_profile.parse_profile(
+            {
+                "profile_id": "DP-KR-STD",
+                "profile_version": 3,
+                "withholding_rate": 0.5,
+                "social_insurance_rate": 0.5,
+                "fixed_other_deduction_krw": 1,
+            }
+        )
+        columns = deduction_profile.ProfileCache().evaluate(profile, [0, 10, 1])
+        self.assertEqual(columns.net_pay_krw, [-1, -1, -2])
+        self.assertEqual(columns.negative_net_pay_rows(), [0, 1, 2])
+
+        path = pathlib.Path("qa/golden/fixtures/GC-999.json")
+        phase2 = dict(zip(deduction_profile.PHASE2_AMOUNT_KEYS, (5, 5, 1, 11, -1)))
+        errors = self.module.check_profile_previews([(path, profile, 10, phase2)], deduction_profile.ProfileCache())
+        self.assertEqual(
+            errors,
+            [
+                f"{path}: deduction profile DP-KR-STD v3 gives netPayKrw=-1 for grossPayKrw=10; "
+                "the service rejects previews with negative net pay"
+            ],
+        )
+
+    def test_leave_accrual_settlement_columns_match_service_rules(self):
+        leave_accrual = importlib.import_module("leave_accrual")
+        ledger = leave_accrual.settle_accruals(
+            ["E-1", "E-2", "E-3"],
+            [2026, 2027],
+            [[3, 12, 20], [0, 18, 11]],
+            leave_accrual.AccrualPolicy(annual_grant_days=15, carry_over_cap_days=5),
+        )
+        self.assertEqual(list(ledger.carry_over_days[0]), [5, 3, 0])
+        self.assertEqual(list(ledger.granted_days[1]), [20, 15, 19])
+        self.assertEqual(
+            ledger.balances()["E-3"][1],
+            {"year": 2027, "carry_over_days": 4, "granted_days": 19, "remaining_days": 19},
+        )
+
+        with self.assertRaises(ValueError):
+            leave_accrual.settle_accruals(["E-1"], [2026, 2026], [[0], [0]], leave_accrual.AccrualPolicy())
+
+    def test_validate_fixture_dispatches_on_kind(self):
+        source = ROOT / "qa" / "golden" / "fixtures" / "GC-007-leave-accrual-carryover.json"
+        payload = json.loads(source.read_text(encoding="utf-8"))
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = pathlib.Path(temp_dir) / "fixture.json"
+            path.write_text(json.dumps(payload), encoding="utf-8")
+            self.assertEqual(self.module.validate_fixture(path, set()), [])
+
+            payload["expected"]["balances"]["E-3002"][1]["carry_over_days"] = 3
+            del payload["expected"]["balances"]["E-3003"]
+            path.write_text(json.dumps(payload), encoding="utf-8")
+            errors = self.module.validate_fixture(path, set())
+            self.assertEqual(len(errors), 2)
+            self.assertIn("expected.balances missing employee 'E-3003'", errors[0])
+            self.assertIn("E-3002[1].carry_over_days=3 but accrual settlement gives 0", errors[1])
+
+            payload["kind"] = "leave_balance"
+            path.write_text(json.dumps(payload), encoding="utf-8")
+            errors = self.module.validate_fixture(path, set())
+            self.assertEqual(len(errors), 1)
+            self.assertIn("unknown fixture kind 'leave_balance'", errors[0])
+
+    def test_schedule_sweep_finds_overlaps_rest_gaps_and_night_minutes(self):
+        schedule_sweep = importlib.import_module("schedule_sweep")
+        hour = 60 * 60 * 1000
+
+        def shift(schedule_id, employee_id, start_hour, hours):
+            # 2026-03-01T15:00Z is 2026-03-02T00:00 in Seoul.
+            start = 1772377200000 + start_hour * hour
+            return schedule_sweep.Assignment(schedule_id, employee_id, start, start + hours * hour)
+
+        summaries = schedule_sweep.sweep_schedules(
+            [
+                shift("S-3", "E-1", 30, 4),
+                shift("S-1", "E-1", 2, 20),
+                shift("S-2", "E-1", 8, 2),
+                shift("S-4", "E-2", 9, 9),
+                shift("S-5", "E-2", 18, 2),
+            ],
+            660,
+        )
+        self.assertEqual(summaries["E-1"].overlaps, [("S-1", "S-2")])
+        self.assertEqual(summaries["E-1"].rest_violations, [("S-1", "S-3")])
+        self.assertEqual(summaries["E-1"].night_minutes, 120 + 0 + 0)
+        self.assertEqual(summaries["E-2"].to_dict(), {"overlaps": [], "rest_violations": [], "night_minutes": 0})
+
+        # Nested shifts pair with every shift they intersect; shared night minutes count once.
+        nested = schedule_sweep.sweep_schedules(
+            [shift("A", "E-3", 0, 10), shift("B", "E-3", 1, 2), shift("C", "E-3", 2, 2), shift("D", "E-3", 3, 1)],
+            660,
+        )
+        self.assertEqual(nested["E-3"].overlaps, [("A", "B"), ("A", "C"), ("B", "C"), ("A", "D"), ("C", "D")])
+        self.assertEqual(nested["E-3"].rest_violations, [])
+        self.assertEqual(nested["E-3"].night_minutes, 240)
+
+    def test_validate_scheduling_fixture_reports_sweep_mismatches(self):
+        path = ROOT / "qa" / "golden" / "fixtures" / "GC-008-scheduling-overlap-rest.json"
+        payload = json.loads(path.read_text(encoding="utf-8"))
+        self.assertEqual(self.module.validate_scheduling_expected(path, payload["inputs"], payload["expected"]), [])
+
+        payload["expected"]["employees"]["E-4001"]["overlaps"] = []
+        payload["expected"]["employees"]["E-4003"]["night_minutes"] = 480
+        errors = self.module.validate_scheduling_expected(path, payload["inputs"], payload["expected"])
+        self.assertEqual(len(errors), 2)
+        self.assertIn('E-4001.overlaps=[] but schedule sweep gives [["S-002", "S-003"]]', errors[0])
+        self.assertIn("E-4003.night_minutes=480 but schedule sweep gives 450", errors[1])
+
+        payload["inputs"]["assignments"][0]["end_at"] = payload["inputs"]["assignments"][0]["start_at"]
+        errors = self.module.validate_scheduling_expected(path, payload["inputs"], payload["expected"])
+        self.assertEqual(len(errors), 1)
+        self.assertIn("inputs.assignments[0]: end_at must be after start_at", errors[0])
+
+    def test_pay_kernel_matches_decimal_reference(self):
+        pay_kernel = importlib.import_module("pay_kernel")
+        rng = random.Random(41)
+        choices = (1.0, 1.25, 1.5, 1.75, 2.0, 2.5)
+        for _ in range(2000):
+            multipliers = {name: rng.choice(choices) for name in ("regular", "overtime", "night", "holiday")}
+            weights = pay_kernel.PayWeights.from_multipliers(multipliers)
+            holiday = rng.randint(1, 480) if rng.random() < 0.3 else 0
+            minutes = {
+                "regular": 0 if holiday else rng.randint(0, 480),
+                "overtime": rng.randint(0, 600),
+                "night": 0 if holiday else rng.randint(0, 480),
+                "holiday": holiday,
+            }
+            rate = rng.randint(9000, 60000)
+            expected = pay_kernel.gross_pay_reference(minutes, rate, multipliers)
+            self.assertEqual(pay_kernel.gross_pay(minutes, rate, multipliers), expected, (minutes, rate, multipliers))
+            batch = pay_kernel.gross_pay_batch(
+                [minutes["regular"]], [minutes["overtime"]], [minutes["night"]], [minutes["holiday"]], [rate], weights
+            )
+            self.assertEqual(batch, [expected])
+
+        # 394278.5 KRW exactly: binary floats land on ...278.4999 and round down.
+        minutes = {"regular": 0, "overtime": 254, "night": 0, "holiday": 80}
+        multipliers = {"regular": 2.0, "overtime": 2.0, "night": 1.75, "holiday": 1.75}
+        self.assertEqual(pay_kernel.gross_pay(minutes, 22990, multipliers), 394279)
+        self.assertEqual(pay_kernel.gross_pay_reference(minutes, 22990, multipliers), 394279)
+
+    def test_pay_kernel_guards_scale_and_int64_bounds(self):
+        pay_kernel = importlib.import_module("pay_kernel")
+        with self.assertRaises(ValueError):
+            pay_kernel.scale_multiplier(1.0005, "night")
+        with self.assertRaises(ValueError):
+            pay_kernel.scale_multiplier(True, "night")
+        self.assertEqual(pay_kernel.scale_multiplier(1.5, "night"), 1500)
+        self.assertEqual(pay_kernel.round_worked_minutes(29_999), 0)
+        self.assertEqual(pay_kernel.round_worked_minutes(90_000), 2)
+
+        weights = pay_kernel.PayWeights.from_multipliers(
+            {"regular": 1.0, "overtime": 1.5, "night": 1.5, "holiday": 1.5}
+        )
+        self.assertFalse(pay_kernel.fits_int64([[10**6]], [10**9], weights))
+        huge = pay_kernel.gross_pay_batch([10**6], [0], [0], [0], [10**9], weights)
+        self.assertEqual(huge, [(10**15 + 30) // 60])
+
+    def test_pay_kernel_numpy_path_matches_python_rows(self):
+        pay_kernel = importlib.import_module("pay_kernel")
+        deduction_profile = importlib.import_module("deduction_profile")
+        if pay_kernel.np is None:
+            self.skipTest("numpy is not installed")
+        rng = random.Random(43)
+        weights = pay_kernel.PayWeights.from_multipliers(
+            {"regular": 1.0, "overtime": 1.5, "night": 1.75, "holiday": 2.0}
+        )
+        holiday = [rng.randint(1, 480) if rng.random() < 0.2 else 0 for _ in range(5000)]
+        columns = (
+            [0 if h else rng.randint(0, 480) for h in holiday],
+            [rng.randint(0, 600) for _ in holiday],
+            [0 if h else rng.randint(0, 480) for h in holiday],
+            holiday,
+            [rng.randint(9_860, 60_000) for _ in holiday],
+        )
+        arrays = pay_kernel.int64_columns(*columns)
+        self.assertIsNotNone(arrays)
+        self.assertTrue(pay_kernel.fits_int64(arrays[:4], arrays[4], weights))
+        expected = [pay_kernel.gross_pay_row(*row, weights) for row in zip(*columns)]
+        self.assertEqual(pay_kernel.gross_pay_batch(*columns, weights), expected)
+        self.assertEqual(pay_kernel.gross_pay_batch(*arrays, weights), expected)
+        self.assertEqual(pay_kernel.gross_pay_batch(*([] for _ in columns), weights), [])
+        self.assertIsNone(pay_kernel.int64_columns([2**64]))
+
+        profile = deduction_profile.parse_profile(
+            {"profile_id": "numpy", "profile_version": 1, "withholding_rate": 0.033, "social_insurance_rate": 0.0945}
+        )
+        evaluate = deduction_profile.compile_profile(profile)
+        for gross in (expected, [2**62], [2**64]):
+            columns = evaluate(gross)
+            self.assertEqual(columns.withholding_tax_krw, [(g * 330 + 5000) // 10_000 for g in gross])
+            self.assertEqual(columns.net_pay_krw, [g - total for g, total in zip(gross, columns.total_deductions_krw)])
+
+    def test_worked_minutes_round_to_the_nearest_minute_at_the_30s_boundary(self):
+        attendance_replay = importlib.import_module("attendance_replay")
+        simulate_payroll_month = importlib.import_module("simulate_payroll_month")
+        records = [
+            {"employee_id": "E-29", "check_in": "2026-03-02T01:00:00+09:00", "check_out": "2026-03-02T10:00:29+09:00"},
+            {"employee_id": "E-30", "check_in": "2026-03-02T01:00:00+09:00", "check_out": "2026-03-02T10:00:30+09:00"},
+            {"employee_id": "N-30", "check_in": "2026-03-02T03:58:00+09:00", "check_out": "2026-03-02T03:59:30+09:00"},
+        ]
+        for record in records:
+            record["break_minutes"] = 60
+            record["hourly_rate_krw"] = 10030
+        records[2]["break_minutes"] = 0
+
+        expected = {
+            "E-29": {"regular": 300, "overtime": 0, "night": 180, "holiday": 0},
+            "E-30": {"regular": 300, "overtime": 1, "night": 180, "holiday": 0},
+            # 90 seconds inside the window round to two night minutes.
+            "N-30": {"regular": 0, "overtime": 0, "night": 2, "holiday": 0},
+        }
+        engine = attendance_replay.ReplayEngine()
+        for record in records:
+            self.assertEqual(engine.evaluate(record).payable_minutes, expected[record["employee_id"]])
+
+        output = io.StringIO()
+        source = io.StringIO("\n".join(json.dumps(record) for record in records) + "\n")
+        simulate_payroll_month.simulate(source, "jsonl", "2026-03", output, 100, False, "month.jsonl")
+        results = {row["employee_id"]: row for row in map(json.loads, output.getvalue().splitlines())}
+        for employee_id, minutes in expected.items():
+            self.assertEqual(results[employee_id]["payable_minutes"], minutes)
+
+    def test_month_simulator_uses_workday_boundary_and_matches_replay(self):
+        attendance_replay = importlib.import_module("attendance_replay")
+        simulate_payroll_month = importlib.import_module("simulate_payroll_month")
+        records = [
+            # 02:00 on the 1st still belongs to the last business day of February.
+            {"employee_id": "E-1", "check_in": "2026-03-01T02:00:00+09:00", "check_out": "2026-03-01T06:00:00+09:00"},
+            {"employee_id": "E-1", "check_in": "2026-03-02T09:00:00+09:00", "check_out": "2026-03-02T20:00:00+09:00"},
+            # 02:00 on 1 April is still 31 March.
+            {"employee_id": "E-2", "check_in": "2026-03-31T22:00:00+09:00", "check_out": "2026-04-01T07:30:00+09:00"},
+            {"employee_id": "E-2", "check_in": "2026-04-01T02:00:00+09:00", "check_out": "2026-04-01T03:00:00+09:00"},
+            {"employee_id": "E-2", "check_in": "2026-04-01T04:00:00+09:00", "check_out": "2026-04-01T05:00:00+09:00"},
+            {
+                "employee_id": "E-2",
+                "original": {"check_in": "2026-03-15T09:00:00+09:00", "check_out": "2026-03-15T18:00:00+09:00"},
+                "approved_correction": {"corrected_check_in": "2026-03-15T08:00:00+09:00"},
+                "is_holiday": True,
+                "multipliers": {"holiday": 2.0},
+            },
+        ]
+        for record in records:
+            record.setdefault("break_minutes", 60)
+            record["hourly_rate_krw"] = 10030
+
+        engine = attendance_replay.ReplayEngine()
+        expected = {}
+        for record in records[1:4] + records[5:]:
+            result = engine.evaluate(record)
+            totals = expected.setdefault(record["employee_id"], {"records": 0, "gross": 0, "minutes": {}})
+            totals["records"] += 1
+            totals["gross"] += result.gross_pay_krw
+            for bucket, value in result.payable_minutes.items():
+                totals["minutes"][bucket] = totals["minutes"].get(bucket, 0) + value
+
+        fields = ["employee_id", "check_in", "check_out", "break_minutes", "hourly_rate_krw"]
+        csv_lines = [",".join(fields)] + [
+            ",".join(str(record[key]) for key in fields) for record in records if "check_in" in record
+        ]
+        with tempfile.TemporaryDirectory() as temp_dir:
+            sources = {"jsonl": "\n".join(json.dumps(record) for record in records) + "\n\nnot json\n"}
+            sources["csv"] = "\n".join(csv_lines) + "\n"
+            for fmt, text in sources.items():
+                source = pathlib.Path(temp_dir) / f"month.{fmt}"
+                source.write_text(text, encoding="utf-8")
+                for grouped, chunk_size in ((False, 100), (True, 2)):
+                    output = io.StringIO()
+                    with source.open(encoding="utf-8", newline="") as handle:
+                        simulator = simulate_payroll_month.simulate(
+                            handle, fmt, "2026-03", output, chunk_size, grouped, source.name
+                        )
+                    results = {row["employee_id"]: row for row in map(json.loads, output.getvalue().splitlines())}
+                    self.assertEqual(sorted(results), ["E-1", "E-2"])
+                    self.assertEqual(simulator.stats.outside_period, 2)
+                    if fmt == "jsonl":
+                        self.assertEqual(len(simulator.errors), 1)
+                        self.assertTrue(simulator.errors[0].startswith("month.jsonl:8: invalid JSON"))
+                        for employee_id, totals in expected.items():
+                            self.assertEqual(results[employee_id]["records"], totals["records"])
+                            self.assertEqual(results[employee_id]["payable_minutes"], totals["minutes"])
+                            self.assertEqual(results[employee_id]["gross_pay_krw"], totals["gross"])
+                    else:
+                        self.assertEqual(simulator.errors, [])
+                        self.assertEqual(results["E-2"]["records"], 2)
+                        self.assertEqual(results["E-1"]["gross_pay_krw"], expected["E-1"]["gross"])
+
+    def test_month_simulator_parses_csv_multipliers_as_decimals(self):
+        simulate_payroll_month = importlib.import_module("simulate_payroll_month")
+        rows = [
+            "employee_id,check_in,check_out,break_minutes,hourly_rate_krw,multiplier_night",
+            "E-1,2026-03-02T01:00:00+09:00,2026-03-02T05:00:00+09:00,0,10030,1.333",
+            # float() would round this to 1.0 and accept it.
+            "E-2,2026-03-02T09:00:00+09:00,2026-03-02T10:00:00+09:00,0,10030,1.0000000000000001",
+            "E-3,2026-03-02T09:00:00+09:00,2026-03-02T10:00:00+09:00,0,10030,nan",
+            "E-4,2026-03-02T09:00:00+09:00,2026-03-02T10:00:00+09:00,0,10030,x1.5",
+        ]
+        output = io.StringIO()
+        simulator = simulate_payroll_month.simulate(
+            io.StringIO("\n".join(rows) + "\n"), "csv", "2026-03", output, 100, False, "month.csv"
+        )
+        results = [json.loads(line) for line in output.getvalue().splitlines()]
+        self.assertEqual([row["employee_id"] for row in results], ["E-1"])
+        self.assertEqual(results[0]["gross_pay_krw"], (180 * 10030 * 1333 + 60 * 10030 * 1000 + 30_000) // 60_000)
+        self.assertEqual(len(simulator.errors), 3)
+        self.assertIn("month.csv:3: multipliers.night=1.0000000000000001 is not a non-negative multiple", simulator.errors[0])
+        self.assertIn("month.csv:4: invalid CSV value (multiplier_night='nan' is not a decimal number)", simulator.errors[1])
+        self.assertIn("month.csv:5: invalid CSV value (multiplier_night='x1.5' is not a decimal number)", simulator.errors[2])
+
+    def test_fixture_coverage_index_expands_ranges_and_reports_both_directions(self):
+        golden_coverage = importlib.import_module("golden_coverage")
+        self.assertEqual(
+            golden_coverage.scan_spec_refs(
+                "- `GC-004-holiday-overtime.json`\n"
+                "    - replay GC-001 through GC-003 fixtures\n"
+                "  - `GC-002` to `GC-003`, GC-009\n"
+                "no fixtures here\n"
+            ),
+            [
+                (1, "file", "GC-004-holiday-overtime.json"),
+                (2, "range", "GC-001..GC-003"),
+                (3, "range", "GC-002..GC-003"),
+                (3, "id", "GC-009"),
+            ],
+        )
+
+        names = ["GC-001-a.json", "GC-002-b.json", "GC-004-holiday-overtime.json", "GC-005-e.json"]
+        index = golden_coverage.build_coverage_index(
+            "qa/golden/fixtures",
+            names,
+            {
+                "specs/payroll/test-cases.md": [(4, "file", "GC-004-holiday-overtime.json"), (5, "file", "GC-002-old.json")],
+                "specs/payroll/contract.yaml": [(9, "range", "GC-001..GC-004")],
+            },
+        )
+        self.assertEqual(index.by_fixture["GC-001-a.json"], ["specs/payroll/contract.yaml:9"])
+        self.assertEqual(
+            index.by_fixture["GC-004-holiday-overtime.json"],
+            ["specs/payroll/contract.yaml:9", "specs/payroll/test-cases.md:4"],
+        )
+        self.assertEqual(index.by_location["specs/payroll/contract.yaml:9"], names[:3])
+        self.assertEqual(index.orphans(), ["GC-005-e.json"])
+        self.assertEqual(
+            index.dangling,
+            [
+                "specs/payroll/contract.yaml:9: golden fixture range GC-001 through GC-004 includes GC-003, "
+                "which is not in qa/golden/fixtures",
+                "specs/payroll/test-cases.md:5: cites golden fixture GC-002-old.json, which is not in qa/golden/fixtures",
+            ],
+        )
+
+    def test_fixture_coverage_rescans_only_changed_specs(self):
+        ci_cache = importlib.import_module("ci_cache")
+        git_fixture_repos = importlib.import_module("git_fixture_repos")
+        tree_state = importlib.import_module("tree_state")
+        golden_coverage = importlib.import_module("golden_coverage")
+        Commit = git_fixture_repos.Commit
+        original_scan = golden_coverage.scan_spec_refs
+        scanned = []
+
+        def counting_scan(text):
+            scanned.append(text.splitlines()[0])
+            return original_scan(text)
+
+        def coverage_state(store, cwd):
+            return tree_state.TreeSkip(
+                "golden_coverage", ["specs", "qa/golden/fixtures"], [str(MODULE_PATH)], store, cwd=str(cwd)
+            )
+
+        repo = git_fixture_repos.shared_repo(
+            "golden-coverage",
+            [
+                Commit(
+                    "specs",
+                    "specs",
+                    {
+                        "qa/golden/fixtures/GC-001-a.json": "{}\n",
+                        "qa/golden/fixtures/GC-002-b.json": "{}\n",
+                        "specs/attendance/test-cases.md": "# attendance\n- `GC-001-a.json`\n",
+                        "specs/payroll/test-cases.md": "# payroll\n- GC-001 through GC-002\n",
+                    },
+                ),
+                Commit("widen-range", "widen range", {"specs/payroll/test-cases.md": "# payroll\n- GC-001 to GC-003\n"}),
+            ],
+        )
+        with tempfile.TemporaryDirectory() as cache_dir, git_fixture_repos.checkout(repo, "specs") as clone:
+            try:
+                golden_coverage.scan_spec_refs = counting_scan
+                store = ci_cache.ContentCache("results", pathlib.Path(cache_dir))
+                files = sorted(pathlib.Path("qa/golden/fixtures").glob("*.json"))
+
+                self.assertEqual(
+                    golden_coverage.check_fixture_coverage("qa/golden/fixtures", files, coverage_state(store, clone)), []
+                )
+                self.assertEqual(scanned, ["# attendance", "# payroll"])
+                self.assertTrue(coverage_state(store, clone).unchanged())
+
+                subprocess.run(["git", "checkout", "-q", "widen-range"], cwd=clone, check=True, capture_output=True)
+                scanned.clear()
+                errors = golden_coverage.check_fixture_coverage(
+                    "qa/golden/fixtures", files, coverage_state(store, clone)
+                )
+                self.assertEqual(scanned, ["# payroll"])
+                self.assertEqual(len(errors), 1)
+                self.assertIn("range GC-001 through GC-003 includes GC-003", errors[0])
+            finally:
+                golden_coverage.scan_spec_refs = original_scan
+
+    def test_validate_fixtures_rechecks_only_changed_blobs(self):
+        ci_cache = importlib.import_module("ci_cache")
+        git_fixture_repos = importlib.import_module("git_fixture_repos")
+        tree_state = importlib.import_module("tree_state")
+        Commit = git_fixture_repos.Commit
+        fixture_dir = ROOT / "qa" / "golden" / "fixtures"
+        original_validate = self.module.validate_fixture
+        validated = []
+
+        def counting_validate(path, seen_ids, *args):
+            validated.append(path.name)
+            return original_validate(path, seen_ids, *args)
+
+        def fixture_state(store, cwd):
+            return tree_state.TreeSkip(
+                "check_golden_fixtures", ["qa/golden/fixtures"], [str(MODULE_PATH)], store, cwd=str(cwd)
+            )
+
+        overnight_path = "qa/golden/fixtures/GC-002-overnight-boundary.json"
+        overnight = (fixture_dir / "GC-002-overnight-boundary.json").read_text(encoding="utf-8")
+        duplicate = overnight.replace('"GC-002"', '"GC-001"', 1)
+        repo = git_fixture_repos.shared_repo(
+            "golden-fixture-blobs",
+            [
+                Commit(
+                    "fixtures",
+                    "fixtures",
+                    {
+                        "qa/golden/fixtures/GC-001-standard-day.json": (
+                            fixture_dir / "GC-001-standard-day.json"
+                        ).read_text(encoding="utf-8"),
+                        overnight_path: overnight,
+                    },
+                ),
+                Commit("duplicate-id", "duplicate id", {overnight_path: duplicate}),
+            ],
+        )
+        with tempfile.TemporaryDirectory() as cache_dir, git_fixture_repos.checkout(repo, "fixtures") as clone:
+            try:
+                self.module.validate_fixture = counting_validate
+                store = ci_cache.ContentCache("results", pathlib.Path(cache_dir))
+                files = sorted(pathlib.Path("qa/golden/fixtures").glob("*.json"))
+
+                self.assertEqual(self.module.validate_fixtures(files, fixture_state(store, clone)), [])
+                self.assertEqual(len(validated), 2)
+                self.assertTrue(fixture_state(store, clone).unchanged())
+
+                (clone / overnight_path).write_text(duplicate, encoding="utf-8")
+                self.assertFalse(fixture_state(store, clone).unchanged())
+                self.assertIsNone(fixture_state(store, clone).snapshot)
+
+                subprocess.run(["git", "checkout", "-q", "-f", "duplicate-id"], cwd=clone, check=True, capture_output=True)
+                validated.clear()
+                errors = self.module.validate_fixtures(files, fixture_state(store, clone))
+                self.assertEqual(validated, ["GC-002-overnight-boundary.json"])
+                self.assertEqual(len(errors), 1)
+                self.assertIn("duplicate fixture id 'GC-001'", errors[0])
+            finally:
+                self.module.validate_fixture = original_validate
+
+    def test_change_control_runs_end_to_end_against_a_scenario_repo(self):
+        git_fixture_repos = importlib.import_module("git_fixture_repos")
+        Commit = git_fixture_repos.Commit
+        fixture_dir = ROOT / "qa" / "golden" / "fixtures"
+        day = (fixture_dir / "GC-001-standard-day.json").read_text(encoding="utf-8")
+        overnight = (fixture_dir / "GC-002-overnight-boundary.json").read_text(encoding="utf-8")
+        day_path = "qa/golden/fixtures/GC-001-standard-day.json"
+        overnight_path = "qa/golden/fixtures/GC-002-overnight-boundary.json"
+        governed = {"work-items/WI-0001-golden.md": "# WI-0001\nupdated\n", "specs/payroll/contract.yaml": "version: 1.0.1\n"}
+        repo = git_fixture_repos.shared_repo(
+            "golden-change-control",
+            [
+                Commit(
+                    "base",
+                    "fixtures",
+                    {
+                        day_path: day,
+                        overnight_path: overnight,
+                        "work-items/WI-0001-golden.md": "# WI-0001\n",
+                        "specs/payroll/contract.yaml": "version: 1.0.0\n",
+                    },
+                ),
+                Commit("fixture-only", "edit", {day_path: day.replace('"description": "', '"description": "Edited: ', 1)}),
+                Commit(
+                    "governed-edit",
+                    "edit with links",
+                    {day_path: day.replace('"description": "', '"description": "Edited: ', 1), **governed},
+                    parent="base",
+                ),
+                Commit(
+                    "id-change",
+                    "renumber",
+                    {day_path: day.replace('"id": "GC-001"', '"id": "GC-101"', 1), **governed},
+                    parent="base",
+                ),
+                Commit(
+                    "rename-no-adr",
+                    "rename",
+                    governed,
+                    renames=[(overnight_path, "qa/golden/fixtures/GC-002-overnight.json")],
+                    parent="base",
+                ),
+                Commit(
+                    "delete-with-adr",
+                    "delete",
+                    {overnight_path: None, "adr/ADR-0002-drop-gc-002.md": "# ADR-0002\n", **governed},
+                    parent="base",
+                ),
+            ],
+        )
+        adr_error = "Breaking golden fixture change requires ADR update under adr/ADR-*.md."
+        expected = {
+            "fixture-only": [
+                "Golden fixtures changed without any linked work item update under work-items/WI-*.md.",
+                "Golden fixtures changed without any contract.yaml update under specs/*/contract.yaml.",
+            ],
+            "governed-edit": [],
+            "id-change": [adr_error],
+            "rename-no-adr": [adr_error],
+            "delete-with-adr": [],
+        }
+        with git_fixture_repos.inside(repo):
+            for tag, errors in expected.items():
+                with self.subTest(tag=tag):
+                    self.assertEqual(self.module.enforce_change_control("base", tag), errors)
+
+    def test_fuzzed_fast_paths_agree_with_reference_paths(self):
+        fuzz_checkers = importlib.import_module("fuzz_checkers")
+        reports = fuzz_checkers.run_targets(["pr-body", "audit", "replay", "fixture"], ROOT, seed=0, cases=300)
+        for report in reports:
+            self.assertEqual((report.target, report.cases, report.failures), (report.target, 300, 0), report.mismatches)
+
+        # A replay cache keyed on too little state must be caught.
+        attendance_replay = importlib.import_module("attendance_replay")
+
+        class StaleEngine(attendance_replay.ReplayEngine):
+            def payable_minutes(self, state):
+                minutes = self.minutes.get(state.check_in)
+                if minutes is None:
+                    minutes = self.minutes[state.check_in] = attendance_replay.payable_minutes(state)
+                return minutes
+
+        original_engine = fuzz_checkers.ReplayEngine
+        fuzz_checkers.ReplayEngine = StaleEngine
+        try:
+            [report] = fuzz_checkers.run_targets(["replay"], ROOT, seed=0, cases=300)
+        finally:
+            fuzz_checkers.ReplayEngine = original_engine
+        self.assertGreater(report.failures, 0)
+        self.assertIn("replayed attendance", report.mismatches[0])
+
+    def test_reporter_streams_findings_as_jsonl_and_sarif(self):
+        ci_report = importlib.import_module("ci_report")
+        finding = ci_report.parse_finding("golden/coverage", "specs/payroll/test-cases.md:12: cites GC-009")
+        self.assertEqual(
+            (finding.path, finding.line, finding.message), ("specs/payroll/test-cases.md", 12, "cites GC-009")
+        )
+        finding = ci_report.parse_finding("golden/fixtures", "qa/golden/fixtures/GC-001.json: 'id' must be a string")
+        self.assertEqual((finding.path, finding.line), ("qa/golden/fixtures/GC-001.json", None))
+        finding = ci_report.parse_finding("contracts/versioning", "Breaking change: bump major version")
+        self.assertEqual((finding.path, finding.message), (None, "Breaking change: bump major version"))
+
+        stream = io.StringIO()
+        reporter = ci_report.Reporter("golden-fixtures", "jsonl", stream=stream)
+        reporter.add("fixtures", "qa/golden/fixtures/GC-001.json: bad")
+        self.assertEqual(json.loads(stream.getvalue())["rule"], "golden-fixtures/fixtures")
+        reporter.add("coverage", "specs/a/test-cases.md:3: dangling")
+        self.assertEqual(reporter.finish("failed"), 1)
+        self.assertEqual([json.loads(line)["line"] for line in stream.getvalue().splitlines()], [None, 3])
+
+        stream = io.StringIO()
+        reporter = ci_report.Reporter("golden-fixtures", "sarif", stream=stream)
+        self.assertEqual(reporter.finish("failed"), 0)
+        self.assertEqual(json.loads(stream.getvalue())["runs"][0]["results"], [])
+
+        stream = io.StringIO()
+        reporter = ci_report.Reporter("golden-fixtures", "sarif", max_errors=2, stream=stream)
+        reporter.add("fixtures", "qa/golden/fixtures/GC-001.json: bad")
+        self.assertIn('"results": [', stream.getvalue())
+        with self.assertRaises(ci_report.ErrorBudgetExhausted):
+            reporter.add("coverage", "specs/a/test-cases.md:3: dangling")
+        self.assertEqual(reporter.finish("failed"), 1)
+        results = json.loads(stream.getvalue())["runs"][0]["results"]
+        self.assertEqual([result["ruleId"] for result in results], ["golden-fixtures/fixtures", "golden-fixtures/coverage"])
+        self.assertEqual(results[1]["locations"][0]["physicalLocation"]["region"], {"startLine": 3})
+
+    def test_max_errors_stops_fixture_validation_at_the_budget(self):
+        ci_cache = importlib.import_module("ci_cache")
+        ci_report = importlib.import_module("ci_report")
+        tree_state = importlib.import_module("tree_state")
+        original_cwd = os.getcwd()
+        original_validate = self.module.validate_fixture
+        validated = []
+
+        def counting_validate(path, seen_ids, *args):
+            validated.append(path.name)
+            return original_validate(path, seen_ids, *args)
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            try:
+                os.chdir(temp_dir)
+                self.module.validate_fixture = counting_validate
+                target = pathlib.Path("qa/golden/fixtures")
+                target.mkdir(parents=True)
+                for idx in range(1, 5):
+                    (target / f"GC-00{idx}-broken.json").write_text("{}\n", encoding="utf-8")
+                store = ci_cache.ContentCache("results", pathlib.Path(temp_dir) / "cache")
+                state = tree_state.TreeSkip("check_golden_fixtures", ["qa/golden/fixtures"], [str(MODULE_PATH)], store)
+                stream = io.StringIO()
+                reporter = ci_report.Reporter("golden-fixtures", "jsonl", max_errors=8, stream=stream)
+
+                with self.assertRaises(ci_report.ErrorBudgetExhausted):
+                    self.module.validate_fixtures(
+                        sorted(target.glob("*.json")), state, emit=lambda errors: reporter.extend("fixtures", errors)
+                    )
+                # Each empty fixture yields six findings, so the budget runs out inside the second.
+                self.assertEqual(validated, ["GC-001-broken.json", "GC-002-broken.json"])
+                self.assertEqual(len(stream.getvalue().splitlines()), 8)
+                self.assertTrue(reporter.truncated)
+            finally:
+                self.module.validate_fixture = original_validate
+                os.chdir(original_cwd)
+
+    def test_sarif_log_is_complete_when_the_fixture_root_is_missing(self):
+        original_cwd = os.getcwd()
+        original_argv = sys.argv
+        with tempfile.TemporaryDirectory() as temp_dir:
+            try:
+                os.chdir(temp_dir)
+                sys.argv = ["check_golden_fixtures.py", "--format", "sarif"]
+                with contextlib.redirect_stdout(io.StringIO()) as out, contextlib.redirect_stderr(io.StringIO()):
+                    status = self.module.main()
+            finally:
+                sys.argv = original_argv
+                os.chdir(original_cwd)
+        self.assertEqual(status, 1)
+        results = json.loads(out.getvalue())["runs"][0]["results"]
+        self.assertEqual([result["message"]["text"] for result in results], ["qa/golden/fixtures does not exist"])
+
 
 if __name__ == "__main__":
     unittest.main(verbosity=2)
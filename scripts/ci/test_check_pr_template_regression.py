@@ -1,4 +1,5 @@
 #!/usr/bin/env python3
+import json
 import pathlib
 import re
 import shutil
@@ -62,8 +63,10 @@ Complete this section only when bypassing normal QA gate.
 """
 
 
-def run_checker(body: str | None = None, body_file: pathlib.Path | None = None) -> subprocess.CompletedProcess[str]:
-    command = [sys.executable, str(CHECK_SCRIPT)]
+def run_checker(
+    body: str | None = None, body_file: pathlib.Path | None = None, extra_args: list[str] | None = None
+) -> subprocess.CompletedProcess[str]:
+    command = [sys.executable, str(CHECK_SCRIPT), *(extra_args or [])]
     env = dict(os.environ)
     if body is not None:
         env["PR_BODY"] = body
@@ -76,6 +79,19 @@ def run_checker(body: str | None = None, body_file: pathlib.Path | None = None)
     return subprocess.run(command, cwd=ROOT, text=True, capture_output=True, env=env)
 
 
+BREAK_GLASS_FIELDS = [
+    "Incident ID",
+    "Human approver",
+    "Co-sign approver (Orchestrator or QA)",
+    "Change scope",
+    "Risk assessment",
+    "Rollback plan",
+    "Customer impact",
+    "Temporary mitigation",
+    "RCA due date (<= 48h after merge)",
+]
+
+
 def fill_break_glass_fields(body: str) -> str:
     values = {
         "Incident ID": "INC-2026-0001",
@@ -129,6 +145,14 @@ class CheckPrTemplateRegressionTest(unittest.TestCase):
         self.assertEqual(result.returncode, 1)
         self.assertIn("Summary must include Work Item path", result.stdout)
 
+    def test_work_item_path_must_exist_in_repository(self):
+        missing_body = VALID_PR_BODY.replace(
+            "work-items/WI-0021-pr-template-compliance-gate.md", "work-items/WI-0021-renamed.md"
+        )
+        result = run_checker(body=missing_body)
+        self.assertEqual(result.returncode, 1)
+        self.assertIn("Work Item path does not exist in the repository: work-items/WI-0021-renamed.md", result.stdout)
+
     def test_unchecked_required_checkbox_fails(self):
         invalid_body = VALID_PR_BODY.replace(
             "- [x] QA Spec Gate and Code Gate checks are completed.",
@@ -151,6 +175,102 @@ class CheckPrTemplateRegressionTest(unittest.TestCase):
         self.assertEqual(result.returncode, 0)
         self.assertIn("PR template compliance checks passed.", result.stdout)
 
+    def test_bulk_jsonl_audit_writes_per_pr_results_and_break_glass_stats(self):
+        break_glass_body = VALID_PR_BODY.replace("- [ ] P0 outage", "- [x] P0 outage")
+        records = [
+            {"number": 1, "body": VALID_PR_BODY},
+            {"number": 2, "body": VALID_PR_BODY.replace("- [x] Unit tests", "- [ ] Unit tests")},
+            {"number": 3, "body": break_glass_body},
+            {"number": 4, "body": fill_break_glass_fields(break_glass_body)},
+            {"number": 5, "body": None},
+        ]
+
+        with self.project_temp_dir() as temp_root:
+            jsonl_path = temp_root / "history.jsonl"
+            output_path = temp_root / "results.jsonl"
+            jsonl_path.write_text(
+                "\n".join(json.dumps(record) for record in records) + "\n{not json\n", encoding="utf-8"
+            )
+            result = run_checker(
+                extra_args=["--jsonl", str(jsonl_path), "--output", str(output_path), "--workers", "2"]
+            )
+            results = [json.loads(line) for line in output_path.read_text(encoding="utf-8").splitlines()]
+
+        self.assertEqual(result.returncode, 1)
+        self.assertIn("PR template audit: 6 PRs (passed=2, failed=2, skipped=1, invalid=1)", result.stdout)
+        self.assertIn("Break-glass used: 2 (incomplete fields: 1)", result.stdout)
+        self.assertIn("- trigger P0 outage: 2", result.stdout)
+        self.assertEqual([item["status"] for item in results], ["passed", "failed", "failed", "passed", "skipped", "invalid"])
+        self.assertEqual(results[1]["errors"], ["Unchecked required checkbox: Unit tests (line 21)"])
+        self.assertEqual(results[2]["break_glass_triggers"], ["P0 outage"])
+        self.assertEqual(results[2]["missing_break_glass_fields"], BREAK_GLASS_FIELDS)
+
+    def test_unchecked_and_missing_checkbox_report_location(self):
+        invalid_body = VALID_PR_BODY.replace("- [x] Unit tests", "- [ ] Unit tests").replace(
+            "- [x] Migration smoke\n", ""
+        )
+        result = run_checker(body=invalid_body)
+        self.assertEqual(result.returncode, 1)
+        self.assertIn("Unchecked required checkbox: Unit tests (line 21)", result.stdout)
+        self.assertIn("Unchecked required checkbox: Migration smoke (not found)", result.stdout)
+
+    def test_break_glass_reports_every_empty_field_line(self):
+        invalid_body = VALID_PR_BODY.replace("- [ ] P0 outage", "- [x] P0 outage")
+        result = run_checker(body=invalid_body)
+        self.assertEqual(result.returncode, 1)
+        self.assertIn("Break-glass requires non-empty field: Incident ID (line 36)", result.stdout)
+        self.assertIn("Break-glass requires non-empty field: Rollback plan (line 42)", result.stdout)
+        self.assertEqual(result.stdout.count("Break-glass requires non-empty field"), len(BREAK_GLASS_FIELDS))
+
+    def test_break_glass_fields_are_found_anywhere_on_a_line(self):
+        body = fill_break_glass_fields(VALID_PR_BODY.replace("- [ ] P0 outage", "- [x] P0 outage"))
+        body = (
+            body.replace("- Incident ID:", "**Incident ID**:")
+            .replace("  - Human approver:", "1. Human approver:")
+            .replace("- Change scope:", "> Change scope:")
+            .replace("- Risk assessment:", "- **Risk assessment:**")
+        )
+        result = run_checker(body=body)
+        self.assertEqual(result.returncode, 0, result.stdout)
+
+        # The value is the rest of the same line; emphasis markers alone do not count.
+        empty = body.replace("**Risk assessment:**low", "**Risk assessment:**\nlow")
+        result = run_checker(body=empty)
+        self.assertEqual(result.returncode, 1)
+        self.assertIn("Break-glass requires non-empty field: Risk assessment (line 41)", result.stdout)
+
+    def test_jsonl_format_streams_findings_and_stops_at_max_errors(self):
+        invalid_body = VALID_PR_BODY.replace("- [ ] P0 outage", "- [x] P0 outage")
+        result = run_checker(body=invalid_body, extra_args=["--format", "jsonl", "--max-errors", "3"])
+        self.assertEqual(result.returncode, 1)
+        findings = [json.loads(line) for line in result.stdout.splitlines()]
+        self.assertEqual(len(findings), 3)
+        self.assertEqual({item["rule"] for item in findings}, {"pr-template/body"})
+        self.assertIn("Break-glass requires non-empty field: Incident ID (line 36)", findings[0]["message"])
+        self.assertIn("Stopped after 3 findings (--max-errors 3).", result.stderr)
+
+    def test_bulk_jsonl_audit_reports_findings_through_the_reporter(self):
+        records = [
+            {"number": 1, "body": VALID_PR_BODY},
+            {"number": 2, "body": VALID_PR_BODY.replace("- [x] Unit tests", "- [ ] Unit tests")},
+            {"number": 3, "body": VALID_PR_BODY.replace("- [ ] P0 outage", "- [x] P0 outage")},
+            {"number": 4, "body": VALID_PR_BODY.replace("- [x] Lint/typecheck", "- [ ] Lint/typecheck")},
+        ]
+        with self.project_temp_dir() as temp_root:
+            jsonl_path = temp_root / "history.jsonl"
+            jsonl_path.write_text("\n".join(json.dumps(record) for record in records) + "\n", encoding="utf-8")
+            result = run_checker(
+                extra_args=["--jsonl", str(jsonl_path), "--workers", "1", "--format", "jsonl", "--max-errors", "2"]
+            )
+
+        self.assertEqual(result.returncode, 1)
+        findings = [json.loads(line) for line in result.stdout.splitlines()]
+        self.assertEqual(len(findings), 2)
+        self.assertEqual([(item["path"], item["line"]) for item in findings], [(str(jsonl_path), 2), (str(jsonl_path), 3)])
+        self.assertEqual(findings[0]["message"], "PR #2: Unchecked required checkbox: Unit tests (line 21)")
+        self.assertIn("Stopped after 2 findings (--max-errors 2).", result.stderr)
+        self.assertIn("PR template audit: 3 PRs (passed=1, failed=2, skipped=0, invalid=0)", result.stderr)
+
 
 if __name__ == "__main__":
     unittest.main(verbosity=2)
@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+import importlib
+import importlib.util
+import os
+import pathlib
+import subprocess
+import sys
+import tempfile
+import unittest
+
+
+ROOT = pathlib.Path(__file__).resolve().parents[2]
+MODULE_PATH = ROOT / "scripts" / "ci" / "check_tenant_rls.py"
+
+SCHEMA = """model Organization {
+  id        String     @id
+  employees Employee[]
+}
+
+model Employee {
+  id             String        @id
+  organizationId String?
+  organization   Organization? @relation(fields: [organizationId], references: [id])
+  shifts         Shift[]
+}
+
+model Shift {
+  id         String   @id
+  employeeId String
+  employee   Employee @relation(fields: [employeeId], references: [id])
+}
+
+model Role {
+  id String @id
+}
+"""
+
+BASE_MIGRATION = """
+CREATE TABLE "Organization" ("id" TEXT NOT NULL);
+CREATE TABLE "Employee" ("id" TEXT NOT NULL, "organizationId" TEXT);
+CREATE TABLE "Role" ("id" TEXT NOT NULL);
+ALTER TABLE "Organization" ENABLE ROW LEVEL SECURITY;
+ALTER TABLE "Employee" ENABLE ROW LEVEL SECURITY;
+DROP POLICY IF EXISTS "org_select" ON "Organization";
+CREATE POLICY "org_select" ON "Organization" FOR SELECT USING (true);
+CREATE POLICY "employee_select" ON "Employee" FOR SELECT USING (true);
+"""
+
+SHIFT_MIGRATION = """
+CREATE TABLE IF NOT EXISTS "Shift" (
+    "id" TEXT NOT NULL,
+    "employeeId" TEXT NOT NULL,
+    CONSTRAINT "Shift_employeeId_fkey" FOREIGN KEY ("employeeId") REFERENCES "Employee"("id")
+);
+ALTER TABLE "Shift" ENABLE ROW LEVEL SECURITY;
+DROP POLICY IF EXISTS "employee_select" ON "Employee";
+"""
+
+
+def load_module():
+    spec = importlib.util.spec_from_file_location("check_tenant_rls_module", MODULE_PATH)
+    if spec is None or spec.loader is None:
+        raise RuntimeError("failed to load check_tenant_rls.py")
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+class CheckTenantRlsRegressionTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.module = load_module()
+        cls.migration_ddl = importlib.import_module("migration_ddl")
+        cls.schema = importlib.import_module("prisma_schema").parse_prisma_schema(SCHEMA)
+
+    def scan(self, migration_id: str, sql: str):
+        ddl = self.migration_ddl.scan_migration(migration_id, sql.splitlines(True))
+        ddl.digest = f"digest-{migration_id}"
+        return ddl
+
+    def ownership_refs(self, *tables: str):
+        return [
+            self.module.OwnedTable(path=pathlib.Path("docs/data-ownership.md"), line=idx, token=table)
+            for idx, table in enumerate(tables, start=1)
+        ]
+
+    def test_tenant_owned_models_follow_relation_paths_to_root(self):
+        self.assertEqual(self.module.tenant_owned_models(self.schema), {"Organization", "Employee", "Shift"})
+
+    def test_replay_reports_missing_policies_and_unowned_rls_tables(self):
+        ddl = {
+            "202602150001_base": self.scan("202602150001_base", BASE_MIGRATION),
+            "202602150002_shift": self.scan("202602150002_shift", SHIFT_MIGRATION),
+        }
+        state, replayed = self.module.replay_migrations(ddl, None)
+        self.assertEqual(replayed, 2)
+        self.assertEqual(state.tables["Organization"].policies, ["org_select"])
+
+        errors = self.module.check_rls_coverage(
+            state, self.schema, self.ownership_refs("Organization", "Employee", "Role", "Payslip")
+        )
+        self.assertEqual(
+            errors,
+            [
+                "prisma/schema.prisma:6: tenant-owned model `Employee` has row level security enabled but no "
+                "policies after 202602150002_shift",
+                "prisma/schema.prisma:13: tenant-owned model `Shift` has row level security enabled but no "
+                "policies after 202602150002_shift",
+                "docs/data-ownership.md:4: owned table `Payslip` is not created by any migration",
+                "prisma/migrations/202602150002_shift: RLS-enabled table `Shift` has no owner in "
+                "docs/data-ownership.md",
+            ],
+        )
+
+    def test_replay_resumes_from_checkpoint_and_discards_stale_ones(self):
+        base = {"202602150001_base": self.scan("202602150001_base", BASE_MIGRATION)}
+        checkpoint, _ = self.module.replay_migrations(base, None)
+        checkpoint = self.module.SchemaState.from_dict(checkpoint.to_dict())
+
+        ddl = {**base, "202602150002_shift": self.scan("202602150002_shift", SHIFT_MIGRATION)}
+        state, replayed = self.module.replay_migrations(ddl, checkpoint)
+        self.assertEqual(replayed, 1)
+        self.assertTrue(state.tables["Shift"].rls_enabled)
+        self.assertEqual(state.tables["Employee"].policies, [])
+
+        ddl["202602150001_base"].digest = "edited"
+        stale = self.module.SchemaState.from_dict(state.to_dict())
+        _state, replayed = self.module.replay_migrations(ddl, stale)
+        self.assertEqual(replayed, 2)
+
+    def test_checker_runs_without_pyyaml_and_keys_checkpoints_by_fold_source(self):
+        script = (
+            "import sys\n"
+            "sys.modules['yaml'] = None\n"
+            "sys.argv = ['check_tenant_rls.py']\n"
+            "import check_tenant_rls\n"
+            "print(check_tenant_rls.CHECKPOINT_KEY)\n"
+            "print('check_traceability' in sys.modules)\n"
+            "sys.exit(check_tenant_rls.main())\n"
+        )
+        with tempfile.TemporaryDirectory() as cache_dir:
+            env = {**os.environ, "PYTHONPATH": str(MODULE_PATH.parent), "FLOWHR_CI_CACHE_DIR": cache_dir}
+            result = subprocess.run(
+                [sys.executable, "-c", script], cwd=ROOT, text=True, capture_output=True, env=env
+            )
+        self.assertEqual(result.returncode, 0, result.stdout + result.stderr)
+        key, imported = result.stdout.splitlines()[:2]
+        self.assertEqual(imported, "False")
+        self.assertEqual(key, self.module.CHECKPOINT_KEY)
+        self.assertRegex(key, r"^schema-state-[0-9a-f]{16}$")
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -0,0 +1,358 @@
+#!/usr/bin/env python3
+import importlib
+import importlib.util
+import io
+import json
+import os
+import pathlib
+import shutil
+import sys
+import unittest
+import uuid
+from contextlib import contextmanager, redirect_stderr, redirect_stdout
+
+
+ROOT = pathlib.Path(__file__).resolve().parents[2]
+MODULE_PATH = ROOT / "scripts" / "ci" / "check_traceability.py"
+
+SAMPLE_SCHEMA = """// sample schema
+model Organization {
+  id        String     @id
+  employees Employee[]
+}
+
+model Employee {
+  id             String        @id
+  organizationId String?       @map("organization_id") // tenant key
+  organization   Organization? @relation(fields: [organizationId], references: [id])
+  state          EmployeeState @default(ACTIVE)
+
+  @@map("employees")
+  @@index([organizationId])
+}
+
+enum EmployeeState {
+  ACTIVE
+  LEFT
+}
+"""
+
+SAMPLE_MIGRATION = """-- header comment mentioning CREATE TABLE "Ghost" (
+CREATE TABLE IF NOT EXISTS "Shift" (
+    "id" TEXT NOT NULL,
+    "employeeId" TEXT NOT NULL,
+    "note" TEXT DEFAULT 'ALTER TABLE "Ghost"; ok',
+    CONSTRAINT "Shift_pkey" PRIMARY KEY ("id")
+);
+/* block
+   DROP TABLE "Ghost"; */
+DO $$
+BEGIN
+  IF NOT EXISTS (SELECT 1 FROM pg_constraint WHERE conname = 'Shift_employeeId_fkey') THEN
+    ALTER TABLE "Shift"
+      ADD CONSTRAINT "Shift_employeeId_fkey"
+      FOREIGN KEY ("employeeId") REFERENCES "Employee"("id") ON DELETE RESTRICT ON UPDATE CASCADE;
+  END IF;
+END $$;
+ALTER TABLE "Shift" ADD COLUMN IF NOT EXISTS "organizationId" TEXT;
+ALTER TABLE "Shift" ENABLE ROW LEVEL SECURITY;
+CREATE INDEX IF NOT EXISTS "Shift_employeeId_idx" ON "Shift"("employeeId");
+CREATE POLICY "flowhr_shift_update" ON "Shift" FOR UPDATE USING (true);
+UPDATE "PayrollRun" pr SET "organizationId" = NULL;
+"""
+
+
+def load_module():
+    spec = importlib.util.spec_from_file_location("check_traceability_module", MODULE_PATH)
+    if spec is None or spec.loader is None:
+        raise RuntimeError("failed to load check_traceability.py")
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+class CheckTraceabilityRegressionTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.module = load_module()
+        cls.prisma_schema = importlib.import_module("prisma_schema")
+        cls.ci_cache = importlib.import_module("ci_cache")
+        cls.migration_ddl = importlib.import_module("migration_ddl")
+
+    def setUp(self):
+        self.tables = self.module.RefTables()
+
+    @contextmanager
+    def project_temp_dir(self):
+        temp_root = ROOT / ".tmp-traceability-tests" / uuid.uuid4().hex
+        temp_root.mkdir(parents=True, exist_ok=True)
+        try:
+            yield temp_root
+        finally:
+            shutil.rmtree(temp_root, ignore_errors=True)
+
+    def make_ref(self, token: str, source: str = "work-item table", line: int = 1):
+        return self.tables.ref(
+            path=pathlib.Path("work-items/WI-9999-test.md"), line=line, token=token, source=source
+        )
+
+    def test_token_refs_intern_paths_sources_and_tokens(self):
+        first = self.make_ref("PayrollRun", line=3)
+        second = self.make_ref("PayrollRun", line=7)
+
+        self.assertEqual(first.token_id, second.token_id)
+        self.assertEqual(first.path_id, second.path_id)
+        self.assertEqual(first.source_id, second.source_id)
+        self.assertEqual(second.token, "PayrollRun")
+        self.assertEqual(second.path, pathlib.Path("work-items/WI-9999-test.md"))
+        self.assertFalse(hasattr(first, "__dict__"))
+
+    def test_each_run_interns_into_its_own_tables(self):
+        self.make_ref("PayrollRun")
+        other = self.module.RefTables()
+        ref = other.ref(path=pathlib.Path("work-items/WI-0001-a.md"), line=1, token="Employee", source="x")
+
+        self.assertEqual((ref.path_id, ref.token_id, ref.source_id), (0, 0, 0))
+        self.assertEqual(ref.token, "Employee")
+        self.assertEqual(len(other.tokens), 1)
+        self.assertNotIn("Employee", [self.tables.tokens.value(i) for i in range(len(self.tables.tokens))])
+
+    def test_validate_table_refs_reports_unknown_models(self):
+        errors = self.module.validate_table_refs(
+            [self.make_ref("PayrollRun"), self.make_ref("Payroll", line=4)], {"PayrollRun", "Employee"}, self.tables
+        )
+        self.assertEqual(
+            errors,
+            [
+                "work-items/WI-9999-test.md:4: work-item table `Payroll` is not a Prisma model in prisma/schema.prisma"
+            ],
+        )
+
+    def test_validate_migration_refs_checks_format_and_existence(self):
+        refs = [
+            self.make_ref("202602150003_scheduling_baseline", source="work-item migration"),
+            self.make_ref("scheduling_baseline", source="work-item migration", line=2),
+            self.make_ref("209901010001_missing", source="work-item migration", line=3),
+        ]
+        errors = self.module.validate_migration_refs(refs, {"202602150003_scheduling_baseline"}, self.tables)
+        self.assertEqual(len(errors), 2)
+        self.assertIn(":2: work-item migration `scheduling_baseline` must match migration id format", errors[0])
+        self.assertIn(":3: work-item migration `209901010001_missing` not found", errors[1])
+
+    def test_validate_migration_cross_reference_uses_sorted_token_sets(self):
+        contract_refs = [self.make_ref("202602150002_b", source="contract migration")]
+        work_item_refs = [self.make_ref("202602150001_a", source="work-item migration")]
+        errors = self.module.validate_migration_cross_reference(
+            contract_refs, work_item_refs, {"202602150001_a", "202602150002_b", "202602150003_c"}, self.tables
+        )
+        self.assertEqual(
+            errors,
+            [
+                "Migration IDs referenced in contracts but missing in work-items: 202602150002_b",
+                "Migration IDs referenced in work-items but missing in contracts: 202602150001_a",
+                "Migration directories not referenced by contracts/work-items: 202602150003_c",
+            ],
+        )
+
+    def test_validate_runtime_event_coverage_reports_missing_events(self):
+        contract_refs = [self.make_ref("payroll.calculated.v1", source="contract published event")]
+        errors = self.module.validate_runtime_event_coverage(
+            {"payroll.calculated.v1", "payroll.confirmed.v1"}, contract_refs, contract_refs, self.tables
+        )
+        self.assertEqual(len(errors), 2)
+        self.assertTrue(all(err.endswith("payroll.confirmed.v1") for err in errors))
+
+    def test_prisma_schema_index_tracks_fields_relations_enums_and_spans(self):
+        index = self.prisma_schema.parse_prisma_schema(SAMPLE_SCHEMA)
+
+        employee = index.models["Employee"]
+        self.assertEqual((employee.start_line, employee.end_line), (7, 15))
+        self.assertEqual(employee.table, "employees")
+        self.assertEqual(index.tables["employees"], "Employee")
+        self.assertEqual(employee.fields["organizationId"].column, "organization_id")
+        self.assertTrue(employee.fields["organizationId"].optional)
+        self.assertEqual(employee.fields["organization"].relation.target, "Organization")
+        self.assertEqual(employee.fields["organization"].relation.fields, ["organizationId"])
+        self.assertIsNone(employee.fields["state"].relation)
+        self.assertTrue(index.models["Organization"].fields["employees"].is_list)
+        self.assertEqual(index.enums["EmployeeState"].values, ["ACTIVE", "LEFT"])
+
+    def test_load_prisma_schema_reuses_content_hash_cache(self):
+        prisma_schema, ci_cache = self.prisma_schema, self.ci_cache
+        with self.project_temp_dir() as temp_root:
+            schema_path = temp_root / "schema.prisma"
+            schema_path.write_text(SAMPLE_SCHEMA, encoding="utf-8")
+            first = prisma_schema.load_prisma_schema(schema_path, ci_cache.ContentCache("prisma", temp_root))
+            self.assertEqual(len(list((temp_root / "prisma").glob("*.json"))), 1)
+
+            second = prisma_schema.load_prisma_schema(schema_path, ci_cache.ContentCache("prisma", temp_root))
+            self.assertEqual(first, second)
+
+    def test_validate_field_refs_checks_model_and_field(self):
+        index = self.prisma_schema.parse_prisma_schema(SAMPLE_SCHEMA)
+        refs = [
+            self.make_ref("Employee.organizationId", source="db.md field"),
+            self.make_ref("Employee.orgId", source="db.md field", line=2),
+            self.make_ref("Manager.id", source="db.md field", line=3),
+        ]
+        errors = self.module.validate_field_refs(refs, index)
+        self.assertEqual(len(errors), 2)
+        self.assertIn(":2: db.md field `Employee.orgId` is not a field of Prisma model `Employee`", errors[0])
+        self.assertIn(":3: db.md field `Manager.id` references unknown Prisma model `Manager`", errors[1])
+
+    def test_migration_ddl_scanner_streams_through_do_blocks_and_comments(self):
+        index = self.migration_ddl.scan_migration("202602160001_shift", iter(SAMPLE_MIGRATION.splitlines(True)))
+
+        self.assertEqual(index.touched_tables(), ["Employee", "PayrollRun", "Shift"])
+        shift = index.tables["Shift"]
+        self.assertTrue(shift.created and shift.altered and shift.rls_enabled)
+        self.assertEqual(shift.columns, ["id", "employeeId", "note", "organizationId"])
+        self.assertEqual(
+            [(fk.columns, fk.references) for fk in shift.foreign_keys], [(["employeeId"], "Employee")]
+        )
+        self.assertEqual(shift.indexes, ["Shift_employeeId_idx"])
+        self.assertEqual(shift.policies, ["flowhr_shift_update"])
+        self.assertTrue(index.tables["Employee"].referenced)
+        self.assertNotIn("Ghost", index.tables)
+        self.assertNotIn("CASCADE", index.tables)
+
+    def test_migration_ddl_keeps_dollar_quoted_bodies_in_one_statement(self):
+        sql = (
+            "DO $$ BEGIN\n"
+            "  ALTER TABLE \"Shift\" ENABLE ROW LEVEL SECURITY;\n"
+            "  CREATE POLICY \"shift_select\" ON \"Shift\" FOR SELECT USING (true);\n"
+            "END $$;\n"
+            "CREATE FUNCTION touch() RETURNS trigger AS $fn$\n"
+            "BEGIN NEW.note := 'a;b'; PERFORM $$x;y$$; RETURN NEW; END;\n"
+            "$fn$ LANGUAGE plpgsql;\n"
+            "ALTER TABLE \"Shift\" ADD COLUMN \"note\" TEXT;\n"
+        )
+        statements = list(self.migration_ddl.iter_statements(sql.splitlines(True)))
+        self.assertEqual(len(statements), 3)
+        self.assertTrue(statements[0].startswith("DO") and statements[0].endswith("END"))
+        self.assertIn("LANGUAGE plpgsql", statements[1])
+
+        shift = self.migration_ddl.scan_migration("202602160002_rls", sql.splitlines(True)).tables["Shift"]
+        self.assertTrue(shift.rls_enabled)
+        self.assertEqual(shift.policies, ["shift_select"])
+        self.assertEqual(shift.columns, ["note"])
+
+    def test_load_migration_ddl_caches_by_content_hash(self):
+        with self.project_temp_dir() as temp_root:
+            migration_dir = temp_root / "migrations" / "202602160001_shift"
+            migration_dir.mkdir(parents=True)
+            (migration_dir / "migration.sql").write_text(SAMPLE_MIGRATION, encoding="utf-8")
+            cache = self.ci_cache.ContentCache("migration-ddl", temp_root / "cache")
+
+            first = self.migration_ddl.load_migration_ddl(temp_root / "migrations", cache)
+            original_scan = self.migration_ddl.scan_migration
+            try:
+                self.migration_ddl.scan_migration = None
+                second = self.migration_ddl.load_migration_ddl(
+                    temp_root / "migrations", self.ci_cache.ContentCache("migration-ddl", temp_root / "cache")
+                )
+            finally:
+                self.migration_ddl.scan_migration = original_scan
+            self.assertEqual(first, second)
+
+    def test_validate_work_item_migration_tables_requires_cited_ddl(self):
+        ddl = {
+            "202602160001_shift": self.migration_ddl.scan_migration(
+                "202602160001_shift", SAMPLE_MIGRATION.splitlines(True)
+            )
+        }
+        schema = self.prisma_schema.parse_prisma_schema(SAMPLE_SCHEMA)
+        migration_refs = [self.make_ref("202602160001_shift", source="work-item migration", line=9)]
+        table_refs = [
+            self.make_ref("Shift", line=5),
+            self.make_ref("Employee", line=6),
+            self.make_ref("LeaveRequest", line=7),
+        ]
+        errors = self.module.validate_work_item_migration_tables(table_refs, migration_refs, ddl, schema)
+        self.assertEqual(
+            errors,
+            [
+                "work-items/WI-9999-test.md:6: work-item table `Employee` is not created, altered or referenced "
+                "by cited migrations (202602160001_shift)",
+                "work-items/WI-9999-test.md:7: work-item table `LeaveRequest` is not created, altered or referenced "
+                "by cited migrations (202602160001_shift)",
+            ],
+        )
+
+
+    def test_cached_pass_still_writes_a_complete_sarif_log(self):
+        original_run_checks = self.module.run_checks
+        original_argv = sys.argv
+        try:
+            self.module.run_checks = lambda reporter: True
+            sys.argv = ["check_traceability.py", "--format", "sarif"]
+            with redirect_stdout(io.StringIO()) as out, redirect_stderr(io.StringIO()):
+                status = self.module.main()
+        finally:
+            self.module.run_checks = original_run_checks
+            sys.argv = original_argv
+        self.assertEqual(status, 0)
+        log = json.loads(out.getvalue())
+        self.assertEqual(log["runs"][0]["results"], [])
+
+    def test_fuzzed_work_items_match_the_reference_section_scan(self):
+        fuzz_checkers = importlib.import_module("fuzz_checkers")
+        [report] = fuzz_checkers.run_targets(["work-item"], ROOT, seed=0, cases=300)
+        self.assertEqual(report.cases, 300)
+        self.assertEqual(report.failures, 0, report.mismatches)
+
+    def test_doc_path_refs_resolve_against_repo_listing(self):
+        repo_paths = importlib.import_module("repo_paths")
+        with self.project_temp_dir() as temp_root:
+            (temp_root / "specs" / "payroll").mkdir(parents=True)
+            (temp_root / "specs" / "common").mkdir(parents=True)
+            (temp_root / "specs" / "common" / "rules.md").write_text("# Rules\n", encoding="utf-8")
+            (temp_root / "specs" / "payroll" / "rfc.md").write_text(
+                "Rounding follows `specs/common/rules.md#rounding`.\n"
+                "Run `scripts/ci/check.py --base <sha>` and see `src/app.ts:42`.\n"
+                "Fixtures live in `qa/golden/*.json`; events like `payroll.confirmed` are not paths.\n"
+                "Stale: `specs/payroll/old.md` and `adr/ADR-*.md`.\n",
+                encoding="utf-8",
+            )
+            listing = repo_paths.RepoPaths(
+                frozenset(
+                    {
+                        "specs/payroll/rfc.md",
+                        "specs/common/rules.md",
+                        "scripts/ci/check.py",
+                        "src/app.ts",
+                        "qa/golden/GC-001.json",
+                        "adr/index.txt",
+                    }
+                ),
+                "test listing",
+            )
+            original_cwd = os.getcwd()
+            try:
+                os.chdir(temp_root)
+                refs = self.module.parse_doc_path_refs(listing, self.module.RefTables())
+            finally:
+                os.chdir(original_cwd)
+
+        self.assertEqual(
+            [ref.token for ref in refs],
+            [
+                "specs/common/rules.md",
+                "scripts/ci/check.py",
+                "src/app.ts",
+                "qa/golden/*.json",
+                "specs/payroll/old.md",
+                "adr/ADR-*.md",
+            ],
+        )
+        self.assertEqual(
+            self.module.validate_path_refs(refs, listing),
+            [
+                "specs/payroll/rfc.md:4: doc path `specs/payroll/old.md` does not exist (test listing)",
+                "specs/payroll/rfc.md:4: doc path `adr/ADR-*.md` does not exist (test listing)",
+            ],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -0,0 +1,106 @@
+import pathlib
+import subprocess
+from typing import Any, Dict, Iterable, List, Optional
+
+from ci_cache import ContentCache, content_hash
+
+
+def git_lines(args: List[str], cwd: Optional[str] = None) -> Optional[str]:
+    proc = subprocess.run(
+        args,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+        text=True,
+        encoding="utf-8",
+        cwd=cwd,
+    )
+    return proc.stdout if proc.returncode == 0 else None
+
+
+def read_tree_snapshot(roots: List[str], rev: str = "HEAD", cwd: Optional[str] = None) -> Optional[Dict[str, str]]:
+    # One `git ls-tree` call returns the OID of every tree and blob below the roots,
+    # so a subtree comparison is a dict lookup rather than a directory walk.
+    out = git_lines(["git", "ls-tree", "-r", "-t", "-z", rev, "--", *roots], cwd=cwd)
+    if out is None:
+        return None
+
+    snapshot: Dict[str, str] = {}
+    for entry in out.split("\0"):
+        if not entry:
+            continue
+        meta, _tab, path = entry.partition("\t")
+        parts = meta.split(" ")
+        if len(parts) == 3:
+            snapshot[path] = parts[2]
+    return snapshot
+
+
+def worktree_is_clean(roots: List[str], cwd: Optional[str] = None) -> bool:
+    # Checkers read the working tree, so tree OIDs only describe their inputs when
+    # nothing under the roots is modified or untracked.
+    out = git_lines(["git", "status", "--porcelain", "--untracked-files=all", "--", *roots], cwd=cwd)
+    return out is not None and not out.strip()
+
+
+def source_fingerprint(paths: Iterable[str]) -> str:
+    contents = []
+    for path in sorted(paths):
+        try:
+            contents.append(pathlib.Path(path).read_text(encoding="utf-8"))
+        except OSError:
+            contents.append(f"missing:{path}")
+    return content_hash(*contents)
+
+
+class TreeSkip:
+    def __init__(
+        self,
+        name: str,
+        roots: List[str],
+        sources: Iterable[str],
+        store: Optional[ContentCache] = None,
+        cwd: Optional[str] = None,
+    ) -> None:
+        self.name = name
+        self.roots = roots
+        self.store = store if store is not None else ContentCache("results")
+        # Keyed by checker sources so editing a checker invalidates its last pass.
+        self.key = content_hash(name, source_fingerprint(sources))
+        self.snapshot: Optional[Dict[str, str]] = None
+        self.previous: Optional[Dict[str, Any]] = None
+
+        if self.store.directory is None or not worktree_is_clean(roots, cwd=cwd):
+            return
+        self.snapshot = read_tree_snapshot(roots, cwd=cwd)
+        if self.snapshot is None:
+            return
+        previous = self.store.get(self.key)
+        if isinstance(previous, dict) and isinstance(previous.get("oids"), dict):
+            self.previous = previous
+
+    def root_oids(self) -> str:
+        if self.snapshot is None:
+            return ""
+        return ", ".join(f"{root}@{self.snapshot.get(root, 'missing')[:7]}" for root in self.roots)
+
+    def unchanged(self) -> bool:
+        if self.snapshot is None or self.previous is None:
+            return False
+        oids = self.previous["oids"]
+        return all(self.snapshot.get(root) == oids.get(root) for root in self.roots)
+
+    def changed(self, path: str) -> bool:
+        if self.snapshot is None or self.previous is None:
+            return True
+        current = self.snapshot.get(path)
+        return current is None or current != self.previous["oids"].get(path)
+
+    def recorded(self, field: str) -> Dict[str, Any]:
+        if self.previous is None or not isinstance(self.previous.get(field), dict):
+            return {}
+        return self.previous[field]
+
+    def record_pass(self, **extra: Any) -> None:
+        if self.snapshot is None:
+            return
+        self.store.put(self.key, {"oids": self.snapshot, **extra})
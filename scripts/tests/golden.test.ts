@@ -70,9 +70,11 @@ const fixtureDir = path.resolve(process.cwd(), "qa", "golden", "fixtures");
 const files = fs.readdirSync(fixtureDir).filter((name) => name.endsWith(".json"));
 assert.ok(files.length > 0, "golden fixtures should exist");
 
+let payrollFixtureCount = 0;
 for (const file of files) {
   const payload = JSON.parse(fs.readFileSync(path.join(fixtureDir, file), "utf8")) as {
     id: string;
+    kind?: string;
     inputs: AnyObject;
     expected: {
       payable_minutes: Record<string, number>;
@@ -88,6 +90,12 @@ for (const file of files) {
     };
   };
 
+  // Other fixture kinds (e.g. leave_accrual) are verified by scripts/ci/check_golden_fixtures.py.
+  if ((payload.kind ?? "attendance_payroll") !== "attendance_payroll") {
+    continue;
+  }
+  payrollFixtureCount += 1;
+
   const input = resolveInput(payload.inputs);
   const split = derivePayableMinutes(
     input.checkInAt,
@@ -121,4 +129,4 @@ for (const file of files) {
   }
 }
 
-console.log(`golden.test passed (${files.length} fixtures)`);
+console.log(`golden.test passed (${payrollFixtureCount} payroll fixtures)`);